@@ -1,16 +1,40 @@
 """Content Core — Extract and summarize content from any source."""
+from importlib import import_module
+
 from dotenv import load_dotenv
 
 load_dotenv()
 
-from content_core.config import ContentCoreConfig
-from content_core.content.summary import summarize
-from content_core.extraction import check_file_support, extract_content
 from content_core.logging import configure_logging
-from content_core.common.state import ExtractionInput, ExtractionOutput, FileSupport
 
-# Convenience alias
-extract = extract_content
+# Public names are imported on first access (PEP 562), so importing a single
+# submodule such as content_core.config or content_core.cli does not load the
+# whole extraction stack.
+_EXPORTS = {
+    "extract_content": ("content_core.extraction", "extract_content"),
+    "extract": ("content_core.extraction", "extract_content"),  # Convenience alias
+    "check_file_support": ("content_core.extraction", "check_file_support"),
+    "summarize": ("content_core.content.summary", "summarize"),
+    "ContentCoreConfig": ("content_core.config", "ContentCoreConfig"),
+    "ExtractionInput": ("content_core.common.state", "ExtractionInput"),
+    "ExtractionOutput": ("content_core.common.state", "ExtractionOutput"),
+    "FileSupport": ("content_core.common.state", "FileSupport"),
+}
+
+
+def __getattr__(name):
+    try:
+        module, attr = _EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(import_module(module), attr)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_EXPORTS))
+
 
 # Configure default logging
 configure_logging(debug=False)
@@ -6,10 +6,24 @@ import click
 
 from content_core.logging import configure_logging
 
+# Accepted --engine values (mirrors common.types, kept here so the CLI does not
+# import it at startup)
+VALID_URL_ENGINES = frozenset({"auto", "simple", "firecrawl", "jina", "crawl4ai"})
+VALID_DOC_ENGINES = frozenset({"auto", "simple", "docling"})
 
-def _get_version():
-    from importlib.metadata import version
-    return version("content-core")
+
+def _run(coro):
+    """Run a coroutine in a fresh event loop, closing shared HTTP clients before the loop ends."""
+
+    async def main():
+        from content_core.processors.url.youtube import close_client
+
+        try:
+            return await coro
+        finally:
+            await close_client()
+
+    return asyncio.run(main())
 
 
 @click.group()
@@ -57,7 +71,7 @@ def extract(source, fmt, engine, formulas, pictures, no_ocr):
 
     inp = _build_input(source)
     config = _build_config(inp, engine, formulas=formulas, pictures=pictures, no_ocr=no_ocr)
-    result = asyncio.run(extract_content(url=inp.url, file_path=inp.file_path, content=inp.content, config=config))
+    result = _run(extract_content(url=inp.url, file_path=inp.file_path, content=inp.content, config=config))
 
     if fmt == "json":
         click.echo(result.model_dump_json(indent=2))
@@ -74,7 +88,7 @@ def summarize(content, context):
 
     content = _get_content(content)
     # If content looks like a URL or file, extract first
-    content = asyncio.run(_maybe_extract(content))
+    content = _run(_maybe_extract(content))
     try:
         result = asyncio.run(summarize_fn(content, context))
     except Exception as e:
@@ -117,9 +131,12 @@ def config():
       summary_model        Override LLM model for summarization
       url_engine           URL extraction engine (auto, simple, firecrawl, jina, crawl4ai)
       youtube_languages    Transcript languages, comma-separated (default: en,es,pt)
+      youtube_cache        Reuse titles/transcripts of videos already extracted (default: true)
       docling_formulas     Enable formula extraction (default: false)
+      docling_max_file_mb  Auto engine skips docling for larger files (default: 0, no limit)
       docling_ocr          Enable OCR for scanned PDFs (default: true)
       docling_vision       Enable image description + chart extraction (default: false)
+      extraction_cache     Reuse results for identical files in this process (default: false)
     """
     pass
 
@@ -206,9 +223,6 @@ def _build_config(inp, engine, formulas=False, pictures=False, no_ocr=False):
 
     from content_core.config import ContentCoreConfig
 
-    VALID_URL_ENGINES = {"auto", "simple", "firecrawl", "jina", "crawl4ai"}
-    VALID_DOC_ENGINES = {"auto", "simple", "docling"}
-
     kwargs = {**docling_overrides}
     if engine:
         if inp.file_path:
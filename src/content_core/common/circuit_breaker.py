@@ -0,0 +1,111 @@
+"""
+Circuit breakers for the optional URL extraction engines.
+
+In the ``auto`` URL engine chain every extraction tries the API engines
+(Firecrawl, Jina) before falling back to local ones. When an engine is down,
+each URL would otherwise pay for a full retry cycle before falling through.
+After repeated consecutive transient failures (errors specific to one URL,
+such as a 4xx or an unparseable page, are not counted) the engine's breaker
+opens and the chain skips it for a cooldown window; once the window elapses a
+single probe call is let through, and its outcome closes or re-opens the
+breaker.
+
+Usage:
+    from content_core.common.circuit_breaker import engine_breaker
+    from content_core.common.retry import is_retryable_exception
+
+    breaker = engine_breaker("jina")
+    if breaker.allow():
+        try:
+            result = await extract_url_jina(url)
+        except Exception as e:
+            if is_retryable_exception(e):
+                breaker.record_failure()
+            raise
+        breaker.record_success()
+"""
+
+import time
+
+# Consecutive failures after which an engine is skipped
+CIRCUIT_FAILURE_THRESHOLD = 5
+
+# Seconds an open breaker waits before letting a probe call through
+CIRCUIT_RESET_SECONDS = 60.0
+
+
+class CircuitBreaker:
+    """Closed/open/half-open breaker counting consecutive failures."""
+
+    def __init__(
+        self,
+        failure_threshold: int = CIRCUIT_FAILURE_THRESHOLD,
+        reset_seconds: float = CIRCUIT_RESET_SECONDS,
+    ):
+        self.failure_threshold = failure_threshold
+        self.reset_seconds = reset_seconds
+        self.failures = 0
+        self.opened_at: float | None = None
+
+    @property
+    def is_open(self) -> bool:
+        return self.opened_at is not None
+
+    def allow(self) -> bool:
+        """
+        Return whether a call may go through.
+
+        While open, calls are refused until the cooldown elapses; then one
+        probe call is allowed and the cooldown restarts, so concurrent callers
+        keep skipping the engine until the probe reports back.
+        """
+        if self.opened_at is None:
+            return True
+        now = time.monotonic()
+        if now - self.opened_at >= self.reset_seconds:
+            self.opened_at = now
+            return True
+        return False
+
+    def record_success(self) -> None:
+        self.failures = 0
+        self.opened_at = None
+
+    def record_failure(self) -> None:
+        self.failures += 1
+        if self.failures >= self.failure_threshold:
+            self.opened_at = time.monotonic()
+
+
+# Breakers hold no asyncio primitives, so one set is shared by all event loops
+_engine_breakers: dict[str, CircuitBreaker] = {}
+
+
+def engine_breaker(engine: str) -> CircuitBreaker:
+    """
+    Get the circuit breaker for a URL extraction engine.
+
+    Args:
+        engine: Engine name (e.g. "firecrawl", "jina")
+
+    Returns:
+        Breaker shared by all extractions using that engine in this process
+    """
+    breaker = _engine_breakers.get(engine)
+    if breaker is None:
+        breaker = _engine_breakers[engine] = CircuitBreaker()
+    return breaker
+
+
+def reset_engine_breakers() -> None:
+    """Close all engine breakers (useful for testing)."""
+    _engine_breakers.clear()
+
+
+__all__ = [
+    "CIRCUIT_FAILURE_THRESHOLD",
+    "CIRCUIT_RESET_SECONDS",
+    "CircuitBreaker",
+    "engine_breaker",
+    "reset_engine_breakers",
+]
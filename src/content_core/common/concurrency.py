@@ -0,0 +1,57 @@
+"""
+Per-host concurrency limits for outbound HTTP requests.
+
+Bounds how many requests run at once against a single host, so a large batch
+of extractions queues up instead of opening thousands of simultaneous
+connections (file descriptor exhaustion, DNS/TLS thrash, timeout cascades).
+
+Usage:
+    from content_core.common.concurrency import host_semaphore
+
+    async with host_semaphore(url):
+        async with session.get(url) as response:
+            ...
+"""
+
+import asyncio
+import weakref
+from urllib.parse import urlsplit
+
+# Maximum concurrent requests to a single host
+MAX_REQUESTS_PER_HOST = 8
+
+# asyncio primitives belong to one event loop, so semaphores are kept per loop
+# (callers such as the CLI run each extraction in a fresh loop via asyncio.run)
+_host_semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[str, asyncio.Semaphore]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def host_semaphore(url: str) -> asyncio.Semaphore:
+    """
+    Get the semaphore limiting concurrent requests to the host of a URL.
+
+    Must be called from within a running event loop.
+
+    Args:
+        url: URL about to be requested
+
+    Returns:
+        Semaphore shared by all requests to the same host in this event loop
+    """
+    loop = asyncio.get_running_loop()
+    semaphores = _host_semaphores.get(loop)
+    if semaphores is None:
+        semaphores = _host_semaphores[loop] = {}
+
+    host = urlsplit(url).netloc.lower()
+    semaphore = semaphores.get(host)
+    if semaphore is None:
+        semaphore = semaphores[host] = asyncio.Semaphore(MAX_REQUESTS_PER_HOST)
+    return semaphore
+
+
+__all__ = [
+    "MAX_REQUESTS_PER_HOST",
+    "host_semaphore",
+]
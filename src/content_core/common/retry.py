@@ -18,9 +18,11 @@ Usage:
         ...
 """
 
+import re
 from typing import Callable, Optional
 
 import aiohttp
+import httpx
 from tenacity import (
     RetryError,
     retry,
@@ -67,6 +69,17 @@ NON_RETRYABLE_EXCEPTIONS = (
     AttributeError,
 )
 
+# Exceptions that indicate a transient network failure
+RETRYABLE_NETWORK_EXCEPTIONS = (aiohttp.ClientError, ConnectionError, TimeoutError, OSError)
+
+# Message fragments that mark a generic exception as transient, matched in one
+# pass by a regex compiled once instead of a substring scan per fragment
+TRANSIENT_MESSAGE_INDICATORS = (
+    "timeout", "timed out", "connection", "network", "temporary",
+    "unavailable", "rate limit", "too many requests", "503", "502", "500"
+)
+_TRANSIENT_MESSAGE_RE = re.compile("|".join(map(re.escape, TRANSIENT_MESSAGE_INDICATORS)))
+
 
 def is_retryable_exception(exception: BaseException) -> bool:
     """
@@ -79,7 +92,7 @@ def is_retryable_exception(exception: BaseException) -> bool:
         return False
 
     # Always retry network-related errors
-    if isinstance(exception, (aiohttp.ClientError, ConnectionError, TimeoutError, OSError)):
+    if isinstance(exception, RETRYABLE_NETWORK_EXCEPTIONS):
         # But not if it's a client error (4xx) - those are usually permanent
         if isinstance(exception, aiohttp.ClientResponseError):
             status = exception.status
@@ -87,13 +100,15 @@ def is_retryable_exception(exception: BaseException) -> bool:
             return status >= 500 or status == 429
         return True
 
+    # Same rules for httpx clients
+    if isinstance(exception, httpx.TransportError):
+        return True
+    if isinstance(exception, httpx.HTTPStatusError):
+        status = exception.response.status_code
+        return status >= 500 or status == 429
+
     # For generic exceptions, check if they look like transient errors
-    exc_msg = str(exception).lower()
-    transient_indicators = [
-        "timeout", "timed out", "connection", "network", "temporary",
-        "unavailable", "rate limit", "too many requests", "503", "502", "500"
-    ]
-    return any(indicator in exc_msg for indicator in transient_indicators)
+    return _TRANSIENT_MESSAGE_RE.search(str(exception).lower()) is not None
 
 
 def log_retry_attempt(retry_state) -> None:
@@ -211,7 +226,7 @@ def retry_url_network(
     max_delay: Optional[float] = None,
 ) -> Callable:
     """
-    Retry decorator for network-only URL operations (BeautifulSoup, HEAD requests).
+    Retry decorator for network-only URL operations (BeautifulSoup, MIME probes).
 
     Uses shorter delays as these are typically network-only issues.
 
@@ -30,13 +30,7 @@ class TomlFileSettingsSource(PydanticBaseSettingsSource):
         return None, field_name, False
 
     def _load_toml(self) -> dict:
-        if not CONFIG_FILE.exists():
-            return {}
-        try:
-            with open(CONFIG_FILE, "rb") as f:
-                return tomllib.load(f)
-        except Exception:
-            return {}
+        return _read_config_file()
 
     def __call__(self) -> dict[str, Any]:
         return self._load_toml()
@@ -81,12 +75,17 @@ class ContentCoreConfig(BaseSettings):
 
     # YouTube
     youtube_languages: list[str] = Field(default=["en", "es", "pt"])
+    youtube_cache: bool = True
 
     # Docling
     docling_output_format: str = "markdown"
     docling_ocr: bool = True
     docling_formulas: bool = False
     docling_vision: bool = False
+    docling_max_file_mb: int = Field(default=0, ge=0)  # 0 = no limit
+
+    # Extraction cache
+    extraction_cache: bool = False
 
     @classmethod
     def settings_customise_sources(
@@ -126,15 +125,29 @@ def reset_default_config() -> None:
 # Config file management (used by CLI `config` subcommands)
 # ---------------------------------------------------------------------------
 
+# Last parsed config file, keyed by (path, mtime_ns, size) so every
+# ContentCoreConfig() built in a long-running process (e.g. the MCP server)
+# costs a stat instead of a re-parse while the file is unchanged
+_config_file_cache: Optional[Tuple[tuple, dict]] = None
+
+
 def _read_config_file() -> dict:
     """Read the config file, returning empty dict if missing."""
-    if not CONFIG_FILE.exists():
+    global _config_file_cache
+    try:
+        stat = CONFIG_FILE.stat()
+    except OSError:
         return {}
+    key = (str(CONFIG_FILE), stat.st_mtime_ns, stat.st_size)
+    if _config_file_cache is not None and _config_file_cache[0] == key:
+        return dict(_config_file_cache[1])
     try:
         with open(CONFIG_FILE, "rb") as f:
-            return tomllib.load(f)
+            data = tomllib.load(f)
     except Exception:
         return {}
+    _config_file_cache = (key, data)
+    return dict(data)
 
 
 def _escape_toml_string(s: str) -> str:
@@ -144,6 +157,8 @@ def _escape_toml_string(s: str) -> str:
 
 def _write_config_file(data: dict) -> None:
     """Write config data to the TOML file."""
+    global _config_file_cache
+    _config_file_cache = None
     CONFIG_DIR.mkdir(parents=True, exist_ok=True)
     lines = []
     for key, value in sorted(data.items()):
@@ -159,6 +174,11 @@ def _write_config_file(data: dict) -> None:
     CONFIG_FILE.write_text("\n".join(lines) + "\n" if lines else "")
 
 
+# Strings config_set stores as True for bool fields -- the same spellings
+# pydantic accepts as true when the value comes from a CCORE_ env var
+_TRUE_STRINGS = frozenset({"1", "on", "t", "true", "y", "yes"})
+
+
 def config_set(key: str, value: str) -> None:
     """Set a config value in the file."""
     # Validate key exists in ContentCoreConfig
@@ -174,7 +194,7 @@ def config_set(key: str, value: str) -> None:
     if annotation is int or (hasattr(annotation, "__origin__") and annotation is int):
         data[key] = int(value)
     elif annotation is bool:
-        data[key] = value.lower() in ("true", "1", "yes")
+        data[key] = value.strip().lower() in _TRUE_STRINGS
     elif hasattr(annotation, "__origin__") and getattr(annotation, "__origin__", None) is list:
         data[key] = [v.strip() for v in value.split(",")]
     else:
@@ -29,6 +29,11 @@ class FileDetector:
         """Initialize the FileDetector with signature mappings."""
         self.binary_signatures = self._load_binary_signatures()
         self.text_patterns = self._load_text_patterns()
+        # Lower-cased once here rather than on every detection
+        self._text_patterns_lower = [
+            (pattern.lower(), mime_type) for pattern, mime_type in self.text_patterns.items()
+        ]
+        self._text_pattern_max_len = max(map(len, self.text_patterns), default=0)
         self.extension_mapping = self._load_extension_mapping()
         self.zip_content_patterns = self._load_zip_content_patterns()
     
@@ -193,19 +198,19 @@ class FileDetector:
         # Try binary signature detection first
         mime_type = await self._detect_by_signature(file_path)
         if mime_type:
-            logger.debug(f"Detected {file_path} as {mime_type} by signature")
+            logger.debug("Detected {} as {} by signature", file_path, mime_type)
             return mime_type
         
         # Try text-based detection
         mime_type = await self._detect_text_format(file_path)
         if mime_type:
-            logger.debug(f"Detected {file_path} as {mime_type} by text analysis")
+            logger.debug("Detected {} as {} by text analysis", file_path, mime_type)
             return mime_type
         
         # Fallback to extension
         mime_type = self._detect_by_extension(file_path)
         if mime_type:
-            logger.debug(f"Detected {file_path} as {mime_type} by extension")
+            logger.debug("Detected {} as {} by extension", file_path, mime_type)
             return mime_type
         
         # If all detection methods fail
@@ -257,7 +262,7 @@ class FileDetector:
             return None
             
         except Exception as e:
-            logger.debug(f"Error reading file signature: {e}")
+            logger.debug("Error reading file signature: {}", e)
             return None
     
     async def _detect_zip_format(self, file_path: Path) -> Optional[str]:
@@ -275,10 +280,10 @@ class FileDetector:
                 return 'application/zip'
                 
         except zipfile.BadZipFile:
-            logger.debug(f"Invalid ZIP file: {file_path}")
+            logger.debug("Invalid ZIP file: {}", file_path)
             return None
         except Exception as e:
-            logger.debug(f"Error inspecting ZIP content: {e}")
+            logger.debug("Error inspecting ZIP content: {}", e)
             return None
     
     async def _detect_text_format(self, file_path: Path) -> Optional[str]:
@@ -294,9 +299,10 @@ class FileDetector:
             # Strip whitespace for analysis
             content_stripped = content.strip()
             
-            # Check for text patterns
-            for pattern, mime_type in self.text_patterns.items():
-                if content_stripped.lower().startswith(pattern.lower()):
+            # Check for text patterns (only the head can match, so only it is lowered)
+            head = content_stripped[:self._text_pattern_max_len].lower()
+            for pattern, mime_type in self._text_patterns_lower:
+                if head.startswith(pattern):
                     # Special validation for JSON
                     if mime_type == 'application/json':
                         if self._is_valid_json_start(content_stripped):
@@ -322,7 +328,7 @@ class FileDetector:
             # Not a text file
             return None
         except Exception as e:
-            logger.debug(f"Error analyzing text content: {e}")
+            logger.debug("Error analyzing text content: {}", e)
             return None
     
     def _detect_by_extension(self, file_path: Path) -> Optional[str]:
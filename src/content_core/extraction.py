@@ -1,8 +1,11 @@
 """Content extraction orchestrator -- replaces LangGraph state graph."""
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import os
 import tempfile
+from collections import OrderedDict
 from urllib.parse import urlparse
 
 import aiohttp
@@ -22,7 +25,7 @@ from content_core.processors.text import extract_text_file, process_text
 from content_core.processors.url import detect_remote_mime, extract_from_url
 from content_core.processors.media.video import extract_video
 from content_core.processors.url.reddit import extract_reddit, is_reddit_post
-from content_core.processors.url.youtube import extract_youtube
+from content_core.processors.url.youtube import extract_youtube, is_youtube_url
 
 # Optional docling
 try:
@@ -30,11 +33,22 @@ try:
         DOCLING_AVAILABLE,
         DOCLING_SUPPORTED,
         extract_docling,
+        load_docling,
     )
 except ImportError:
     DOCLING_AVAILABLE = False
     DOCLING_SUPPORTED = set()
     extract_docling = None  # type: ignore
+    load_docling = None  # type: ignore
+
+# MIME types that are downloaded and routed as files when served over HTTP.
+# HTML is treated as web content, not downloaded.
+DOWNLOADABLE_MIME_TYPES = frozenset(
+    set(SUPPORTED_PDF_TYPES)
+    | set(SUPPORTED_EPUB_TYPES)
+    | set(SUPPORTED_OFFICE_TYPES)
+    | (set(DOCLING_SUPPORTED) if DOCLING_AVAILABLE else set())
+) - {"text/html"}
 
 
 async def extract_content(
@@ -70,9 +84,7 @@ async def extract_content(
 async def _extract_url(url: str, cfg: ContentCoreConfig) -> ExtractionOutput:
     """Route URL to appropriate processor."""
     # YouTube detection
-    parsed = urlparse(url)
-    hostname = (parsed.hostname or "").lower()
-    if hostname in ("youtube.com", "www.youtube.com", "m.youtube.com", "youtu.be"):
+    if is_youtube_url(url):
         return await extract_youtube(url, cfg)
 
     # Reddit detection — use JSON endpoint, fall back to normal extraction
@@ -82,59 +94,108 @@ async def _extract_url(url: str, cfg: ContentCoreConfig) -> ExtractionOutput:
             return result
         logger.debug("Reddit JSON extraction failed, falling back to normal URL extraction")
 
-    # Check MIME type via HEAD request
+    # Check MIME type from the response headers (ranged GET)
     mime = await detect_remote_mime(url)
 
     # Downloadable file types (PDFs, Office docs, etc served over HTTP)
-    downloadable = set(SUPPORTED_PDF_TYPES) | set(SUPPORTED_EPUB_TYPES) | set(SUPPORTED_OFFICE_TYPES)
-    if DOCLING_AVAILABLE:
-        downloadable |= set(DOCLING_SUPPORTED)
-    downloadable.discard("text/html")  # HTML is treated as web content, not downloaded
-
-    if mime in downloadable:
+    if mime in DOWNLOADABLE_MIME_TYPES:
         tmp_path = await _download_remote_file(url)
         try:
             result = await _extract_file(tmp_path, cfg, delete_after=True)
             result.source_type = "url"
             return result
         except Exception:
-            _safe_delete(tmp_path)
+            await _safe_delete_async(tmp_path)
             raise
 
     # Treat as article/webpage
     return await extract_from_url(url, cfg)
 
 
-def _route_for_mime(mime: str, cfg: ContentCoreConfig) -> str | None:
+# Standard (non-docling) processors: exact MIME types first, then whole
+# top-level types such as video/* and audio/*
+_MIME_ROUTES = {
+    **dict.fromkeys(SUPPORTED_PDF_TYPES, "pdf"),
+    **dict.fromkeys(SUPPORTED_EPUB_TYPES, "epub"),
+    **dict.fromkeys(SUPPORTED_OFFICE_TYPES, "office"),
+    "text/plain": "text",
+}
+_MIME_PREFIX_ROUTES = {"video": "video", "audio": "audio"}
+
+
+def _route_for_mime(
+    mime: str, cfg: ContentCoreConfig, size: int | None = None
+) -> str | None:
     """Return the processor that would handle a file of this MIME type.
 
     Single source of truth for file-support routing, shared by ``_extract_file``
     (actual extraction) and ``check_file_support`` (pre-flight validation), so
     the pre-flight answer can never disagree with what extraction really does.
 
+    ``size`` is the file size in bytes, when known. With ``document_engine=auto``
+    and ``docling_max_file_mb`` set, larger files skip Docling for the simple
+    processor of their type, if there is one.
+
     Returns the processor name ("docling", "pdf", "epub", "office", "video",
     "audio", "text") or ``None`` if the type is unsupported.
     """
+    route = _MIME_ROUTES.get(mime)
+    if route is None:
+        top_level, slash, _ = mime.partition("/")
+        if slash:
+            route = _MIME_PREFIX_ROUTES.get(top_level)
+
     engine = cfg.document_engine
     if engine == "docling" or (
         engine == "auto" and DOCLING_AVAILABLE and mime in DOCLING_SUPPORTED
     ):
         if DOCLING_AVAILABLE and extract_docling is not None:
+            if (
+                engine == "auto"
+                and route is not None
+                and _exceeds_docling_limit(size, cfg)
+            ):
+                return route
             return "docling"
 
-    if mime in SUPPORTED_PDF_TYPES:
-        return "pdf"
-    if mime in SUPPORTED_EPUB_TYPES:
-        return "epub"
-    if mime in SUPPORTED_OFFICE_TYPES:
-        return "office"
-    if mime.startswith("video/"):
-        return "video"
-    if mime.startswith("audio/"):
-        return "audio"
-    if mime == "text/plain":
-        return "text"
-    return None
+    return route
+
+
+async def _resolve_docling(mime: str, cfg: ContentCoreConfig) -> None:
+    """Import docling, off the event loop, before routing a file it could handle.
+
+    ``DOCLING_AVAILABLE`` starts out only saying that docling is installed. If
+    the import fails, it is cleared so this and later files route to the
+    simple processors.
+    """
+    global DOCLING_AVAILABLE
+    if DOCLING_AVAILABLE and (
+        cfg.document_engine == "docling"
+        or (cfg.document_engine == "auto" and mime in DOCLING_SUPPORTED)
+    ):
+        DOCLING_AVAILABLE = await asyncio.get_event_loop().run_in_executor(
+            None, load_docling
+        )
+
+
+def _exceeds_docling_limit(size: int | None, cfg: ContentCoreConfig) -> bool:
+    """Whether a file is over the auto engine's Docling size limit."""
+    limit_mb = cfg.docling_max_file_mb
+    return size is not None and limit_mb > 0 and size > limit_mb * 1024 * 1024
+
+
+async def _size_for_routing(path: str, mime: str, cfg: ContentCoreConfig) -> int | None:
+    """Stat the file only when its size can change the route."""
+    if not (
+        cfg.document_engine == "auto"
+        and cfg.docling_max_file_mb > 0
+        and DOCLING_AVAILABLE
+        and mime in DOCLING_SUPPORTED
+    ):
+        return None
+    return await asyncio.get_event_loop().run_in_executor(
+        None, os.path.getsize, path
+    )
 
 
 async def check_file_support(
@@ -177,7 +238,9 @@ async def check_file_support(
             reason=str(exc),
         )
 
-    processor = _route_for_mime(mime, cfg)
+    await _resolve_docling(mime, cfg)
+    size = await _size_for_routing(file_path, mime, cfg)
+    processor = _route_for_mime(mime, cfg, size)
     supported = processor is not None
     return FileSupport(
         supported=supported,
@@ -196,39 +259,31 @@ async def _extract_file(
     from content_core.content.identification import get_file_type
 
     mime = await get_file_type(path)
-    logger.debug(f"Detected file type: {mime} for {path}")
+    logger.debug("Detected file type: {} for {}", mime, path)
 
-    used_docling = False
     try:
-        route = _route_for_mime(mime, cfg)
-
-        # Docling routing (if enabled and supported)
-        if route == "docling":
-            used_docling = True
-            result = await extract_docling(path, cfg)
-            if not result.title:
-                result.title = os.path.basename(path)
-            result.identified_type = mime
-            result.source_type = "file"
-            return result
-
-        # Standard processors
-        if route == "pdf":
-            result = await extract_pdf_file(path, cfg)
-        elif route == "epub":
-            result = await extract_epub_file(path, cfg)
-        elif route == "office":
-            result = await extract_office(path, mime, cfg)
-        elif route == "video":
-            result = await extract_video(path, cfg)
-        elif route == "audio":
-            result = await transcribe_audio(path, cfg)
-        elif route == "text":
-            result = await extract_text_file(path, cfg)
-        else:
+        await _resolve_docling(mime, cfg)
+        size = await _size_for_routing(path, mime, cfg)
+        route = _route_for_mime(mime, cfg, size)
+        if route is None:
             raise UnsupportedTypeException(f"Unsupported file type: {mime}")
 
-        if not used_docling and (cfg.docling_formulas or cfg.docling_vision or not cfg.docling_ocr):
+        cache_key = None
+        result = None
+        if cfg.extraction_cache:
+            digest = await asyncio.get_event_loop().run_in_executor(
+                None, _file_digest, path
+            )
+            cache_key = (digest, cfg.model_dump_json())
+            result = _cached_extraction(cache_key)
+        if result is None:
+            result = await _run_processor(route, path, mime, cfg)
+            if cache_key is not None:
+                _cache_extraction(cache_key, result)
+
+        if route != "docling" and (
+            cfg.docling_formulas or cfg.docling_vision or not cfg.docling_ocr
+        ):
             logger.warning(
                 "Docling enrichment flags (docling_formulas, docling_vision, docling_ocr) "
                 "are only applied when document_engine='docling'. "
@@ -242,29 +297,106 @@ async def _extract_file(
         return result
     finally:
         if delete_after:
-            _safe_delete(path)
+            await _safe_delete_async(path)
+
+
+async def _run_processor(
+    route: str, path: str, mime: str, cfg: ContentCoreConfig
+) -> ExtractionOutput:
+    """Run the processor chosen by ``_route_for_mime``."""
+    if route == "docling":
+        return await extract_docling(path, cfg)
+    if route == "pdf":
+        return await extract_pdf_file(path, cfg)
+    if route == "epub":
+        return await extract_epub_file(path, cfg)
+    if route == "office":
+        return await extract_office(path, mime, cfg)
+    if route == "video":
+        return await extract_video(path, cfg)
+    if route == "audio":
+        return await transcribe_audio(path, cfg)
+    return await extract_text_file(path, cfg)
+
+
+# Results of file extractions in this process, keyed by a digest of the file
+# contents and the full config, so re-processing an identical file (e.g. a URL
+# ingested again) skips the work (enable with extraction_cache=True)
+EXTRACTION_CACHE_SIZE = 64
+
+_extraction_cache: OrderedDict[tuple, ExtractionOutput] = OrderedDict()
+
+
+def _file_digest(path: str) -> str:
+    """Return a BLAKE2 digest of a file's contents, read in chunks."""
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(DOWNLOAD_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _cached_extraction(key: tuple) -> ExtractionOutput | None:
+    """Return a copy of a cached extraction result, if there is one."""
+    cached = _extraction_cache.get(key)
+    if cached is None:
+        return None
+    logger.debug("Using cached extraction result")
+    _extraction_cache.move_to_end(key)
+    # Callers adjust the result (title, source_type), so never hand out the
+    # cached instance itself
+    return cached.model_copy(deep=True)
+
+
+def _cache_extraction(key: tuple, result: ExtractionOutput) -> None:
+    """Store a copy of an extraction result, evicting the oldest entry."""
+    _extraction_cache[key] = result.model_copy(deep=True)
+    if len(_extraction_cache) > EXTRACTION_CACHE_SIZE:
+        _extraction_cache.popitem(last=False)
+
+
+# Downloads are written to disk in chunks of this size instead of being
+# buffered whole in memory
+DOWNLOAD_CHUNK_SIZE = 1 << 20
 
 
 @retry_download()
-async def _fetch_remote_file(url: str) -> tuple:
-    """Download a remote file. Wrapped with retry logic."""
+async def _fetch_remote_file(url: str, path: str) -> None:
+    """Download a remote file into ``path``. Wrapped with retry logic."""
     async with aiohttp.ClientSession(trust_env=True) as session:
         async with session.get(url) as resp:
             resp.raise_for_status()
-            mime = resp.headers.get("content-type", "").split(";", 1)[0]
-            content = await resp.read()
-            return mime, content
+            # File I/O runs in the executor so a slow disk doesn't stall the
+            # event loop. "wb" truncates, so a retried attempt starts clean.
+            loop = asyncio.get_event_loop()
+            f = await loop.run_in_executor(None, open, path, "wb")
+            try:
+                async for chunk in resp.content.iter_chunked(DOWNLOAD_CHUNK_SIZE):
+                    await loop.run_in_executor(None, f.write, chunk)
+            finally:
+                await loop.run_in_executor(None, f.close)
+
+
+def _create_temp_file(suffix: str) -> str:
+    """Create an empty temp file and return its path."""
+    fd, path = tempfile.mkstemp(suffix=suffix)
+    os.close(fd)
+    return path
 
 
 async def _download_remote_file(url: str) -> str:
     """Download a remote file to a temp path."""
-    logger.debug(f"Downloading remote file: {url}")
-    mime, content = await _fetch_remote_file(url)
-    suffix = os.path.splitext(urlparse(url).path)[1] if urlparse(url).path else ""
-    fd, tmp = tempfile.mkstemp(suffix=suffix)
-    os.close(fd)
-    with open(tmp, "wb") as f:
-        f.write(content)
+    logger.debug("Downloading remote file: {}", url)
+    path = urlparse(url).path
+    suffix = os.path.splitext(path)[1] if path else ""
+    tmp = await asyncio.get_event_loop().run_in_executor(
+        None, _create_temp_file, suffix
+    )
+    try:
+        await _fetch_remote_file(url, tmp)
+    except Exception:
+        await _safe_delete_async(tmp)
+        raise
     return tmp
 
 
@@ -274,3 +406,8 @@ def _safe_delete(path: str) -> None:
         os.remove(path)
     except OSError:
         logger.warning(f"Failed to delete temp file: {path}")
+
+
+async def _safe_delete_async(path: str) -> None:
+    """Delete a file in the executor, ignoring errors."""
+    await asyncio.get_event_loop().run_in_executor(None, _safe_delete, path)
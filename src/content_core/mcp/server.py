@@ -1,5 +1,6 @@
 """Content Core MCP Server — extract and summarize content."""
 import sys
+from contextlib import asynccontextmanager
 
 from fastmcp import FastMCP
 from loguru import logger
@@ -8,7 +9,19 @@ from loguru import logger
 logger.remove()
 logger.add(sys.stderr, level="INFO")
 
-mcp = FastMCP("Content Core")
+
+@asynccontextmanager
+async def _lifespan(server):
+    """Close shared HTTP clients when the server shuts down."""
+    try:
+        yield
+    finally:
+        from content_core.processors.url.youtube import close_client
+
+        await close_client()
+
+
+mcp = FastMCP("Content Core", lifespan=_lifespan)
 
 
 @mcp.tool
@@ -2,35 +2,69 @@
 Docling-based document extraction processor.
 """
 
+import importlib.util
+
 from content_core.config import ContentCoreConfig
 from content_core.common.state import ExtractionOutput
+from content_core.logging import logger
+
+# docling pulls in torch and its model stack, which takes seconds to import, so
+# only check that it is installed here and import it on first extraction
+DOCLING_AVAILABLE = importlib.util.find_spec("docling") is not None
+
+# Set by load_docling() (or patched in tests)
+InputFormat = None
+PdfPipelineOptions = None
+PdfFormatOption = None
+DocumentConverter = None
+
+
+class _MissingDocumentConverter:
+    """Stub when docling is not installed."""
+
+    def __init__(self, **kwargs):
+        raise ImportError(
+            "Docling not installed. Install with: pip install content-core[docling] "
+            "or use CCORE_DOCUMENT_ENGINE=simple to skip docling."
+        )
+
+    def convert(self, source: str):
+        raise ImportError(
+            "Docling not installed. Install with: pip install content-core[docling] "
+            "or use CCORE_DOCUMENT_ENGINE=simple to skip docling."
+        )
+
+
+def load_docling() -> bool:
+    """
+    Import the docling classes into this module on first use.
+
+    ``DOCLING_AVAILABLE`` only says docling is installed. If importing it fails
+    (e.g. a broken torch install, which can raise OSError or RuntimeError
+    rather than ImportError), it is cleared so the auto engine routes to the
+    simple processors from then on. Slow (docling imports torch), so async
+    callers should run it in an executor.
+
+    Returns:
+        Whether docling could be imported
+    """
+    global DOCLING_AVAILABLE
+    global InputFormat, PdfPipelineOptions, PdfFormatOption, DocumentConverter
+    if DocumentConverter is not None:
+        return DOCLING_AVAILABLE
+    if DOCLING_AVAILABLE:
+        try:
+            from docling.datamodel.base_models import InputFormat
+            from docling.datamodel.pipeline_options import PdfPipelineOptions
+            from docling.document_converter import DocumentConverter, PdfFormatOption
+
+            return True
+        except Exception as e:
+            logger.warning(f"Docling is installed but failed to import: {e!r}")
+            DOCLING_AVAILABLE = False
+    DocumentConverter = _MissingDocumentConverter
+    return False
 
-DOCLING_AVAILABLE = False
-try:
-    from docling.datamodel.base_models import InputFormat
-    from docling.datamodel.pipeline_options import PdfPipelineOptions
-    from docling.document_converter import DocumentConverter, PdfFormatOption
-
-    DOCLING_AVAILABLE = True
-except ImportError:
-    InputFormat = None  # type: ignore
-    PdfPipelineOptions = None  # type: ignore
-    PdfFormatOption = None  # type: ignore
-
-    class DocumentConverter:  # type: ignore[no-redef]
-        """Stub when docling is not installed."""
-
-        def __init__(self, **kwargs):
-            raise ImportError(
-                "Docling not installed. Install with: pip install content-core[docling] "
-                "or use CCORE_DOCUMENT_ENGINE=simple to skip docling."
-            )
-
-        def convert(self, source: str):
-            raise ImportError(
-                "Docling not installed. Install with: pip install content-core[docling] "
-                "or use CCORE_DOCUMENT_ENGINE=simple to skip docling."
-            )
 
 # Supported MIME types for Docling extraction
 DOCLING_SUPPORTED = {
@@ -50,8 +84,25 @@ DOCLING_SUPPORTED = {
 }
 
 
-async def extract_docling(source: str, config: ContentCoreConfig) -> ExtractionOutput:
-    """Extract content using Docling."""
+# Converters are reused across extractions: docling initializes its pipelines
+# (and loads layout/OCR models) per converter, so building one per document
+# repeats that work. Keyed by the converter class and the options it is built
+# with.
+_converters: dict[tuple, object] = {}
+
+
+def _get_converter(config: ContentCoreConfig):
+    """Return a DocumentConverter for the config's pipeline options."""
+    key = (
+        DocumentConverter,
+        config.docling_ocr,
+        config.docling_formulas,
+        config.docling_vision,
+    )
+    converter = _converters.get(key)
+    if converter is not None:
+        return converter
+
     if DOCLING_AVAILABLE and PdfPipelineOptions is not None:
         pipeline_options = PdfPipelineOptions(
             do_ocr=config.docling_ocr,
@@ -66,6 +117,14 @@ async def extract_docling(source: str, config: ContentCoreConfig) -> ExtractionO
         )
     else:
         converter = DocumentConverter()
+    _converters[key] = converter
+    return converter
+
+
+async def extract_docling(source: str, config: ContentCoreConfig) -> ExtractionOutput:
+    """Extract content using Docling."""
+    load_docling()
+    converter = _get_converter(config)
 
     if not source:
         raise ValueError("No input provided for Docling extraction.")
@@ -13,7 +13,7 @@ SUPPORTED_EPUB_TYPES = ["application/epub+zip"]
 async def extract_epub_file(file_path: str, config: ContentCoreConfig) -> ExtractionOutput:
     """Extract content from an EPUB file using fast-ebook."""
     def _extract():
-        logger.debug(f"Extracting EPUB: {file_path}")
+        logger.debug("Extracting EPUB: {}", file_path)
         epub = read_epub(file_path)
         return epub.to_markdown()
 
@@ -56,6 +56,29 @@ def convert_table_to_markdown(table):
 
 SUPPORTED_PDF_TYPES = ["application/pdf"]
 
+# Regex cleanup passes applied in order by clean_pdf_text, compiled once
+_PDF_CLEANUP_PATTERNS = [
+    # Step 4: Enhanced space cleaning
+    (re.compile(r"[ \t]+"), " "),  # Consolidate horizontal whitespace
+    (re.compile(r" +\n"), "\n"),  # Remove spaces before newlines
+    (re.compile(r"\n +"), "\n"),  # Remove spaces after newlines
+    (re.compile(r"\n\t+"), "\n"),  # Remove tabs at start of lines
+    (re.compile(r"\t+\n"), "\n"),  # Remove tabs at end of lines
+    (re.compile(r"\t+"), " "),  # Replace tabs with single space
+    # Step 5: Remove empty lines while preserving paragraph structure
+    (re.compile(r"\n{3,}"), "\n\n"),  # Max two consecutive newlines
+    (re.compile(r"^\s+"), ""),  # Remove leading whitespace
+    (re.compile(r"\s+$"), ""),  # Remove trailing whitespace
+    # Step 6: Clean up around punctuation
+    (re.compile(r"\s+([.,;:!?)])"), r"\1"),  # Remove spaces before punctuation
+    (re.compile(r"(\()\s+"), r"\1"),  # Remove spaces after opening parenthesis
+    (re.compile(r"\s+([.,])\s+"), r"\1 "),  # Ensure single space after periods and commas
+    # Step 7: Remove zero-width and invisible characters
+    (re.compile(r"[\u200b\u200c\u200d\ufeff\u200e\u200f]"), ""),
+    # Step 8: Fix hyphenation and line breaks
+    (re.compile(r"(?<=\w)-\s*\n\s*(?=\w)"), ""),  # Remove hyphenation at line breaks
+]
+
 
 def clean_pdf_text(text):
     """
@@ -116,33 +139,9 @@ def clean_pdf_text(text):
         or char in "()%=[]{}#$@!?.,;:+-*/^<>&|~"
     )
 
-    # Step 4: Enhanced space cleaning
-    text = re.sub(r"[ \t]+", " ", text)  # Consolidate horizontal whitespace
-    text = re.sub(r" +\n", "\n", text)  # Remove spaces before newlines
-    text = re.sub(r"\n +", "\n", text)  # Remove spaces after newlines
-    text = re.sub(r"\n\t+", "\n", text)  # Remove tabs at start of lines
-    text = re.sub(r"\t+\n", "\n", text)  # Remove tabs at end of lines
-    text = re.sub(r"\t+", " ", text)  # Replace tabs with single space
-
-    # Step 5: Remove empty lines while preserving paragraph structure
-    text = re.sub(r"\n{3,}", "\n\n", text)  # Max two consecutive newlines
-    text = re.sub(r"^\s+", "", text)  # Remove leading whitespace
-    text = re.sub(r"\s+$", "", text)  # Remove trailing whitespace
-
-    # Step 6: Clean up around punctuation
-    text = re.sub(r"\s+([.,;:!?)])", r"\1", text)  # Remove spaces before punctuation
-    text = re.sub(r"(\()\s+", r"\1", text)  # Remove spaces after opening parenthesis
-    text = re.sub(
-        r"\s+([.,])\s+", r"\1 ", text
-    )  # Ensure single space after periods and commas
-
-    # Step 7: Remove zero-width and invisible characters
-    text = re.sub(r"[\u200b\u200c\u200d\ufeff\u200e\u200f]", "", text)
-
-    # Step 8: Fix hyphenation and line breaks
-    text = re.sub(
-        r"(?<=\w)-\s*\n\s*(?=\w)", "", text
-    )  # Remove hyphenation at line breaks
+    # Steps 4-8: whitespace, punctuation, invisible characters and hyphenation
+    for pattern, replacement in _PDF_CLEANUP_PATTERNS:
+        text = pattern.sub(replacement, text)
 
     return text.strip()
 
@@ -152,14 +151,14 @@ async def _extract_text_from_pdf(pdf_path: str) -> str:
     def _extract():
         with pdfplumber.open(pdf_path) as pdf:
             full_text = []
-            logger.debug(f"Found {len(pdf.pages)} pages in PDF")
+            logger.debug("Found {} pages in PDF", len(pdf.pages))
             for page_num, page in enumerate(pdf.pages):
                 page_text = page.extract_text() or ""
                 # Table extraction
                 try:
                     tables = page.extract_tables()
                     if tables:
-                        logger.debug(f"Found {len(tables)} table(s) on page {page_num + 1}")
+                        logger.debug("Found {} table(s) on page {}", len(tables), page_num + 1)
                         for table_num, table in enumerate(tables):
                             if table and any(
                                 any(str(cell).strip() for cell in row if cell)
@@ -168,7 +167,7 @@ async def _extract_text_from_pdf(pdf_path: str) -> str:
                                 page_text += f"\n\n[Table {table_num + 1} from page {page_num + 1}]\n"
                                 page_text += convert_table_to_markdown(table) + "\n"
                 except Exception as e:
-                    logger.debug(f"Table extraction failed on page {page_num + 1}: {e}")
+                    logger.debug("Table extraction failed on page {}: {}", page_num + 1, e)
                 full_text.append(page_text)
             return clean_pdf_text("\n\n".join(full_text))
     return await asyncio.get_event_loop().run_in_executor(None, _extract)
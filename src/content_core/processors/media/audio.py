@@ -78,7 +78,7 @@ async def split_audio(input_file, segment_length_minutes=15, output_prefix=None)
 
         segment_length_s = segment_length_minutes * 60
         total_segments = math.ceil(duration / segment_length_s)
-        logger.debug(f"Splitting file: {input_file_abs} into {total_segments} segments")
+        logger.debug("Splitting file: {} into {} segments", input_file_abs, total_segments)
 
         output_files = []
         for i in range(total_segments):
@@ -90,7 +90,10 @@ async def split_audio(input_file, segment_length_minutes=15, output_prefix=None)
             split_audio_segment(input_file_abs, output_path, start_time, end_time)
             output_files.append(output_path)
             logger.debug(
-                f"Exported segment {i + 1}/{total_segments}: {output_filename}"
+                "Exported segment {}/{}: {}",
+                i + 1,
+                total_segments,
+                output_filename,
             )
 
         return output_files
@@ -194,7 +197,9 @@ async def transcribe_audio(file_path: str, config: ContentCoreConfig) -> Extract
             semaphore = asyncio.Semaphore(concurrency)
 
             logger.debug(
-                f"Transcribing {len(output_files)} audio segments with concurrency limit of {concurrency}"
+                "Transcribing {} audio segments with concurrency limit of {}",
+                len(output_files),
+                concurrency,
             )
 
             transcription_tasks = [
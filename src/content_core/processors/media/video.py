@@ -1,5 +1,4 @@
 import asyncio
-import json
 import os
 import subprocess
 from functools import partial
@@ -45,23 +44,41 @@ async def extract_audio_from_video(input_file, output_file, stream_index):
     )
 
 
+def _parse_ffprobe_stream(line):
+    """
+    Parse one line of ffprobe compact output ("key=value|key=value") into a
+    stream dict, dropping fields ffprobe reports as N/A
+    """
+    stream = {}
+    for item in line.split("|"):
+        key, sep, value = item.partition("=")
+        if sep and value and value != "N/A":
+            stream[key] = value
+    if "channels" in stream:
+        stream["channels"] = int(stream["channels"])
+    return stream
+
+
 async def get_audio_streams(input_file):
     """
     Analyze video file and return information about all audio streams asynchronously
     """
 
     def _analyze(input_file):
-        logger.debug(f"Analyzing video file {input_file} for audio streams")
+        logger.debug("Analyzing video file {} for audio streams", input_file)
         try:
+            # Only ask for the fields used to pick a stream, one compact
+            # line per stream, instead of the full -show_streams JSON
             cmd = [
                 "ffprobe",
                 "-v",
                 "quiet",
-                "-print_format",
-                "json",
-                "-show_streams",
                 "-select_streams",
                 "a",
+                "-show_entries",
+                "stream=index,bit_rate,channels,sample_rate",
+                "-of",
+                "compact=p=0",
                 input_file,
             ]
 
@@ -69,9 +86,11 @@ async def get_audio_streams(input_file):
             if result.returncode != 0:
                 raise Exception(f"FFprobe failed: {result.stderr}")
 
-            data = json.loads(result.stdout)
-            logger.debug(data)
-            return data.get("streams", [])
+            return [
+                _parse_ffprobe_stream(line)
+                for line in result.stdout.splitlines()
+                if line
+            ]
         except Exception as e:
             logger.error(f"Error analyzing file: {str(e)}")
             return []
@@ -81,6 +100,28 @@ async def get_audio_streams(input_file):
     )
 
 
+def _score_audio_stream(stream):
+    """
+    Score an audio stream by quality: bit rate, channel count, sample rate
+    """
+    score = 0
+
+    # Prefer higher bit rates
+    bit_rate = stream.get("bit_rate")
+    if bit_rate:
+        score += int(int(bit_rate) / 1000000)  # Convert to Mbps and ensure int
+
+    # Prefer more channels (stereo over mono)
+    channels = stream.get("channels", 0)
+    score += channels * 10
+
+    # Prefer higher sample rates
+    sample_rate = stream.get("sample_rate", "0")
+    score += int(int(sample_rate) / 48000)
+
+    return score
+
+
 async def select_best_audio_stream(streams):
     """
     Select the best audio stream based on various quality metrics
@@ -91,30 +132,10 @@ async def select_best_audio_stream(streams):
             logger.debug("No audio streams found")
             return None
         else:
-            logger.debug(f"Found {len(streams)} audio streams")
-
-        # Score each stream based on various factors
-        scored_streams = []
-        for stream in streams:
-            score = 0
-
-            # Prefer higher bit rates
-            bit_rate = stream.get("bit_rate")
-            if bit_rate:
-                score += int(int(bit_rate) / 1000000)  # Convert to Mbps and ensure int
-
-            # Prefer more channels (stereo over mono)
-            channels = stream.get("channels", 0)
-            score += channels * 10
-
-            # Prefer higher sample rates
-            sample_rate = stream.get("sample_rate", "0")
-            score += int(int(sample_rate) / 48000)
-
-            scored_streams.append((score, stream))
+            logger.debug("Found {} audio streams", len(streams))
 
-        # Return the stream with highest score
-        return max(scored_streams, key=lambda x: x[0])[1]
+        # Single pass over the streams, no intermediate (score, stream) list
+        return max(streams, key=_score_audio_stream)
 
     return await asyncio.get_event_loop().run_in_executor(
         None, partial(_select, streams)
@@ -163,7 +184,7 @@ async def extract_video(file_path: str, config: ContentCoreConfig) -> Extraction
             metadata={"error": "Failed to extract audio from video"},
         )
 
-    logger.debug(f"Successfully extracted audio to: {output_file}")
+    logger.debug("Successfully extracted audio to: {}", output_file)
 
     try:
         result = await transcribe_audio(output_file, config)
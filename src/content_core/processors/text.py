@@ -1,7 +1,9 @@
 import asyncio
+import hashlib
 import re
+from collections import OrderedDict
 
-from markdownify import markdownify as md
+from markdownify import MarkdownConverter
 
 from content_core.config import ContentCoreConfig
 from content_core.logging import logger
@@ -13,11 +15,39 @@ from content_core.common.state import ExtractionOutput
 HTML_DETECTION_THRESHOLD = 2
 
 # HTML tags that indicate meaningful structure
+HTML_STRUCTURAL_TAG_NAMES = (
+    "p", "div", "h[1-6]", "ul", "ol", "li", "strong", "em", "b", "i", "a",
+    "code", "pre", "blockquote", "table", "thead", "tbody", "tr", "td", "th",
+    "article", "section", "header", "footer", "nav", "span", "br",
+)
+
+
+def _case_folded(pattern: str) -> str:
+    """Spell each letter as a [xX] class so the regex matches either case."""
+    return "".join(
+        f"[{c.lower()}{c.upper()}]" if c.isalpha() else c for c in pattern
+    )
+
+
+# Case is handled by explicit character classes instead of re.IGNORECASE,
+# which makes the regex engine case-fold every character it compares
 HTML_STRUCTURAL_TAGS = re.compile(
-    r"<(p|div|h[1-6]|ul|ol|li|strong|em|b|i|a|code|pre|blockquote|table|thead|tbody|tr|td|th|article|section|header|footer|nav|span|br)[^>]*>",
-    re.IGNORECASE,
+    r"<("
+    + "|".join(_case_folded(name) for name in HTML_STRUCTURAL_TAG_NAMES)
+    + r")[^>]*>"
+)
+
+# Shared converter: options are resolved once, and lxml (C parser) is used
+# instead of the pure-Python html.parser
+MARKDOWN_CONVERTER = MarkdownConverter(
+    heading_style="ATX", bullets="-", bs4_options="lxml"
 )
 
+# Number of HTML→markdown conversions kept, keyed by a digest of the HTML
+HTML_CONVERSION_CACHE_SIZE = 128
+
+_conversion_cache: OrderedDict[bytes, str] = OrderedDict()
+
 
 def detect_html(content: str) -> bool:
     """
@@ -29,10 +59,39 @@ def detect_html(content: str) -> bool:
     Returns:
         True if at least HTML_DETECTION_THRESHOLD structural tags are found
     """
+    # Cheap C-level prefilter: plain text rarely contains enough '<' to
+    # qualify, so most inputs never reach the regex
+    if content.count("<") < HTML_DETECTION_THRESHOLD:
+        return False
     matches = HTML_STRUCTURAL_TAGS.findall(content)
     return len(matches) >= HTML_DETECTION_THRESHOLD
 
 
+def html_to_markdown(content: str) -> str:
+    """
+    Convert HTML to markdown, reusing the result for repeated content.
+
+    Args:
+        content: HTML content to convert
+
+    Returns:
+        Markdown rendering of the content
+    """
+    key = hashlib.blake2b(
+        content.encode("utf-8", "surrogatepass"), digest_size=16
+    ).digest()
+    converted = _conversion_cache.get(key)
+    if converted is not None:
+        _conversion_cache.move_to_end(key)
+        return converted
+
+    converted = MARKDOWN_CONVERTER.convert(content)
+    _conversion_cache[key] = converted
+    if len(_conversion_cache) > HTML_CONVERSION_CACHE_SIZE:
+        _conversion_cache.popitem(last=False)
+    return converted
+
+
 async def extract_text_file(file_path: str, config: ContentCoreConfig) -> ExtractionOutput:
     """Extract content from a plain text file."""
 
@@ -42,7 +101,7 @@ async def extract_text_file(file_path: str, config: ContentCoreConfig) -> Extrac
 
     try:
         content = await asyncio.get_event_loop().run_in_executor(None, _read_file)
-        logger.debug(f"Extracted text from {file_path}: {content[:100]}")
+        logger.debug("Extracted text from {}: {}", file_path, content[:100])
         return ExtractionOutput(
             content=content,
             source_type="file",
@@ -66,7 +125,7 @@ async def process_text(content: str, config: ContentCoreConfig) -> ExtractionOut
     if detect_html(content):
         logger.debug("HTML detected in content, converting to markdown")
         try:
-            converted = md(content, heading_style="ATX", bullets="-")
+            converted = html_to_markdown(content)
             return ExtractionOutput(
                 content=converted,
                 source_type="text",
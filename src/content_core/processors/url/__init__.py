@@ -2,7 +2,9 @@ import os
 
 import aiohttp
 
-from content_core.common.retry import retry_url_network
+from content_core.common.circuit_breaker import CircuitBreaker, engine_breaker
+from content_core.common.concurrency import host_semaphore
+from content_core.common.retry import is_retryable_exception, retry_url_network
 from content_core.config import ContentCoreConfig
 from content_core.logging import logger
 from content_core.common.state import ExtractionOutput
@@ -19,66 +21,108 @@ from content_core.processors.url.firecrawl import (
     extract_url_firecrawl,
 )
 from content_core.processors.url.crawl4ai import extract_url_crawl4ai
+from content_core.processors.url.youtube import is_youtube_url
+
+
+# Ask for the first bytes only; the body is never read, we just need headers
+MIME_PROBE_RANGE = "bytes=0-2047"
+MIME_PROBE_TIMEOUT = aiohttp.ClientTimeout(total=10)
+
+# MIME types detect_remote_mime reports as-is; everything else is an "article"
+REMOTE_FILE_MIME_TYPES = frozenset(
+    set(DOCLING_SUPPORTED)
+    | set(SUPPORTED_PDF_TYPES)
+    | set(SUPPORTED_EPUB_TYPES)
+    | set(SUPPORTED_OFFICE_TYPES)
+)
 
 
 @retry_url_network()
 async def _fetch_url_mime_type(url: str) -> str:
-    """Internal function to fetch URL MIME type - wrapped with retry logic."""
-    async with aiohttp.ClientSession(trust_env=True) as session:
-        async with session.head(url, timeout=10, allow_redirects=True) as resp:
-            mime = resp.headers.get("content-type", "").split(";", 1)[0]
-            logger.debug(f"MIME type for {url}: {mime}")
-            return mime
+    """Internal function to fetch URL MIME type - wrapped with retry logic.
+
+    Uses a ranged GET rather than HEAD: many servers and CDNs reject HEAD
+    (405/403) or answer it without a content-type, which misroutes
+    downloadable files as articles. The body is not read, so this is still a
+    single round trip.
+    """
+    async with host_semaphore(url):
+        async with aiohttp.ClientSession(trust_env=True) as session:
+            async with session.get(
+                url,
+                headers={"Range": MIME_PROBE_RANGE},
+                timeout=MIME_PROBE_TIMEOUT,
+                allow_redirects=True,
+            ) as resp:
+                mime = resp.headers.get("content-type", "").split(";", 1)[0]
+                logger.debug("MIME type for {}: {}", url, mime)
+                return mime
 
 
 async def detect_remote_mime(url: str) -> str:
-    """Detect MIME type of a remote URL via HEAD request."""
-    if "youtube.com" in url or "youtu.be" in url:
+    """Detect MIME type of a remote URL from its response headers."""
+    if is_youtube_url(url):
         return "youtube"
     try:
         mime = await _fetch_url_mime_type(url)
     except Exception as e:
-        logger.warning(f"HEAD check failed for {url} after retries: {e}")
+        logger.warning(f"MIME check failed for {url} after retries: {e}")
         return "article"
 
-    if (
-        mime in DOCLING_SUPPORTED
-        or mime in SUPPORTED_PDF_TYPES
-        or mime in SUPPORTED_EPUB_TYPES
-        or mime in SUPPORTED_OFFICE_TYPES
-    ):
+    if mime in REMOTE_FILE_MIME_TYPES:
         return mime
     return "article"
 
 
+def _record_engine_error(breaker: CircuitBreaker, error: Exception) -> None:
+    """Count an engine error toward its breaker, unless it is specific to the URL."""
+    # 4xx responses, dead sites and unparseable pages say nothing about
+    # whether the engine itself is up
+    if is_retryable_exception(error):
+        breaker.record_failure()
+
+
 async def _extract_url_with_engine(url: str, engine: str, config: ContentCoreConfig) -> dict:
     """Run the URL extraction with a specific engine and fallback chain."""
     if engine == "auto":
-        if os.environ.get("FIRECRAWL_API_KEY"):
+        # API engines are skipped while their circuit breaker is open, so an
+        # outage doesn't cost every URL a full retry cycle before falling back
+        firecrawl_breaker = engine_breaker("firecrawl")
+        if os.environ.get("FIRECRAWL_API_KEY") and firecrawl_breaker.allow():
             logger.debug(
                 "Engine 'auto' selected: using Firecrawl (FIRECRAWL_API_KEY detected)"
             )
             try:
-                result = await extract_url_firecrawl(url, config)
-                if result is not None:
-                    return result
+                # The fetch raises, unlike extract_url_firecrawl, so the breaker
+                # can tell an outage from a URL Firecrawl cannot handle
+                result = await _fetch_url_firecrawl(url, config)
+                firecrawl_breaker.record_success()
+                return result
             except Exception as e:
+                _record_engine_error(firecrawl_breaker, e)
                 logger.error(f"Firecrawl extraction error for URL: {url}: {e}")
             logger.debug("Firecrawl failed, falling through to jina→crawl4ai→bs4 chain")
 
-        try:
-            logger.debug("Trying to use Jina to extract URL")
-            return await extract_url_jina(url)
-        except Exception as e:
-            logger.error(f"Jina extraction error for URL: {url}: {e}")
-            logger.debug("Trying to use Crawl4AI to extract URL")
-            result = await extract_url_crawl4ai(url)
-            if result is not None:
+        jina_breaker = engine_breaker("jina")
+        if jina_breaker.allow():
+            try:
+                logger.debug("Trying to use Jina to extract URL")
+                result = await extract_url_jina(url)
+                jina_breaker.record_success()
                 return result
-            logger.debug(
-                "Crawl4AI failed or not installed, falling back to BeautifulSoup"
-            )
-            return await extract_url_bs4(url)
+            except Exception as e:
+                _record_engine_error(jina_breaker, e)
+                logger.error(f"Jina extraction error for URL: {url}: {e}")
+        else:
+            logger.debug("Jina circuit open, skipping")
+        logger.debug("Trying to use Crawl4AI to extract URL")
+        result = await extract_url_crawl4ai(url)
+        if result is not None:
+            return result
+        logger.debug(
+            "Crawl4AI failed or not installed, falling back to BeautifulSoup"
+        )
+        return await extract_url_bs4(url)
     elif engine == "simple":
         return await extract_url_bs4(url)
     elif engine == "firecrawl":
@@ -145,6 +189,7 @@ __all__ = [
     "extract_reddit",
     "is_reddit_post",
     "extract_youtube",
+    "is_youtube_url",
     "get_best_transcript",
     "get_video_title",
     "extract_transcript_pytubefix",
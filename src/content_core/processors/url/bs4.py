@@ -1,20 +1,112 @@
 import aiohttp
+import soupsieve
 from bs4 import BeautifulSoup
 from readability import Document
+from readability.htmls import build_doc
 
+from content_core.common.concurrency import host_semaphore
 from content_core.common.retry import retry_url_network
 from content_core.logging import logger
 
+# Optional selectolax (lexbor C parser) — much faster than BeautifulSoup for
+# plain-text extraction. BeautifulSoup remains the fallback when not installed.
+SELECTOLAX_AVAILABLE = False
+try:
+    from selectolax.lexbor import LexborHTMLParser
+
+    SELECTOLAX_AVAILABLE = True
+except ImportError:
+    LexborHTMLParser = None  # type: ignore
+
+# Per-request timeout, built once rather than converted from a number per call
+FETCH_TIMEOUT = aiohttp.ClientTimeout(total=10)
+
+# Tags whose text is not page content (BeautifulSoup's get_text skips them too)
+NON_CONTENT_TAGS = ["script", "style", "template"]
+
+# Common content containers, used when readability can't find the article
+CONTENT_SELECTOR = (
+    'article, .content, .post, main, [role="main"], '
+    'div[class*="content"], div[class*="article"]'
+)
+# Compiled once for the BeautifulSoup path instead of on every select() call
+CONTENT_SELECTOR_COMPILED = soupsieve.compile(CONTENT_SELECTOR)
+
 
 @retry_url_network()
 async def _fetch_url_html(url: str) -> str:
     """Internal function to fetch URL HTML content - wrapped with retry logic."""
-    async with aiohttp.ClientSession(trust_env=True) as session:
-        async with session.get(url, timeout=10) as response:
-            # Raise ClientResponseError so retry logic can inspect status code
-            # (5xx and 429 will be retried, 4xx will not)
-            response.raise_for_status()
-            return await response.text()
+    async with host_semaphore(url):
+        async with aiohttp.ClientSession(trust_env=True) as session:
+            async with session.get(url, timeout=FETCH_TIMEOUT) as response:
+                # Raise ClientResponseError so retry logic can inspect status code
+                # (5xx and 429 will be retried, 4xx will not)
+                response.raise_for_status()
+                return await response.text()
+
+
+def _html_text(html: str) -> str:
+    """Return the plain text of an HTML fragment."""
+    if SELECTOLAX_AVAILABLE:
+        tree = LexborHTMLParser(html)
+        tree.strip_tags(NON_CONTENT_TAGS)
+        root = tree.body or tree.root
+        if root is None:
+            return ""
+        return root.text(separator=" ", strip=True, skip_empty=True)
+
+    soup = BeautifulSoup(html, "lxml")
+    return soup.get_text(separator=" ", strip=True)
+
+
+def _extract_title_and_content(html: str) -> tuple[str, str]:
+    """Extract title and content from raw HTML without readability.
+
+    The page is parsed once and the tree is shared by title and content lookup.
+    """
+    if SELECTOLAX_AVAILABLE:
+        tree = LexborHTMLParser(html)
+        tree.strip_tags(NON_CONTENT_TAGS)
+        title_node = (
+            tree.css_first("title")
+            or tree.css_first("h1")
+            or tree.css_first('meta[property="og:title"]')
+        )
+        if title_node is not None:
+            title = title_node.attributes.get("content") or title_node.text(
+                strip=True
+            )
+        else:
+            title = "No title found"
+        content_nodes = tree.css(CONTENT_SELECTOR)
+        if content_nodes:
+            content = " ".join(
+                node.text(separator=" ", strip=True, skip_empty=True)
+                for node in content_nodes
+            )
+        elif tree.root is not None:
+            content = tree.root.text(separator=" ", strip=True, skip_empty=True)
+        else:
+            content = ""
+        return title, content
+
+    soup = BeautifulSoup(html, "lxml")
+    title_tag = (
+        soup.find("title")
+        or soup.find("h1")
+        or soup.find("meta", property="og:title")
+    )
+    if title_tag:
+        title = title_tag.get("content", "") or title_tag.get_text(strip=True)
+    else:
+        title = "No title found"
+    content_tags = CONTENT_SELECTOR_COMPILED.select(soup)
+    content = (
+        " ".join(tag.get_text(separator=" ", strip=True) for tag in content_tags)
+        if content_tags
+        else soup.get_text(separator=" ", strip=True)
+    )
+    return title, content
 
 
 async def extract_url_bs4(url: str) -> dict:
@@ -22,6 +114,8 @@ async def extract_url_bs4(url: str) -> dict:
     Get the title and content of a URL using readability with a fallback to BeautifulSoup.
     Includes retry logic for network failures.
 
+    Text extraction uses selectolax when installed, BeautifulSoup otherwise.
+
     Args:
         url (str): The URL of the webpage to extract content from.
 
@@ -32,40 +126,21 @@ async def extract_url_bs4(url: str) -> dict:
         # Fetch the webpage content with retry
         html = await _fetch_url_html(url)
 
-        # Try extracting with readability
+        # Try extracting with readability. Parse the page once and hand the
+        # tree to Document: title() and each summary() pass would otherwise
+        # re-parse the raw HTML string.
         try:
-            doc = Document(html)
+            tree, _ = build_doc(html)
+            doc = Document(tree)
             title = doc.title() or "No title found"
             # Extract content as plain text by parsing the cleaned HTML
-            soup = BeautifulSoup(doc.summary(), "lxml")
-            content = soup.get_text(separator=" ", strip=True)
+            content = _html_text(doc.summary())
             if not content.strip():
                 raise ValueError("No content extracted by readability")
         except Exception as e:
-            logger.debug(f"Readability failed: {e}")
-            # Fallback to BeautifulSoup
-            soup = BeautifulSoup(html, "lxml")
-            # Extract title
-            title_tag = (
-                soup.find("title")
-                or soup.find("h1")
-                or soup.find("meta", property="og:title")
-            )
-            if title_tag:
-                title = title_tag.get("content", "") or title_tag.get_text(strip=True)
-            else:
-                title = "No title found"
-            # Extract content from common content tags
-            content_tags = soup.select(
-                'article, .content, .post, main, [role="main"], div[class*="content"], div[class*="article"]'
-            )
-            content = (
-                " ".join(
-                    tag.get_text(separator=" ", strip=True) for tag in content_tags
-                )
-                if content_tags
-                else soup.get_text(separator=" ", strip=True)
-            )
+            logger.debug("Readability failed: {}", e)
+            # Fallback to parsing the raw page
+            title, content = _extract_title_and_content(html)
             content = content.strip() or "No content found"
 
         return {
@@ -7,6 +7,8 @@ from content_core.common.retry import retry_url_api
 from content_core.config import ContentCoreConfig, get_default_config
 from content_core.logging import logger
 
+DOCKER_API_TIMEOUT = aiohttp.ClientTimeout(total=60)
+
 
 @retry_url_api()
 async def _fetch_url_crawl4ai_docker(url: str, api_url: str) -> dict:
@@ -15,7 +17,7 @@ async def _fetch_url_crawl4ai_docker(url: str, api_url: str) -> dict:
         async with session.post(
             f"{api_url.rstrip('/')}/crawl",
             json={"urls": [url], "priority": 10},
-            timeout=aiohttp.ClientTimeout(total=60),
+            timeout=DOCKER_API_TIMEOUT,
         ) as response:
             response.raise_for_status()
             data = await response.json()
@@ -93,7 +95,7 @@ async def extract_url_crawl4ai(url: str, config: Optional[ContentCoreConfig] = N
 
     try:
         if api_url:
-            logger.debug(f"Using Crawl4AI Docker API at: {api_url}")
+            logger.debug("Using Crawl4AI Docker API at: {}", api_url)
             return await _fetch_url_crawl4ai_docker(url, api_url)
         else:
             logger.debug("Using Crawl4AI local browser automation")
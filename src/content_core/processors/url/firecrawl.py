@@ -1,5 +1,6 @@
 import os
 
+from content_core.common.concurrency import host_semaphore
 from content_core.common.retry import retry_url_api
 from content_core.config import (
     ContentCoreConfig,
@@ -16,7 +17,7 @@ async def _fetch_url_firecrawl(url: str, config: ContentCoreConfig) -> dict:
 
     api_url = os.environ.get("FIRECRAWL_API_URL") or config.firecrawl_api_url
     if api_url != DEFAULT_FIRECRAWL_API_URL:
-        logger.debug(f"Using custom Firecrawl API URL: {api_url}")
+        logger.debug("Using custom Firecrawl API URL: {}", api_url)
 
     app = AsyncFirecrawlApp(
         api_key=os.environ.get("FIRECRAWL_API_KEY"),
@@ -30,7 +31,8 @@ async def _fetch_url_firecrawl(url: str, config: ContentCoreConfig) -> dict:
     if config.firecrawl_wait_for > 0:
         scrape_kwargs["wait_for"] = config.firecrawl_wait_for
 
-    scrape_result = await app.scrape(url, **scrape_kwargs)
+    async with host_semaphore(api_url):
+        scrape_result = await app.scrape(url, **scrape_kwargs)
     return {
         "title": scrape_result.metadata.title or "",
         "content": scrape_result.markdown or "",
@@ -2,6 +2,7 @@ import os
 
 import aiohttp
 
+from content_core.common.concurrency import host_semaphore
 from content_core.common.retry import retry_url_api
 from content_core.logging import logger
 
@@ -9,14 +10,14 @@ from content_core.logging import logger
 @retry_url_api()
 async def _fetch_url_jina(url: str, headers: dict) -> str:
     """Internal function to fetch URL content via Jina - wrapped with retry logic."""
-    async with aiohttp.ClientSession(trust_env=True) as session:
-        async with session.get(
-            f"https://r.jina.ai/{url}", headers=headers
-        ) as response:
-            # Raise ClientResponseError so retry logic can inspect status code
-            # (5xx and 429 will be retried, 4xx will not)
-            response.raise_for_status()
-            return await response.text()
+    jina_url = f"https://r.jina.ai/{url}"
+    async with host_semaphore(jina_url):
+        async with aiohttp.ClientSession(trust_env=True) as session:
+            async with session.get(jina_url, headers=headers) as response:
+                # Raise ClientResponseError so retry logic can inspect status code
+                # (5xx and 429 will be retried, 4xx will not)
+                response.raise_for_status()
+                return await response.text()
 
 
 async def extract_url_jina(url: str) -> dict:
@@ -39,12 +40,17 @@ async def extract_url_jina(url: str) -> dict:
             title = text[6:title_end].strip()
             content = text[title_end + 1 :].strip()
             logger.debug(
-                f"Processed url: {url}, found title: {title}, content: {content[:100]}..."
+                "Processed url: {}, found title: {}, content: {}...",
+                url,
+                title,
+                content[:100],
             )
             return {"title": title, "content": content}
         else:
             logger.debug(
-                f"Processed url: {url}, does not have Title prefix, returning full content: {text[:100]}..."
+                "Processed url: {}, does not have Title prefix, returning full content: {}...",
+                url,
+                text[:100],
             )
             return {"content": text}
     except Exception as e:
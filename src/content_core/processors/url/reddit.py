@@ -14,6 +14,8 @@ REDDIT_POST_PATTERN = re.compile(
     r"https?://(?:www\.|old\.|new\.)?reddit\.com/r/\w+/comments/\w+"
 )
 
+JSON_FETCH_TIMEOUT = aiohttp.ClientTimeout(total=15)
+
 
 def is_reddit_post(url: str) -> bool:
     """Check if a URL is a Reddit post."""
@@ -32,7 +34,7 @@ async def _fetch_reddit_json(url: str) -> dict:
         async with session.get(
             json_url,
             headers={"User-Agent": "content-core/2.0"},
-            timeout=aiohttp.ClientTimeout(total=15),
+            timeout=JSON_FETCH_TIMEOUT,
         ) as resp:
             resp.raise_for_status()
             return await resp.json()
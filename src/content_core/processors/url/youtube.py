@@ -1,10 +1,18 @@
+import asyncio
+import contextlib
+import copy
+import html
 import re
 import ssl
+import weakref
+from collections import OrderedDict
+from functools import lru_cache, partial
+from urllib.parse import urlsplit
 
-import aiohttp
+import certifi
+import httpx
 from bs4 import BeautifulSoup
 from youtube_transcript_api import YouTubeTranscriptApi  # type: ignore
-from youtube_transcript_api.formatters import TextFormatter  # type: ignore
 
 from content_core.common.exceptions import NoTranscriptFound
 from content_core.common.retry import retry_youtube
@@ -12,21 +20,139 @@ from content_core.config import ContentCoreConfig
 from content_core.logging import logger
 from content_core.common.state import ExtractionOutput
 
-ssl._create_default_https_context = ssl._create_unverified_context
+# Hostnames served by the YouTube processor (exact match, so look-alike
+# hosts such as notyoutube.com are not routed here)
+YOUTUBE_HOSTS = frozenset(
+    {
+        "youtube.com",
+        "www.youtube.com",
+        "m.youtube.com",
+        "music.youtube.com",
+        "youtu.be",
+    }
+)
+
+# Captures the 11-character video ID from the supported YouTube URL forms
+YOUTUBE_ID_RE = re.compile(
+    r"(?:https?://)?"  # Optional scheme
+    r"(?:www\.)?"  # Optional www.
+    r"(?:"
+    r"youtu\.be/"  # Shortened URL
+    r"|youtube\.com"  # Main URL
+    r"(?:"  # Group start
+    r"/embed/"  # Embed URL
+    r"|/v/"  # Older video URL
+    r"|/live/"  # Livestream URL (active or ended)
+    r"|/shorts/"  # Shorts URL
+    r"|/watch\?v="  # Standard watch URL
+    r"|/watch\?.+&v="  # Other watch URL
+    r")"  # Group end
+    r")"  # End main group
+    r"([\w-]{11})"  # 11 characters (YouTube video ID)
+)
+
+# The og:title meta tag as YouTube renders it (property before content)
+OG_TITLE_RE = re.compile(rb'<meta[^>]+property="og:title"[^>]+content="([^"]+)"')
+# Upper bound on the tag's length, used to catch tags split across chunks
+OG_TITLE_MAX_TAG_BYTES = 2048
+
+# Shared HTTP/2 client for title fetches, so repeated and concurrent fetches
+# are multiplexed over one keep-alive connection instead of paying a TCP + TLS
+# handshake each. httpx clients belong to one event loop, so one is kept per loop.
+_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+@lru_cache(maxsize=1)
+def _ssl_context() -> ssl.SSLContext:
+    """TLS context shared by every client, built once (loading the CA bundle is not free)."""
+    return ssl.create_default_context(cafile=certifi.where())
+
+
+def _get_client() -> httpx.AsyncClient:
+    """Get the shared HTTP client of the running event loop, creating it on first use."""
+    loop = asyncio.get_running_loop()
+    client = _clients.get(loop)
+    if client is None or client.is_closed:
+        client = _clients[loop] = httpx.AsyncClient(
+            http2=True,
+            verify=_ssl_context(),
+            trust_env=True,
+            follow_redirects=True,
+            timeout=httpx.Timeout(10.0),
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+        )
+    return client
+
+
+async def close_client() -> None:
+    """Close the shared HTTP client of the running event loop, if one was opened.
+
+    Public API: call it before a long-lived event loop finishes. The CLI and the
+    MCP server do this on shutdown; clients of loops that ended without it are
+    closed on the next title fetch (see ``_close_stale_clients``).
+    """
+    client = _clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
+
+
+async def _close_stale_clients() -> None:
+    """Close clients left behind by event loops that have since been closed.
+
+    Library callers that run each extraction in its own loop (``asyncio.run``)
+    never call ``close_client``. Their clients hold pooled connections that
+    reference the dead loop, which would also keep its entry in ``_clients``
+    alive, so they are dropped and closed here.
+    """
+    for loop in [loop for loop in _clients if loop.is_closed()]:
+        client = _clients.pop(loop, None)
+        if client is not None:
+            with contextlib.suppress(Exception):
+                await client.aclose()
+
+
+# Titles and transcripts seen by this process, reused when the same video is
+# extracted again (disable with youtube_cache=False)
+YOUTUBE_CACHE_SIZE = 256
+
+_title_cache: OrderedDict[str, str] = OrderedDict()
+_transcript_cache: OrderedDict[tuple, tuple] = OrderedDict()
+
+
+def is_youtube_url(url: str) -> bool:
+    """Check if a URL points to a YouTube host."""
+    # Cheap substring scan rejects most URLs before the comparatively slow urlsplit
+    if "youtu" not in url.lower():
+        return False
+    return (urlsplit(url).hostname or "") in YOUTUBE_HOSTS
 
 
 @retry_youtube()
 async def _fetch_video_title(video_id):
     """Internal function that fetches video title - wrapped with retry logic."""
     url = f"https://www.youtube.com/watch?v={video_id}"
-    async with aiohttp.ClientSession(trust_env=True) as session:
-        async with session.get(url) as response:
-            html = await response.text()
 
-    # BeautifulSoup doesn't support async operations
-    soup = BeautifulSoup(html, "html.parser")
+    # YouTube stores title in a meta tag in the page head. Stream the page and
+    # stop once the tag (or the end of the head) is reached, rather than
+    # downloading the whole watch page; a regex over the raw bytes finds the
+    # tag without building a DOM.
+    page = bytearray()
+    await _close_stale_clients()
+    async with _get_client().stream("GET", url) as response:
+        async for chunk in response.aiter_bytes():
+            # Rescan a little of the previous data in case the tag spans chunks
+            start = max(0, len(page) - OG_TITLE_MAX_TAG_BYTES)
+            page += chunk
+            match = OG_TITLE_RE.search(page, start)
+            if match:
+                return html.unescape(match.group(1).decode("utf-8", errors="replace"))
+            if page.find(b"</head>", start) != -1:
+                break
 
-    # YouTube stores title in a meta tag
+    # Fall back to a real parser for unexpected markup
+    soup = BeautifulSoup(bytes(page), "html.parser")
     title = soup.find("meta", property="og:title")["content"]
     return title
 
@@ -40,7 +166,7 @@ async def get_video_title(video_id):
         return None
 
 
-async def _extract_youtube_id(url):
+def _extract_youtube_id(url):
     """
     Extract the YouTube video ID from a given URL using regular expressions.
 
@@ -50,29 +176,7 @@ async def _extract_youtube_id(url):
     Returns:
     str: The extracted YouTube video ID or None if no valid ID is found.
     """
-    # Define a regular expression pattern to capture the YouTube video ID
-    youtube_regex = (
-        r"(?:https?://)?"  # Optional scheme
-        r"(?:www\.)?"  # Optional www.
-        r"(?:"
-        r"youtu\.be/"  # Shortened URL
-        r"|youtube\.com"  # Main URL
-        r"(?:"  # Group start
-        r"/embed/"  # Embed URL
-        r"|/v/"  # Older video URL
-        r"|/live/"  # Livestream URL (active or ended)
-        r"|/shorts/"  # Shorts URL
-        r"|/watch\?v="  # Standard watch URL
-        r"|/watch\?.+&v="  # Other watch URL
-        r")"  # Group end
-        r")"  # End main group
-        r"([\w-]{11})"  # 11 characters (YouTube video ID)
-    )
-
-    # Search the URL for the pattern
-    match = re.search(youtube_regex, url)
-
-    # Return the video ID if a match is found
+    match = YOUTUBE_ID_RE.search(url)
     return match.group(1) if match else None
 
 
@@ -126,6 +230,21 @@ async def get_best_transcript(video_id, preferred_langs=["en", "es", "pt"]):
         return None
 
 
+def _select_caption(captions, languages):
+    """
+    Pick a caption track from a {code: caption} mapping.
+
+    Preferred languages are tried in order, a manual track before the
+    auto-generated ("a.<lang>") one; otherwise the first available track is used.
+    """
+    for lang in languages:
+        for code in (lang, f"a.{lang}"):
+            caption = captions.get(code)
+            if caption is not None:
+                return caption
+    return next(iter(captions.values()), None)
+
+
 @retry_youtube()
 def _fetch_transcript_pytubefix(url, languages=["en", "es", "pt"]):
     """Internal function that fetches transcript via pytubefix - wrapped with retry logic."""
@@ -133,26 +252,18 @@ def _fetch_transcript_pytubefix(url, languages=["en", "es", "pt"]):
 
     # pytubefix uses requests which respects HTTP_PROXY env var
     yt = YouTube(url)
-    logger.debug(f"Captions: {yt.captions}")
 
-    # Try to get captions in the preferred languages
-    if yt.captions:
-        for lang in languages:
-            if lang in yt.captions:
-                caption = yt.captions[lang]
-                break
-            elif f"a.{lang}" in yt.captions:
-                caption = yt.captions[f"a.{lang}"]
-                break
-        else:  # No preferred language found, use the first available
-            caption_key = list(yt.captions.keys())[0]
-            caption = yt.captions[caption_key.code]
+    # yt.captions rebuilds its Caption objects on every access, so read it once
+    captions = {caption.code: caption for caption in yt.captions}
+    logger.debug("Captions: {}", list(captions))
 
-        srt_captions = caption.generate_srt_captions()
-        txt_captions = caption.generate_txt_captions()
-        return txt_captions, srt_captions
+    caption = _select_caption(captions, languages)
+    if caption is None:
+        return None, None
 
-    return None, None
+    srt_captions = caption.generate_srt_captions()
+    txt_captions = caption.generate_txt_captions()
+    return txt_captions, srt_captions
 
 
 def extract_transcript_pytubefix(url, languages=["en", "es", "pt"]):
@@ -164,19 +275,34 @@ def extract_transcript_pytubefix(url, languages=["en", "es", "pt"]):
         return None, None
 
 
-async def extract_youtube(url: str, config: ContentCoreConfig) -> ExtractionOutput:
-    """Extract transcript from a YouTube video."""
-    logger.debug(f"Extracting transcript from URL: {url}")
-    languages = config.youtube_languages
+def _cache_put(cache: OrderedDict, key, value) -> None:
+    """Store a value in a bounded LRU cache, evicting the oldest entry."""
+    cache[key] = value
+    if len(cache) > YOUTUBE_CACHE_SIZE:
+        cache.popitem(last=False)
 
-    video_id = await _extract_youtube_id(url)
 
-    try:
-        title = await get_video_title(video_id)
-    except Exception as e:
-        logger.critical(f"Failed to get video title for video_id: {video_id}")
-        logger.exception(e)
-        title = ""
+async def _get_title(video_id, use_cache):
+    """Get the video title, from the cache when allowed."""
+    if use_cache and video_id in _title_cache:
+        _title_cache.move_to_end(video_id)
+        return _title_cache[video_id]
+
+    title = await get_video_title(video_id)
+    if use_cache and title:
+        _cache_put(_title_cache, video_id, title)
+    return title
+
+
+async def _get_transcript(url, video_id, languages, use_cache):
+    """Get the formatted and raw transcript, from the cache when allowed."""
+    key = (video_id, tuple(languages))
+    if use_cache and key in _transcript_cache:
+        logger.debug("Using cached transcript for video_id: {}", video_id)
+        _transcript_cache.move_to_end(key)
+        formatted_content, transcript_raw = _transcript_cache[key]
+        # Callers get the raw segments in their output metadata, keep the cache private
+        return formatted_content, copy.deepcopy(transcript_raw)
 
     formatted_content = ""
     transcript_raw = None
@@ -185,10 +311,10 @@ async def extract_youtube(url: str, config: ContentCoreConfig) -> ExtractionOutp
     transcript = await get_best_transcript(video_id, languages)
     if transcript:
         logger.debug("Found transcript via youtube-transcript-api")
-        formatter = TextFormatter()
 
         try:
-            formatted_content = formatter.format_transcript(transcript)
+            # Same output as youtube-transcript-api's TextFormatter
+            formatted_content = "\n".join([s.text for s in transcript.snippets])
         except Exception as e:
             logger.error(f"Failed to format transcript for video_id: {video_id}")
             logger.exception(e)
@@ -205,7 +331,41 @@ async def extract_youtube(url: str, config: ContentCoreConfig) -> ExtractionOutp
     # Fallback: pytubefix
     if not formatted_content:
         logger.debug("Falling back to pytubefix for transcript extraction")
-        formatted_content, transcript_raw = extract_transcript_pytubefix(url, languages)
+        # pytubefix is blocking (network + caption parsing), keep it off the loop
+        formatted_content, transcript_raw = await asyncio.get_event_loop().run_in_executor(
+            None, partial(extract_transcript_pytubefix, url, languages)
+        )
+
+    if use_cache and formatted_content:
+        _cache_put(
+            _transcript_cache, key, (formatted_content, copy.deepcopy(transcript_raw))
+        )
+    return formatted_content, transcript_raw
+
+
+async def extract_youtube(url: str, config: ContentCoreConfig) -> ExtractionOutput:
+    """Extract transcript from a YouTube video."""
+    logger.debug("Extracting transcript from URL: {}", url)
+    languages = config.youtube_languages
+    use_cache = config.youtube_cache
+
+    video_id = _extract_youtube_id(url)
+
+    # Title and transcript are independent requests, so fetch them together
+    title, transcript = await asyncio.gather(
+        _get_title(video_id, use_cache),
+        _get_transcript(url, video_id, languages, use_cache),
+        return_exceptions=True,
+    )
+    if isinstance(title, Exception):
+        logger.critical(f"Failed to get video title for video_id: {video_id}")
+        logger.exception(title)
+        title = ""
+    if isinstance(transcript, Exception):
+        logger.error(f"Failed to get transcript for video_id: {video_id}")
+        logger.exception(transcript)
+        transcript = ("", None)
+    formatted_content, transcript_raw = transcript
 
     return ExtractionOutput(
         content=formatted_content or "",
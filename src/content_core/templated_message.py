@@ -1,3 +1,4 @@
+from functools import lru_cache
 from typing import Dict, Optional, Union
 
 from ai_prompter import Prompter
@@ -24,6 +25,29 @@ class TemplatedMessageInput(BaseModel):
     )
 
 
+@lru_cache(maxsize=32)
+def _text_prompter(template_text: str) -> Prompter:
+    """Build a Prompter for inline template text, compiled once per process."""
+    return Prompter(template_text=template_text)
+
+
+def _get_prompter(
+    prompt_template: Optional[str], template_text: Optional[str]
+) -> Prompter:
+    """
+    Get a Prompter for a template name or inline template text.
+
+    Prompter builds a Jinja environment (including a prompt-directory search)
+    and compiles the template on construction. Inline text templates always
+    compile to the same result, so they are cached; named templates are
+    resolved on every call since their lookup depends on the working
+    directory and PROMPTS_PATH.
+    """
+    if template_text is not None and prompt_template is None:
+        return _text_prompter(template_text)
+    return Prompter(prompt_template=prompt_template, template_text=template_text)
+
+
 @retry_llm()
 async def _execute_llm_call(model: LanguageModel, msgs: list) -> str:
     """Internal function to execute LLM call - wrapped with retry logic."""
@@ -50,16 +74,14 @@ async def templated_message(
 
     msgs = []
     if input.system_prompt_template or input.system_prompt_text:
-        system_prompt = Prompter(
-            prompt_template=input.system_prompt_template,
-            template_text=input.system_prompt_text,
+        system_prompt = _get_prompter(
+            input.system_prompt_template, input.system_prompt_text
         ).render(data=input.data)
         msgs.append({"role": "system", "content": system_prompt})
 
     if input.user_prompt_template or input.user_prompt_text:
-        user_prompt = Prompter(
-            prompt_template=input.user_prompt_template,
-            template_text=input.user_prompt_text,
+        user_prompt = _get_prompter(
+            input.user_prompt_template, input.user_prompt_text
         ).render(data=input.data)
         msgs.append({"role": "user", "content": user_prompt})
 
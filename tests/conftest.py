@@ -1,13 +1,45 @@
 """Root conftest — shared fixtures and markers for all tests."""
+import os
 from pathlib import Path
 
 import pytest
 
+from content_core.common.circuit_breaker import reset_engine_breakers
+
+INPUT_CONTENT_DIR = Path(__file__).parent / "input_content"
+
 
 @pytest.fixture
 def fixtures_dir():
     """Path to the test input files directory."""
-    return Path(__file__).parent / "input_content"
+    return INPUT_CONTENT_DIR
+
+
+@pytest.fixture(scope="session")
+def sample_file():
+    """Return the path of a test input file, skipping the test if it is missing."""
+    # One directory listing per session instead of a stat per lookup
+    try:
+        with os.scandir(INPUT_CONTENT_DIR) as entries:
+            available = frozenset(entry.name for entry in entries)
+    except FileNotFoundError:
+        available = frozenset()
+
+    def _get(name: str) -> Path:
+        path = INPUT_CONTENT_DIR / name
+        if name not in available:
+            pytest.skip(f"Fixture file not found: {path}")
+        return path
+
+    return _get
+
+
+@pytest.fixture(autouse=True)
+def _closed_engine_breakers():
+    """Start every test with closed URL engine circuit breakers."""
+    reset_engine_breakers()
+    yield
+    reset_engine_breakers()
 
 
 def pytest_collection_modifyitems(config, items):
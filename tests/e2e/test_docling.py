@@ -1,25 +1,17 @@
 """E2E tests for Docling extraction — require docling installed and may download large models."""
-from pathlib import Path
-
 import pytest
 
 from content_core.config import ContentCoreConfig
 from content_core.extraction import extract_content
 
-pytestmark = pytest.mark.e2e_heavy
-
-FIXTURE_PATH = Path(__file__).parent.parent / "input_content"
+pytestmark = [pytest.mark.e2e_heavy, pytest.mark.xdist_group("docling")]
 
 
 @pytest.fixture
-def pdf_file():
-    path = FIXTURE_PATH / "file.pdf"
-    if not path.exists():
-        pytest.skip(f"Fixture file not found: {path}")
-    return str(path)
+def pdf_file(sample_file):
+    return str(sample_file("file.pdf"))
 
 
-@pytest.mark.asyncio
 async def test_docling_pdf_extraction(pdf_file):
     """Test basic Docling PDF extraction with default settings."""
     config = ContentCoreConfig(document_engine="docling")
@@ -30,7 +22,6 @@ async def test_docling_pdf_extraction(pdf_file):
     assert "Buenos Aires" in result.content
 
 
-@pytest.mark.asyncio
 async def test_docling_with_formulas(pdf_file):
     """Test Docling extraction with formula enrichment enabled."""
     config = ContentCoreConfig(
@@ -43,7 +34,6 @@ async def test_docling_with_formulas(pdf_file):
     assert len(result.content) > 0
 
 
-@pytest.mark.asyncio
 async def test_docling_with_vision(pdf_file):
     """Test Docling extraction with vision enrichment enabled (image description + charts)."""
     config = ContentCoreConfig(
@@ -1,44 +1,31 @@
 """E2E tests for media extraction — require OpenAI STT API."""
-from pathlib import Path
-
 import pytest
 
-pytestmark = pytest.mark.e2e
+pytestmark = [pytest.mark.e2e, pytest.mark.xdist_group("stt")]
+from content_core.common.state import ExtractionOutput
 from content_core.extraction import extract_content
 
 
-@pytest.fixture
-def fixture_path():
-    """Provides the path to the directory containing test input files."""
-    return Path(__file__).parent.parent / "input_content"
-
-
-@pytest.mark.asyncio
-async def test_extract_content_from_mp3(fixture_path):
+async def test_extract_content_from_mp3(sample_file):
     """Tests content extraction (transcript) from an MP3 file."""
-    mp3_file = fixture_path / "file.mp3"
-    if not mp3_file.exists():
-        pytest.skip(f"Fixture file not found: {mp3_file}")
+    mp3_file = sample_file("file.mp3")
 
     result = await extract_content(file_path=str(mp3_file))
 
-    assert hasattr(result, "source_type")
+    assert isinstance(result, ExtractionOutput)
     assert result.source_type == "file"
     assert result.title == "file.mp3"
     assert result.identified_type.startswith("audio/")
     assert "welcome" in result.content.lower()
 
 
-@pytest.mark.asyncio
-async def test_extract_content_from_mp4(fixture_path):
+async def test_extract_content_from_mp4(sample_file):
     """Tests content extraction (transcript) from an MP4 file."""
-    mp4_file = fixture_path / "file.mp4"
-    if not mp4_file.exists():
-        pytest.skip(f"Fixture file not found: {mp4_file}")
+    mp4_file = sample_file("file.mp4")
 
     result = await extract_content(file_path=str(mp4_file))
 
-    assert hasattr(result, "source_type")
+    assert isinstance(result, ExtractionOutput)
     assert result.source_type == "file"
     assert result.title == "file.mp4"
     assert result.identified_type.startswith("video/")
@@ -1,11 +1,10 @@
 """E2E tests for YouTube extraction — require network access."""
 import pytest
 
-pytestmark = pytest.mark.e2e
+pytestmark = [pytest.mark.e2e, pytest.mark.xdist_group("youtube")]
 from content_core.extraction import extract_content
 
 
-@pytest.mark.asyncio
 async def test_extract_content_from_youtube_url():
     """Tests extracting content from a YouTube URL."""
     youtube_url = "https://www.youtube.com/watch?v=pBy1zgt0XPc"
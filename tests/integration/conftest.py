@@ -1,18 +1,36 @@
 """Pytest configuration for integration tests."""
 import asyncio
 import gc
+from pathlib import Path
 
 import pytest
+import pytest_asyncio
 
+INTEGRATION_DIR = Path(__file__).parent
 
-@pytest.fixture(scope="function", autouse=True)
+
+def pytest_collection_modifyitems(items):
+    """Run all async integration tests in one session-wide event loop.
+
+    Extraction warms up module-level state (HTTP clients, per-loop caches) that
+    is keyed by event loop, so sharing a loop lets tests reuse it instead of
+    rebuilding it for every test.
+    """
+    session_loop = pytest.mark.asyncio(loop_scope="session")
+    for item in items:
+        if INTEGRATION_DIR in item.path.parents and pytest_asyncio.is_async_test(item):
+            item.add_marker(session_loop, append=False)
+
+
+@pytest_asyncio.fixture(loop_scope="session", autouse=True)
 async def cleanup_after_test():
     """Cleanup fixture to ensure proper resource cleanup after each test."""
     yield
     # Force garbage collection to clean up any remaining resources
     gc.collect()
-    # Give a small delay for async cleanup
-    await asyncio.sleep(0.1)
+    # The loop outlives the test, so one iteration is enough to run any
+    # close callbacks scheduled by the collected resources
+    await asyncio.sleep(0)
 
 
 @pytest.fixture(scope="session")
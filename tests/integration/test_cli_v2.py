@@ -1,5 +1,4 @@
 """Tests for the new unified CLI."""
-import pytest
 from click.testing import CliRunner
 
 from content_core.cli import cli
@@ -53,11 +52,9 @@ class TestCLI:
         result = runner.invoke(cli, ["extract", "--engine", "simple", "Hello"])
         assert result.exit_code == 0
 
-    def test_extract_file_input(self, fixtures_dir):
+    def test_extract_file_input(self, sample_file):
         """Test extracting from a local file."""
-        md_file = fixtures_dir / "file.md"
-        if not md_file.exists():
-            pytest.skip("Fixture not found")
+        md_file = sample_file("file.md")
         runner = CliRunner()
         result = runner.invoke(cli, ["extract", str(md_file)])
         assert result.exit_code == 0
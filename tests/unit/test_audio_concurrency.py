@@ -22,36 +22,22 @@ class TestAudioConcurrencyConfig:
         cfg = ContentCoreConfig()
         assert cfg.audio_concurrency == 5
 
-    def test_invalid_concurrency_zero(self):
-        """Test that zero concurrency raises validation error"""
+    @pytest.mark.parametrize("value", [0, -1, 15])
+    def test_invalid_concurrency(self, value):
+        """Test that concurrency outside 1-10 raises validation error"""
         with pytest.raises(ValidationError):
-            ContentCoreConfig(audio_concurrency=0)
+            ContentCoreConfig(audio_concurrency=value)
 
-    def test_invalid_concurrency_negative(self):
-        """Test that negative concurrency raises validation error"""
-        with pytest.raises(ValidationError):
-            ContentCoreConfig(audio_concurrency=-1)
-
-    def test_invalid_concurrency_too_high(self):
-        """Test that concurrency > 10 raises validation error"""
-        with pytest.raises(ValidationError):
-            ContentCoreConfig(audio_concurrency=15)
-
-    def test_valid_concurrency_boundary_low(self):
-        """Test that concurrency of 1 is accepted"""
-        cfg = ContentCoreConfig(audio_concurrency=1)
-        assert cfg.audio_concurrency == 1
-
-    def test_valid_concurrency_boundary_high(self):
-        """Test that concurrency of 10 is accepted"""
-        cfg = ContentCoreConfig(audio_concurrency=10)
-        assert cfg.audio_concurrency == 10
+    @pytest.mark.parametrize("value", [1, 10])
+    def test_valid_concurrency_boundaries(self, value):
+        """Test that the boundary values 1 and 10 are accepted"""
+        cfg = ContentCoreConfig(audio_concurrency=value)
+        assert cfg.audio_concurrency == value
 
 
 class TestParallelTranscription:
     """Test parallel transcription functionality"""
 
-    @pytest.mark.asyncio
     async def test_semaphore_limits_concurrency(self):
         """Test that semaphore correctly limits concurrent executions"""
         max_concurrent = 0
@@ -87,7 +73,6 @@ class TestParallelTranscription:
         assert len(results) == 10
         assert all(isinstance(r, str) for r in results)
 
-    @pytest.mark.asyncio
     async def test_results_maintain_order(self):
         """Test that transcription results maintain correct order despite parallel execution"""
         # Mock model that returns different results based on input
@@ -117,7 +102,6 @@ class TestParallelTranscription:
         expected = [f"transcript_of_audio_{i}.mp3" for i in range(5)]
         assert results == expected
 
-    @pytest.mark.asyncio
     async def test_single_segment_audio(self):
         """Test that single segment audio works correctly"""
         mock_model = MagicMock()
@@ -129,7 +113,6 @@ class TestParallelTranscription:
         assert result == "single_transcript"
         mock_model.atranscribe.assert_called_once_with("single_audio.mp3")
 
-    @pytest.mark.asyncio
     async def test_concurrency_of_one_behaves_serially(self):
         """Test that concurrency of 1 processes segments serially"""
         call_times = []
@@ -161,7 +144,6 @@ class TestParallelTranscription:
             time_diff = call_times[1] - call_times[0]
             assert time_diff >= 0.04  # Allow some tolerance for timing
 
-    @pytest.mark.asyncio
     async def test_empty_audio_file_list(self):
         """Test handling of empty audio file list"""
         tasks = []
@@ -172,7 +154,6 @@ class TestParallelTranscription:
 class TestErrorHandling:
     """Test error handling in parallel transcription"""
 
-    @pytest.mark.asyncio
     async def test_single_failure_doesnt_stop_others(self):
         """Test that one failed transcription doesn't prevent others from completing."""
         call_count = 0
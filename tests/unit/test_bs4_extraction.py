@@ -0,0 +1,99 @@
+"""Unit tests for content_core.processors.url.bs4."""
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from content_core.processors.url import bs4 as bs4_module
+from content_core.processors.url.bs4 import extract_url_bs4
+
+ARTICLE_HTML = """
+<html>
+<head><title>Article Title</title><script>var tracking = 1;</script></head>
+<body>
+<nav>Home | About</nav>
+<article>
+<h1>Heading</h1>
+<p>First paragraph of the article with enough words to be kept by readability.
+It keeps going for a while so the scoring treats it as the main content.</p>
+<p>Second paragraph, also long enough to count as real content for the page,
+with commas, sentences, and other signals readability looks for.</p>
+</article>
+</body>
+</html>
+"""
+
+NO_ARTICLE_HTML = """
+<html>
+<head><meta property="og:title" content="OG Title"></head>
+<body><div class="main-content">Short body text</div><style>p {}</style></body>
+</html>
+"""
+
+PARSERS = [
+    pytest.param(True, id="selectolax"),
+    pytest.param(False, id="beautifulsoup"),
+]
+
+
+@pytest.fixture(params=PARSERS)
+def parser(request, monkeypatch):
+    """Run each test with both the selectolax and BeautifulSoup code paths."""
+    if request.param and not bs4_module.SELECTOLAX_AVAILABLE:
+        pytest.skip("selectolax not installed")
+    monkeypatch.setattr(bs4_module, "SELECTOLAX_AVAILABLE", request.param)
+    return request.param
+
+
+def _mock_fetch(html):
+    return patch(
+        "content_core.processors.url.bs4._fetch_url_html",
+        new_callable=AsyncMock,
+        return_value=html,
+    )
+
+
+class TestExtractUrlBs4:
+    async def test_readability_path(self, parser):
+        with _mock_fetch(ARTICLE_HTML):
+            result = await extract_url_bs4("https://example.com")
+
+        assert result["title"] == "Article Title"
+        assert "First paragraph" in result["content"]
+        assert "Second paragraph" in result["content"]
+        assert "tracking" not in result["content"]
+        assert "<p>" not in result["content"]
+
+    async def test_page_parsed_once_for_readability(self, parser):
+        with _mock_fetch(ARTICLE_HTML), patch(
+            "content_core.processors.url.bs4.build_doc",
+            wraps=bs4_module.build_doc,
+        ) as mock_build_doc, patch(
+            "readability.readability.build_doc",
+            side_effect=AssertionError("readability re-parsed the raw HTML"),
+        ):
+            result = await extract_url_bs4("https://example.com")
+
+        mock_build_doc.assert_called_once_with(ARTICLE_HTML)
+        assert "First paragraph" in result["content"]
+
+    async def test_fallback_path_uses_content_selector(self, parser):
+        with _mock_fetch(NO_ARTICLE_HTML), patch(
+            "content_core.processors.url.bs4.Document",
+            side_effect=ValueError("readability failed"),
+        ):
+            result = await extract_url_bs4("https://example.com")
+
+        assert result["title"] == "OG Title"
+        assert result["content"] == "Short body text"
+
+    async def test_fetch_error_returns_error_dict(self, parser):
+        with patch(
+            "content_core.processors.url.bs4._fetch_url_html",
+            new_callable=AsyncMock,
+            side_effect=ValueError("boom"),
+        ):
+            result = await extract_url_bs4("https://example.com")
+
+        assert result["title"] == "Error"
+        assert "boom" in result["content"]
@@ -1,10 +1,13 @@
 """Unit tests for CLI — mocked, no I/O."""
+import subprocess
+import sys
 from unittest.mock import AsyncMock, patch
 
 import pytest
 from click.testing import CliRunner
 
 from content_core.cli import cli, _build_input, _get_content
+from content_core.common.state import ExtractionOutput
 
 
 class TestBuildInput:
@@ -46,8 +49,6 @@ class TestExtractCommand:
 
     def test_extract_calls_extract_content(self):
         runner = CliRunner()
-        from content_core.common.state import ExtractionOutput
-
         with patch(
             "content_core.extraction.extract_content",
             new_callable=AsyncMock,
@@ -59,8 +60,6 @@ class TestExtractCommand:
 
     def test_extract_json_format(self):
         runner = CliRunner()
-        from content_core.common.state import ExtractionOutput
-
         with patch(
             "content_core.extraction.extract_content",
             new_callable=AsyncMock,
@@ -72,8 +71,6 @@ class TestExtractCommand:
 
     def test_extract_with_engine_passes_config(self):
         runner = CliRunner()
-        from content_core.common.state import ExtractionOutput
-
         with patch(
             "content_core.extraction.extract_content",
             new_callable=AsyncMock,
@@ -88,8 +85,6 @@ class TestExtractCommand:
 
     def test_extract_with_engine_file_routes_to_document_engine(self, tmp_path):
         runner = CliRunner()
-        from content_core.common.state import ExtractionOutput
-
         f = tmp_path / "test.pdf"
         f.write_bytes(b"%PDF-1.4 fake")
         with patch(
@@ -107,8 +102,6 @@ class TestExtractCommand:
 
     def test_extract_without_engine_no_config(self):
         runner = CliRunner()
-        from content_core.common.state import ExtractionOutput
-
         with patch(
             "content_core.extraction.extract_content",
             new_callable=AsyncMock,
@@ -122,8 +115,6 @@ class TestExtractCommand:
 
     def test_extract_with_formulas_flag(self):
         runner = CliRunner()
-        from content_core.common.state import ExtractionOutput
-
         with patch(
             "content_core.extraction.extract_content",
             new_callable=AsyncMock,
@@ -137,8 +128,6 @@ class TestExtractCommand:
 
     def test_extract_with_pictures_flag(self):
         runner = CliRunner()
-        from content_core.common.state import ExtractionOutput
-
         with patch(
             "content_core.extraction.extract_content",
             new_callable=AsyncMock,
@@ -152,8 +141,6 @@ class TestExtractCommand:
 
     def test_extract_with_no_ocr_flag(self):
         runner = CliRunner()
-        from content_core.common.state import ExtractionOutput
-
         with patch(
             "content_core.extraction.extract_content",
             new_callable=AsyncMock,
@@ -245,3 +232,28 @@ class TestConfigCommands:
         assert "llm_provider" in result.output
         assert "url_engine" in result.output
         assert "Available keys" in result.output
+
+
+class TestStartupImports:
+    """Importing the CLI must not load the extraction stack."""
+
+    def test_cli_import_is_lazy(self):
+        code = (
+            "import sys, content_core.cli; "
+            "print('content_core.extraction' in sys.modules)"
+        )
+        out = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        assert out.stdout.strip() == "False"
+
+    def test_package_exports_resolve(self):
+        import content_core
+        from content_core.extraction import extract_content
+
+        assert content_core.extract_content is extract_content
+        assert content_core.extract is extract_content
+        assert set(content_core.__all__) <= set(dir(content_core))
+        missing = "not_a_real_export"
+        with pytest.raises(AttributeError):
+            getattr(content_core, missing)
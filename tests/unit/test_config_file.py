@@ -3,6 +3,7 @@ from unittest.mock import patch
 
 import pytest
 
+from content_core import config as config_module
 from content_core.config import (
     ContentCoreConfig,
     config_set,
@@ -68,6 +69,14 @@ class TestConfigSet:
         assert data["docling_vision"] is True
         assert data["docling_ocr"] is False
 
+    @pytest.mark.parametrize(
+        "raw, expected",
+        [("true", True), ("Yes", True), ("on", True), ("1", True), ("false", False), ("off", False)],
+    )
+    def test_set_bool_spellings(self, config_dir, raw, expected):
+        config_set("youtube_cache", raw)
+        assert config_list()["youtube_cache"] is expected
+
     def test_set_invalid_key_raises(self, config_dir):
         with pytest.raises(ValueError, match="Unknown config key"):
             config_set("nonexistent_key", "value")
@@ -110,3 +119,27 @@ class TestConfigPrecedence:
     def test_default_when_no_toml(self, config_dir):
         cfg = ContentCoreConfig()
         assert cfg.llm_provider == "openai"
+
+
+class TestConfigFileCache:
+    def test_unchanged_file_parsed_once(self, config_dir):
+        _write_config_file({"llm_provider": "anthropic"})
+        with patch.object(
+            config_module.tomllib, "load", wraps=config_module.tomllib.load
+        ) as mock_load:
+            ContentCoreConfig()
+            ContentCoreConfig()
+            assert config_list()["llm_provider"] == "anthropic"
+        assert mock_load.call_count == 1
+
+    def test_external_edit_is_picked_up(self, config_dir):
+        _, config_file = config_dir
+        _write_config_file({"llm_provider": "anthropic"})
+        assert ContentCoreConfig().llm_provider == "anthropic"
+        config_file.write_text('llm_provider = "google-genai"\n')
+        assert ContentCoreConfig().llm_provider == "google-genai"
+
+    def test_returned_data_is_a_copy(self, config_dir):
+        _write_config_file({"llm_provider": "anthropic"})
+        config_list()["llm_provider"] = "mutated"
+        assert config_list()["llm_provider"] == "anthropic"
@@ -1,6 +1,5 @@
 """Tests for ContentCoreConfig (pydantic-settings based config v2)."""
 import os
-from unittest.mock import patch
 
 import pytest
 from pydantic import ValidationError
@@ -13,126 +12,75 @@ from content_core.config import (
 
 
 @pytest.fixture(autouse=True)
-def _isolate_config_file(tmp_path):
-    """Point CONFIG_FILE to a non-existent temp path so the developer's
-    real ~/.content-core/config.toml never influences test results."""
-    fake_config_file = tmp_path / "config.toml"
-    with (
-        patch("content_core.config.CONFIG_DIR", tmp_path),
-        patch("content_core.config.CONFIG_FILE", fake_config_file),
-    ):
-        yield
-
-
-@pytest.fixture(autouse=True)
-def _clean_singleton():
-    """Ensure singleton is reset before and after each test."""
-    reset_default_config()
-    yield
-    reset_default_config()
-
-
-@pytest.fixture(autouse=True)
-def _clean_env(monkeypatch):
-    """Remove any CCORE_ env vars that might leak between tests."""
+def _isolated_config(tmp_path, monkeypatch):
+    """Give each test a clean config.
+
+    CONFIG_FILE points to a non-existent temp path so the developer's real
+    ~/.content-core/config.toml never influences results, and CCORE_ env vars
+    are removed.
+    """
+    monkeypatch.setattr("content_core.config.CONFIG_DIR", tmp_path)
+    monkeypatch.setattr("content_core.config.CONFIG_FILE", tmp_path / "config.toml")
     for key in list(os.environ):
         if key.startswith("CCORE_"):
             monkeypatch.delenv(key, raising=False)
 
 
-class TestDefaults:
-    """Verify all default values are set correctly."""
-
-    def test_document_engine_default(self):
-        cfg = ContentCoreConfig()
-        assert cfg.document_engine == "auto"
-
-    def test_url_engine_default(self):
-        cfg = ContentCoreConfig()
-        assert cfg.url_engine == "auto"
-
-    def test_audio_provider_default(self):
-        cfg = ContentCoreConfig()
-        assert cfg.audio_provider == "openai"
-
-    def test_audio_model_default(self):
-        cfg = ContentCoreConfig()
-        assert cfg.audio_model is None
-
-    def test_audio_concurrency_default(self):
-        cfg = ContentCoreConfig()
-        assert cfg.audio_concurrency == 3
-
-    def test_firecrawl_api_url_default(self):
-        cfg = ContentCoreConfig()
-        assert cfg.firecrawl_api_url == "https://api.firecrawl.dev"
-
-    def test_llm_provider_default(self):
-        cfg = ContentCoreConfig()
-        assert cfg.llm_provider == "openai"
-
-    def test_llm_model_default(self):
-        cfg = ContentCoreConfig()
-        assert cfg.llm_model == "gpt-4o-mini"
-
-    def test_summary_model_default(self):
-        cfg = ContentCoreConfig()
-        assert cfg.summary_model is None
-
-    def test_stt_provider_default(self):
-        cfg = ContentCoreConfig()
-        assert cfg.stt_provider == "openai"
+# field, expected default
+DEFAULT_CASES = [
+    ("document_engine", "auto"),
+    ("url_engine", "auto"),
+    ("audio_provider", "openai"),
+    ("audio_model", None),
+    ("audio_concurrency", 3),
+    ("firecrawl_api_url", "https://api.firecrawl.dev"),
+    ("llm_provider", "openai"),
+    ("llm_model", "gpt-4o-mini"),
+    ("summary_model", None),
+    ("stt_provider", "openai"),
+    ("stt_model", "whisper-1"),
+    ("stt_timeout", 3600),
+    ("youtube_languages", ["en", "es", "pt"]),
+    ("docling_output_format", "markdown"),
+    ("extraction_cache", False),
+    ("docling_max_file_mb", 0),
+]
+
+# field, override value (as a CCORE_ env var it is passed as str(value))
+OVERRIDE_CASES = [
+    ("url_engine", "firecrawl"),
+    ("audio_concurrency", 7),
+    ("llm_model", "claude-sonnet"),
+]
 
-    def test_stt_model_default(self):
-        cfg = ContentCoreConfig()
-        assert cfg.stt_model == "whisper-1"
-
-    def test_stt_timeout_default(self):
-        cfg = ContentCoreConfig()
-        assert cfg.stt_timeout == 3600
 
-    def test_youtube_languages_default(self):
-        cfg = ContentCoreConfig()
-        assert cfg.youtube_languages == ["en", "es", "pt"]
+class TestDefaults:
+    """Verify all default values are set correctly."""
 
-    def test_docling_output_format_default(self):
+    @pytest.mark.parametrize("field, expected", DEFAULT_CASES)
+    def test_default(self, field, expected):
         cfg = ContentCoreConfig()
-        assert cfg.docling_output_format == "markdown"
+        assert getattr(cfg, field) == expected
 
 
 class TestConstructorOverride:
     """Verify constructor arguments override defaults."""
 
-    def test_url_engine_override(self):
-        cfg = ContentCoreConfig(url_engine="firecrawl")
-        assert cfg.url_engine == "firecrawl"
-
-    def test_audio_concurrency_override(self):
-        cfg = ContentCoreConfig(audio_concurrency=5)
-        assert cfg.audio_concurrency == 5
-
-    def test_llm_model_override(self):
-        cfg = ContentCoreConfig(llm_model="gpt-4o")
-        assert cfg.llm_model == "gpt-4o"
+    @pytest.mark.parametrize("field, value", OVERRIDE_CASES)
+    def test_constructor_override(self, field, value):
+        cfg = ContentCoreConfig(**{field: value})
+        assert getattr(cfg, field) == value
 
 
 class TestEnvVarOverride:
     """Verify environment variables override defaults."""
 
-    def test_url_engine_from_env(self, monkeypatch):
-        monkeypatch.setenv("CCORE_URL_ENGINE", "jina")
-        cfg = ContentCoreConfig()
-        assert cfg.url_engine == "jina"
-
-    def test_audio_concurrency_from_env(self, monkeypatch):
-        monkeypatch.setenv("CCORE_AUDIO_CONCURRENCY", "7")
+    @pytest.mark.parametrize("field, value", OVERRIDE_CASES)
+    def test_env_override(self, monkeypatch, field, value):
+        monkeypatch.setenv(f"CCORE_{field.upper()}", str(value))
         cfg = ContentCoreConfig()
-        assert cfg.audio_concurrency == 7
+        assert getattr(cfg, field) == value
 
-    def test_llm_model_from_env(self, monkeypatch):
-        monkeypatch.setenv("CCORE_LLM_MODEL", "claude-sonnet")
-        cfg = ContentCoreConfig()
-        assert cfg.llm_model == "claude-sonnet"
 
 class TestEnvVarListField:
     """Verify list fields can be set via environment variables."""
@@ -146,21 +94,15 @@ class TestEnvVarListField:
 class TestValidation:
     """Verify field validation constraints."""
 
-    def test_audio_concurrency_too_low(self):
-        with pytest.raises(ValidationError):
-            ContentCoreConfig(audio_concurrency=0)
-
-    def test_audio_concurrency_too_high(self):
+    @pytest.mark.parametrize("value", [0, 11])
+    def test_audio_concurrency_out_of_range(self, value):
         with pytest.raises(ValidationError):
-            ContentCoreConfig(audio_concurrency=11)
-
-    def test_audio_concurrency_min_boundary(self):
-        cfg = ContentCoreConfig(audio_concurrency=1)
-        assert cfg.audio_concurrency == 1
+            ContentCoreConfig(audio_concurrency=value)
 
-    def test_audio_concurrency_max_boundary(self):
-        cfg = ContentCoreConfig(audio_concurrency=10)
-        assert cfg.audio_concurrency == 10
+    @pytest.mark.parametrize("value", [1, 10])
+    def test_audio_concurrency_boundaries(self, value):
+        cfg = ContentCoreConfig(audio_concurrency=value)
+        assert cfg.audio_concurrency == value
 
 
 class TestPriority:
@@ -180,6 +122,13 @@ class TestPriority:
 class TestSingleton:
     """Verify get_default_config / reset_default_config behavior."""
 
+    @pytest.fixture(autouse=True)
+    def _clean_singleton(self):
+        """Only these tests touch the singleton, so only they reset it."""
+        reset_default_config()
+        yield
+        reset_default_config()
+
     def test_get_default_config_returns_singleton(self):
         cfg1 = get_default_config()
         cfg2 = get_default_config()
@@ -1,10 +1,14 @@
 """Unit tests for content_core.processors.document.docling."""
 
+import sys
+from types import ModuleType, SimpleNamespace
 from unittest.mock import MagicMock, patch
 
 import pytest
 
+from content_core.common.state import ExtractionOutput
 from content_core.config import ContentCoreConfig
+from content_core.processors.document import docling as docling_module
 from content_core.processors.document.docling import extract_docling
 
 
@@ -26,6 +30,25 @@ def mock_converter(mock_document):
     return converter
 
 
+@pytest.fixture
+def docling_pipeline(monkeypatch):
+    """Stub the docling converter and PDF pipeline option classes."""
+    converter_cls = MagicMock(spec=["__call__"])
+    converter_cls.return_value.convert.return_value.document.export_to_markdown.return_value = (
+        "content"
+    )
+    pipeline_options_cls = MagicMock(spec=["__call__"])
+    monkeypatch.setattr(docling_module, "DOCLING_AVAILABLE", True)
+    monkeypatch.setattr(docling_module, "DocumentConverter", converter_cls)
+    monkeypatch.setattr(docling_module, "PdfPipelineOptions", pipeline_options_cls)
+    monkeypatch.setattr(docling_module, "PdfFormatOption", MagicMock(spec=["__call__"]))
+    monkeypatch.setattr(docling_module, "InputFormat", MagicMock(spec=["PDF"]))
+    monkeypatch.setattr(docling_module, "_converters", {})
+    return SimpleNamespace(
+        converter_cls=converter_cls, pipeline_options_cls=pipeline_options_cls
+    )
+
+
 class TestExtractDocling:
     async def test_markdown_output(self, mock_converter):
         config = ContentCoreConfig(docling_output_format="markdown")
@@ -75,8 +98,6 @@ class TestExtractDocling:
             return_value=mock_converter,
         ):
             result = await extract_docling("/fake/doc.pdf", config)
-            from content_core.common.state import ExtractionOutput
-
             assert isinstance(result, ExtractionOutput)
 
     async def test_empty_source_raises_value_error(self, mock_converter):
@@ -103,63 +124,92 @@ class TestExtractDocling:
         config = ContentCoreConfig()
         assert config.docling_vision is False
 
-    async def test_formulas_flag_passed_to_pipeline(self):
+    async def test_formulas_flag_passed_to_pipeline(self, docling_pipeline):
         """docling_formulas=True should pass do_formula_enrichment=True."""
         config = ContentCoreConfig(docling_formulas=True)
-        mock_result = MagicMock()
-        mock_result.document.export_to_markdown.return_value = "content"
-        mock_pipeline_options_cls = MagicMock()
-        mock_pdf_format_option_cls = MagicMock()
-        mock_input_format = MagicMock()
-        with patch(
-            "content_core.processors.document.docling.DocumentConverter"
-        ) as MockConverter, patch(
-            "content_core.processors.document.docling.DOCLING_AVAILABLE", True
-        ), patch(
-            "content_core.processors.document.docling.PdfPipelineOptions", mock_pipeline_options_cls
-        ), patch(
-            "content_core.processors.document.docling.PdfFormatOption", mock_pdf_format_option_cls
-        ), patch(
-            "content_core.processors.document.docling.InputFormat", mock_input_format
-        ):
-            MockConverter.return_value.convert.return_value = mock_result
-            await extract_docling("/fake/doc.pdf", config)
-            # Verify DocumentConverter was called with format_options
-            call_kwargs = MockConverter.call_args[1]
-            assert "format_options" in call_kwargs
-            # Verify pipeline option values match config
-            pipeline_call_kwargs = mock_pipeline_options_cls.call_args[1]
-            assert pipeline_call_kwargs["do_ocr"] == config.docling_ocr
-            assert pipeline_call_kwargs["do_formula_enrichment"] is True
-            assert pipeline_call_kwargs["do_picture_description"] == config.docling_vision
-            assert pipeline_call_kwargs["do_chart_extraction"] == config.docling_vision
-
-    async def test_vision_flag_passed_to_pipeline(self):
+        await extract_docling("/fake/doc.pdf", config)
+        # Verify DocumentConverter was called with format_options
+        call_kwargs = docling_pipeline.converter_cls.call_args[1]
+        assert "format_options" in call_kwargs
+        # Verify pipeline option values match config
+        pipeline_call_kwargs = docling_pipeline.pipeline_options_cls.call_args[1]
+        assert pipeline_call_kwargs["do_ocr"] == config.docling_ocr
+        assert pipeline_call_kwargs["do_formula_enrichment"] is True
+        assert pipeline_call_kwargs["do_picture_description"] == config.docling_vision
+        assert pipeline_call_kwargs["do_chart_extraction"] == config.docling_vision
+
+    async def test_vision_flag_passed_to_pipeline(self, docling_pipeline):
         """docling_vision=True should enable picture description and chart extraction."""
         config = ContentCoreConfig(docling_vision=True)
-        mock_result = MagicMock()
-        mock_result.document.export_to_markdown.return_value = "content"
-        mock_pipeline_options_cls = MagicMock()
-        mock_pdf_format_option_cls = MagicMock()
-        mock_input_format = MagicMock()
-        with patch(
-            "content_core.processors.document.docling.DocumentConverter"
-        ) as MockConverter, patch(
-            "content_core.processors.document.docling.DOCLING_AVAILABLE", True
-        ), patch(
-            "content_core.processors.document.docling.PdfPipelineOptions", mock_pipeline_options_cls
-        ), patch(
-            "content_core.processors.document.docling.PdfFormatOption", mock_pdf_format_option_cls
-        ), patch(
-            "content_core.processors.document.docling.InputFormat", mock_input_format
-        ):
-            MockConverter.return_value.convert.return_value = mock_result
-            await extract_docling("/fake/doc.pdf", config)
-            call_kwargs = MockConverter.call_args[1]
-            assert "format_options" in call_kwargs
-            # Verify pipeline option values match config
-            pipeline_call_kwargs = mock_pipeline_options_cls.call_args[1]
-            assert pipeline_call_kwargs["do_ocr"] == config.docling_ocr
-            assert pipeline_call_kwargs["do_formula_enrichment"] == config.docling_formulas
-            assert pipeline_call_kwargs["do_picture_description"] is True
-            assert pipeline_call_kwargs["do_chart_extraction"] is True
+        await extract_docling("/fake/doc.pdf", config)
+        call_kwargs = docling_pipeline.converter_cls.call_args[1]
+        assert "format_options" in call_kwargs
+        # Verify pipeline option values match config
+        pipeline_call_kwargs = docling_pipeline.pipeline_options_cls.call_args[1]
+        assert pipeline_call_kwargs["do_ocr"] == config.docling_ocr
+        assert pipeline_call_kwargs["do_formula_enrichment"] == config.docling_formulas
+        assert pipeline_call_kwargs["do_picture_description"] is True
+        assert pipeline_call_kwargs["do_chart_extraction"] is True
+
+
+class TestConverterReuse:
+    async def test_converter_reused_across_extractions(self, docling_pipeline):
+        config = ContentCoreConfig()
+        await extract_docling("/fake/a.pdf", config)
+        await extract_docling("/fake/b.pdf", config)
+        docling_pipeline.converter_cls.assert_called_once()
+        assert docling_pipeline.converter_cls.return_value.convert.call_count == 2
+
+    async def test_pipeline_options_get_their_own_converter(self, docling_pipeline):
+        await extract_docling("/fake/a.pdf", ContentCoreConfig())
+        await extract_docling("/fake/a.pdf", ContentCoreConfig(docling_formulas=True))
+        await extract_docling("/fake/b.pdf", ContentCoreConfig(docling_formulas=True))
+        assert docling_pipeline.converter_cls.call_count == 2
+
+
+class BrokenModule(ModuleType):
+    def __getattr__(self, name):
+        raise OSError("libtorch_cpu.so: cannot open shared object file")
+
+
+class TestLazyDoclingImport:
+    @pytest.fixture(autouse=True)
+    def _unloaded(self, monkeypatch):
+        for name in ("InputFormat", "PdfPipelineOptions", "PdfFormatOption", "DocumentConverter"):
+            monkeypatch.setattr(docling_module, name, None)
+
+    def test_docling_imported_on_first_use(self, monkeypatch):
+        fake = {
+            "docling": MagicMock(),
+            "docling.datamodel": MagicMock(),
+            "docling.datamodel.base_models": MagicMock(spec=["InputFormat"]),
+            "docling.datamodel.pipeline_options": MagicMock(spec=["PdfPipelineOptions"]),
+            "docling.document_converter": MagicMock(
+                spec=["DocumentConverter", "PdfFormatOption"]
+            ),
+        }
+        for name, module in fake.items():
+            monkeypatch.setitem(sys.modules, name, module)
+        monkeypatch.setattr(docling_module, "DOCLING_AVAILABLE", True)
+
+        assert docling_module.load_docling()
+
+        converter_module = fake["docling.document_converter"]
+        assert docling_module.DocumentConverter is converter_module.DocumentConverter
+        assert docling_module.PdfFormatOption is converter_module.PdfFormatOption
+
+    # None in sys.modules makes the import raise ImportError; a module whose
+    # attributes raise stands in for torch failing to load its libraries
+    @pytest.mark.parametrize("broken_module", [None, BrokenModule("docling")])
+    def test_broken_docling_install_is_unavailable(self, monkeypatch, broken_module):
+        monkeypatch.setitem(sys.modules, "docling.datamodel.base_models", broken_module)
+        monkeypatch.setattr(docling_module, "DOCLING_AVAILABLE", True)
+
+        assert not docling_module.load_docling()
+        assert not docling_module.DOCLING_AVAILABLE
+        assert docling_module.DocumentConverter is docling_module._MissingDocumentConverter
+
+    async def test_missing_docling_raises_import_error(self, monkeypatch):
+        monkeypatch.setattr(docling_module, "DOCLING_AVAILABLE", False)
+        with pytest.raises(ImportError, match="Docling not installed"):
+            await extract_docling("/fake/doc.pdf", ContentCoreConfig())
@@ -17,7 +17,6 @@ class TestFileDetectorPDF:
         """Get path to test PDF file."""
         return Path(__file__).parent.parent / "input_content" / "file.pdf"
     
-    @pytest.mark.asyncio
     async def test_detect_pdf_file(self, detector, test_pdf_path):
         """Test detection of a valid PDF file."""
         # Ensure test file exists
@@ -29,7 +28,6 @@ class TestFileDetectorPDF:
         # Assert it's detected as PDF
         assert detected_type == "application/pdf", f"Expected 'application/pdf', got '{detected_type}'"
     
-    @pytest.mark.asyncio
     async def test_pdf_detection_with_wrong_extension(self, detector, test_pdf_path, tmp_path):
         """Test PDF detection works regardless of file extension."""
         # Copy PDF with wrong extension
@@ -42,7 +40,6 @@ class TestFileDetectorPDF:
         # Should still detect as PDF based on content, not extension
         assert detected_type == "application/pdf", f"Expected 'application/pdf', got '{detected_type}'"
     
-    @pytest.mark.asyncio
     async def test_pdf_detection_performance(self, detector, test_pdf_path):
         """Test PDF detection is performant (reads minimal bytes)."""
         import time
@@ -12,7 +12,6 @@ class TestFileDetectorCritical:
         return FileDetector()
     
     # Test 1: JSON Detection with Strong Indicators
-    @pytest.mark.asyncio
     async def test_json_detection_pretty_printed(self, detector, tmp_path):
         """Test detection of pretty-printed JSON with strong indicators."""
         json_file = tmp_path / "data.json"
@@ -29,7 +28,6 @@ class TestFileDetectorCritical:
         assert detected == "application/json"
     
     # Test 2: JSON False Positive Prevention
-    @pytest.mark.asyncio
     async def test_json_reject_javascript(self, detector, tmp_path):
         """Test that JavaScript files starting with { are not detected as JSON."""
         js_file = tmp_path / "script.js"
@@ -47,7 +45,6 @@ class TestFileDetectorCritical:
         assert detected == "text/plain"  # Should fall back to plain text
     
     # Test 3: Text-based format detection (YAML/Markdown)
-    @pytest.mark.asyncio
     async def test_yaml_front_matter_in_markdown(self, detector, tmp_path):
         """Test that files with YAML front matter are detected as text-based."""
         md_file = tmp_path / "post.md"
@@ -73,7 +70,6 @@ Some content here with **bold** and *italic* text.
         assert detected in ["text/plain", "text/yaml"]
     
     # Test 4: MP4 Detection with ftyp Box
-    @pytest.mark.asyncio
     async def test_mp4_detection_flexible_ftyp(self, detector, tmp_path):
         """Test MP4 detection with various ftyp brands without fixed sizes."""
         # Test MP4 with isom brand
@@ -90,7 +86,6 @@ Some content here with **bold** and *italic* text.
         assert detected == "audio/mp4"
     
     # Test 5: JPEG Detection Order
-    @pytest.mark.asyncio
     async def test_jpeg_signature_priority(self, detector, tmp_path):
         """Test JPEG detection with various signatures in correct order."""
         # JPEG with EXIF (common in photos)
@@ -106,7 +101,6 @@ Some content here with **bold** and *italic* text.
         assert detected == "image/jpeg"
     
     # Test 6: Unicode Handling with Replace Strategy
-    @pytest.mark.asyncio
     async def test_unicode_handling_with_invalid_bytes(self, detector, tmp_path):
         """Test handling of files with invalid UTF-8 sequences."""
         mixed_file = tmp_path / "mixed.txt"
@@ -118,7 +112,6 @@ Some content here with **bold** and *italic* text.
         assert detected == "text/plain"
     
     # Test 7: ZIP-based Office Format Detection
-    @pytest.mark.asyncio
     async def test_docx_detection_via_zip_content(self, detector, tmp_path):
         """Test DOCX detection by inspecting ZIP content."""
         import zipfile
@@ -134,7 +127,6 @@ Some content here with **bold** and *italic* text.
         assert detected == "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
     
     # Test 8: YAML vs JSON Ambiguity
-    @pytest.mark.asyncio
     async def test_yaml_key_value_detection(self, detector, tmp_path):
         """Test YAML detection with multiple key-value pairs."""
         yaml_file = tmp_path / "config.yaml"
@@ -157,7 +149,6 @@ features:
         assert detected in ["text/yaml", "text/plain"]
     
     # Test 9: CSV Detection
-    @pytest.mark.asyncio
     async def test_csv_detection_consistent_commas(self, detector, tmp_path):
         """Test CSV detection based on consistent comma patterns."""
         csv_file = tmp_path / "data.csv"
@@ -171,14 +162,19 @@ Alice Brown,28,alice@example.com,Houston
         assert detected == "text/csv"
     
     # Test 10: Error Handling for Edge Cases
-    @pytest.mark.asyncio
     async def test_error_handling_nonexistent_file(self, detector):
         """Test proper error handling for non-existent files."""
         with pytest.raises(FileNotFoundError):
             await detector.detect("/path/that/does/not/exist.txt")
     
-    @pytest.mark.asyncio
     async def test_error_handling_directory(self, detector, tmp_path):
         """Test proper error handling when path is a directory."""
         with pytest.raises(ValueError, match="Not a file"):
-            await detector.detect(str(tmp_path))
\ No newline at end of file
+            await detector.detect(str(tmp_path))
+
+    async def test_html_detection_ignores_case(self, detector, tmp_path):
+        """Test that text patterns match regardless of case."""
+        html_file = tmp_path / "page"
+        html_file.write_text("<!DocType HTML>\n<HTML><body>Hello world</body></HTML>")
+        detected = await detector.detect(str(html_file))
+        assert detected == "text/html"
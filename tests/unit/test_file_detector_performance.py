@@ -25,7 +25,6 @@ class TestFileDetectorPerformance:
                 f.write(chunk)
         return large_file
     
-    @pytest.mark.asyncio
     async def test_pdf_detection_performance(self, detector, tmp_path):
         """Test PDF detection is fast (should read only first 512 bytes)."""
         # Create a PDF file
@@ -44,7 +43,6 @@ class TestFileDetectorPerformance:
         detection_time_ms = (end_time - start_time) * 1000
         assert detection_time_ms < 10, f"PDF detection took {detection_time_ms:.2f}ms, expected < 10ms"
     
-    @pytest.mark.asyncio
     async def test_large_file_performance(self, detector, large_file):
         """Test that large files don't cause performance issues."""
         # Measure detection time for 100MB file
@@ -60,7 +58,6 @@ class TestFileDetectorPerformance:
         detection_time_ms = (end_time - start_time) * 1000
         assert detection_time_ms < 20, f"Large file detection took {detection_time_ms:.2f}ms, expected < 20ms"
     
-    @pytest.mark.asyncio 
     async def test_multiple_format_detection_performance(self, detector, tmp_path):
         """Test detection performance across multiple file types."""
         # Create test files
@@ -104,7 +101,6 @@ class TestFileDetectorPerformance:
         assert total_time_ms < 50, f"Total detection time {total_time_ms:.2f}ms for {len(files)} files"
         assert avg_time_ms < 10, f"Average detection time {avg_time_ms:.2f}ms per file"
     
-    @pytest.mark.asyncio
     async def test_text_detection_performance(self, detector, tmp_path):
         """Test text format detection performance."""
         # Create a large text file (1MB)
@@ -0,0 +1,40 @@
+"""Tests for per-host request limits in content_core.common.concurrency."""
+
+import asyncio
+
+from content_core.common.concurrency import MAX_REQUESTS_PER_HOST, host_semaphore
+
+
+class TestHostSemaphore:
+    async def test_same_host_shares_semaphore(self):
+        first = host_semaphore("https://example.com/a")
+        second = host_semaphore("https://EXAMPLE.com/b?q=1")
+        assert first is second
+
+    async def test_different_hosts_get_different_semaphores(self):
+        assert host_semaphore("https://example.com/") is not host_semaphore(
+            "https://example.org/"
+        )
+
+    async def test_limits_concurrent_requests_per_host(self):
+        in_flight = 0
+        peak = 0
+
+        async def fake_request(i):
+            nonlocal in_flight, peak
+            async with host_semaphore(f"https://limited.example/{i}"):
+                in_flight += 1
+                peak = max(peak, in_flight)
+                await asyncio.sleep(0.01)
+                in_flight -= 1
+
+        await asyncio.gather(*(fake_request(i) for i in range(MAX_REQUESTS_PER_HOST * 3)))
+        assert peak == MAX_REQUESTS_PER_HOST
+
+    def test_each_event_loop_gets_its_own_semaphores(self):
+        async def get():
+            return host_semaphore("https://example.com/")
+
+        first = asyncio.run(get())
+        second = asyncio.run(get())
+        assert first is not second
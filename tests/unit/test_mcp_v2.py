@@ -1,8 +1,7 @@
 """Tests for the MCP server v2."""
 from unittest.mock import AsyncMock, patch
 
-import pytest
-
+from content_core.common.state import ExtractionOutput
 from content_core.mcp.server import extract_content as _extract_tool
 from content_core.mcp.server import summarize_content as _summarize_tool
 
@@ -13,54 +12,42 @@ summarize_content_fn = getattr(_summarize_tool, "fn", _summarize_tool)
 
 
 class TestExtractContent:
-    @pytest.mark.asyncio
     async def test_extract_url(self):
         with patch(
             "content_core.extraction.extract_content", new_callable=AsyncMock
         ) as mock:
-            from content_core.common.state import ExtractionOutput
-
             mock.return_value = ExtractionOutput(content="extracted text")
             result = await extract_content_fn(url="https://example.com")
             assert result == "extracted text"
 
-    @pytest.mark.asyncio
     async def test_extract_file(self):
         with patch(
             "content_core.extraction.extract_content", new_callable=AsyncMock
         ) as mock:
-            from content_core.common.state import ExtractionOutput
-
             mock.return_value = ExtractionOutput(content="file content")
             result = await extract_content_fn(file_path="/tmp/test.pdf")
             assert result == "file content"
 
-    @pytest.mark.asyncio
     async def test_no_params_returns_error(self):
         result = await extract_content_fn()
         assert "Error" in result
 
-    @pytest.mark.asyncio
     async def test_both_params_returns_error(self):
         result = await extract_content_fn(
             url="https://example.com", file_path="/tmp/test.pdf"
         )
         assert "Error" in result
 
-    @pytest.mark.asyncio
     async def test_engine_param_forwarded(self):
         with patch(
             "content_core.extraction.extract_content", new_callable=AsyncMock
         ) as mock_extract, patch(
             "content_core.config.ContentCoreConfig"
         ) as mock_config:
-            from content_core.common.state import ExtractionOutput
-
             mock_extract.return_value = ExtractionOutput(content="text")
             await extract_content_fn(url="https://example.com", engine="firecrawl")
             mock_config.assert_called_once_with(url_engine="firecrawl", document_engine="firecrawl")
 
-    @pytest.mark.asyncio
     async def test_extract_error(self):
         with patch(
             "content_core.extraction.extract_content", new_callable=AsyncMock
@@ -70,11 +57,8 @@ class TestExtractContent:
             assert "Error" in result
             assert "Network error" in result
 
-    @pytest.mark.asyncio
     async def test_extract_file_with_engine_routes_to_document_engine(self):
         """engine param with file_path should set document_engine, not url_engine."""
-        from content_core.common.state import ExtractionOutput
-
         with patch(
             "content_core.extraction.extract_content", new_callable=AsyncMock
         ) as mock:
@@ -83,11 +67,8 @@ class TestExtractContent:
             _, kwargs = mock.call_args
             assert kwargs["config"].document_engine == "docling"
 
-    @pytest.mark.asyncio
     async def test_extract_with_docling_flags(self):
         """Docling enrichment flags should be passed to config."""
-        from content_core.common.state import ExtractionOutput
-
         with patch(
             "content_core.extraction.extract_content", new_callable=AsyncMock
         ) as mock:
@@ -104,7 +85,6 @@ class TestExtractContent:
 
 
 class TestSummarizeContent:
-    @pytest.mark.asyncio
     async def test_summarize(self):
         with patch(
             "content_core.content.summary.summarize", new_callable=AsyncMock
@@ -116,7 +96,6 @@ class TestSummarizeContent:
             assert result == "summary text"
             mock.assert_called_once_with("long text", "bullet points")
 
-    @pytest.mark.asyncio
     async def test_summarize_error(self):
         with patch(
             "content_core.content.summary.summarize", new_callable=AsyncMock
@@ -287,36 +287,40 @@ class TestSelectBestAudioStream:
 
 class TestGetAudioStreams:
     async def test_parses_ffprobe_output(self):
-        ffprobe_output = json.dumps(
-            {
-                "streams": [
-                    {
-                        "codec_type": "audio",
-                        "bit_rate": "128000",
-                        "channels": 2,
-                        "sample_rate": "44100",
-                    }
-                ]
-            }
+        mock_result = MagicMock()
+        mock_result.returncode = 0
+        mock_result.stdout = (
+            "index=1|sample_rate=44100|channels=2|bit_rate=128000\n"
+            "index=2|sample_rate=48000|channels=6|bit_rate=N/A\n"
         )
 
+        with patch(
+            "content_core.processors.media.video.subprocess.run",
+            return_value=mock_result,
+        ) as mock_run:
+            result = await get_audio_streams("/fake/video.mp4")
+
+        cmd = mock_run.call_args[0][0]
+        assert "stream=index,bit_rate,channels,sample_rate" in cmd
+        assert len(result) == 2
+        assert result[0] == {
+            "index": "1",
+            "sample_rate": "44100",
+            "channels": 2,
+            "bit_rate": "128000",
+        }
+        assert result[1]["channels"] == 6
+        assert "bit_rate" not in result[1]
+
+    async def test_ffprobe_failure_returns_empty_list(self):
         mock_result = MagicMock()
-        mock_result.returncode = 0
-        mock_result.stdout = ffprobe_output
+        mock_result.returncode = 1
+        mock_result.stderr = "No such file"
 
         with patch(
-            "content_core.processors.media.video.asyncio.get_event_loop"
-        ) as mock_loop:
-            mock_loop.return_value.run_in_executor = AsyncMock(
-                return_value=[
-                    {
-                        "codec_type": "audio",
-                        "bit_rate": "128000",
-                        "channels": 2,
-                        "sample_rate": "44100",
-                    }
-                ]
-            )
+            "content_core.processors.media.video.subprocess.run",
+            return_value=mock_result,
+        ):
             result = await get_audio_streams("/fake/video.mp4")
-            assert len(result) == 1
-            assert result[0]["channels"] == 2
+
+        assert result == []
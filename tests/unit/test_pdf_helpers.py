@@ -1,5 +1,4 @@
 """Tests for PDF helper functions."""
-import pytest
 from content_core.processors.document.pdf import (
     count_formula_placeholders,
     convert_table_to_markdown,
@@ -90,7 +89,6 @@ class TestTableConversion:
         assert "---" in result  # Should have separator
 
 
-@pytest.mark.asyncio
 class TestPDFExtractionIntegration:
     """Integration tests for PDF extraction."""
 
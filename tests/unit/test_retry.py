@@ -9,10 +9,12 @@ Tests the retry module including:
 from unittest.mock import MagicMock, patch
 
 import aiohttp
+import httpx
 import pytest
 
 from content_core.common.exceptions import NoTranscriptFound, NotFoundError
 from content_core.common.retry import (
+    TRANSIENT_MESSAGE_INDICATORS,
     is_retryable_exception,
     log_retry_attempt,
     retry_audio_transcription,
@@ -82,7 +84,6 @@ class TestRetryConfig:
 class TestRetryDecorators:
     """Tests for retry decorator behavior."""
 
-    @pytest.mark.asyncio
     async def test_retry_youtube_success_first_try(self):
         """Test successful function call on first try."""
         call_count = 0
@@ -97,7 +98,6 @@ class TestRetryDecorators:
         assert result == "success"
         assert call_count == 1
 
-    @pytest.mark.asyncio
     async def test_retry_youtube_success_after_retry(self):
         """Test successful function call after one retry."""
         call_count = 0
@@ -114,7 +114,6 @@ class TestRetryDecorators:
         assert result == "success"
         assert call_count == 2
 
-    @pytest.mark.asyncio
     async def test_retry_youtube_exhausts_retries(self):
         """Test that function fails after exhausting retries."""
         call_count = 0
@@ -130,7 +129,6 @@ class TestRetryDecorators:
 
         assert call_count == 3
 
-    @pytest.mark.asyncio
     async def test_retry_url_network_retries_on_connection_error(self):
         """Test URL network retry on ConnectionError."""
         call_count = 0
@@ -147,7 +145,6 @@ class TestRetryDecorators:
         assert result == "connected"
         assert call_count == 3
 
-    @pytest.mark.asyncio
     async def test_retry_url_network_retries_on_timeout(self):
         """Test URL network retry on TimeoutError."""
         call_count = 0
@@ -164,7 +161,6 @@ class TestRetryDecorators:
         assert result == "completed"
         assert call_count == 2
 
-    @pytest.mark.asyncio
     async def test_retry_url_api_success(self):
         """Test URL API retry decorator."""
         call_count = 0
@@ -181,7 +177,6 @@ class TestRetryDecorators:
         assert result == {"data": "success"}
         assert call_count == 2
 
-    @pytest.mark.asyncio
     async def test_retry_audio_transcription(self):
         """Test audio transcription retry decorator."""
         call_count = 0
@@ -198,7 +193,6 @@ class TestRetryDecorators:
         assert result == "transcribed text"
         assert call_count == 2
 
-    @pytest.mark.asyncio
     async def test_retry_llm_success(self):
         """Test LLM retry decorator."""
         call_count = 0
@@ -215,7 +209,6 @@ class TestRetryDecorators:
         assert result == "LLM response"
         assert call_count == 2
 
-    @pytest.mark.asyncio
     async def test_retry_download_success(self):
         """Test download retry decorator."""
         call_count = 0
@@ -298,6 +291,23 @@ class TestIsRetryableException:
         """Test that generic aiohttp client errors are retryable."""
         assert is_retryable_exception(aiohttp.ClientError("Client error"))
 
+    def test_httpx_transport_error_is_retryable(self):
+        """Test that httpx connection/timeout errors are retryable."""
+        assert is_retryable_exception(httpx.ConnectError("Connection refused"))
+        assert is_retryable_exception(httpx.ReadTimeout("Read timed out"))
+
+    def test_httpx_status_error_retries_only_5xx_and_429(self):
+        """Test that httpx status errors follow the same rules as aiohttp ones."""
+        request = httpx.Request("GET", "https://example.com")
+
+        def status_error(status):
+            response = httpx.Response(status, request=request)
+            return httpx.HTTPStatusError("error", request=request, response=response)
+
+        assert is_retryable_exception(status_error(503))
+        assert is_retryable_exception(status_error(429))
+        assert not is_retryable_exception(status_error(404))
+
     def test_permanent_failures_not_retryable(self):
         """Test that permanent failures are not retried."""
         assert not is_retryable_exception(NoTranscriptFound("No transcript"))
@@ -316,6 +326,11 @@ class TestIsRetryableException:
         assert is_retryable_exception(Exception("Too many requests"))
         assert is_retryable_exception(Exception("503 Service Unavailable"))
 
+    @pytest.mark.parametrize("indicator", TRANSIENT_MESSAGE_INDICATORS)
+    def test_each_transient_indicator_is_matched_case_insensitively(self, indicator):
+        """Test that every transient indicator is recognized regardless of case."""
+        assert is_retryable_exception(Exception(f"Upstream said: {indicator.upper()}!"))
+
     def test_generic_exception_without_transient_message_not_retryable(self):
         """Test that generic exceptions without transient indicators are not retried."""
         assert not is_retryable_exception(Exception("Invalid input"))
@@ -326,7 +341,6 @@ class TestIsRetryableException:
 class TestNoTranscriptFoundNotRetried:
     """Tests that NoTranscriptFound exceptions are not retried."""
 
-    @pytest.mark.asyncio
     async def test_no_transcript_found_not_retried(self):
         """Test that NoTranscriptFound is immediately raised without retry."""
         call_count = 0
@@ -1,14 +1,26 @@
 """Tests for the v2 extraction orchestrator routing logic."""
 from __future__ import annotations
 
-from unittest.mock import AsyncMock, patch
+import os
+import sys
+import tempfile
+from pathlib import Path
+from types import ModuleType
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from content_core import extraction
 from content_core.common.exceptions import InvalidInputError, UnsupportedTypeException
 from content_core.config import ContentCoreConfig
-from content_core.extraction import check_file_support, extract_content
+from content_core.content import identification
+from content_core.extraction import (
+    _download_remote_file,
+    check_file_support,
+    extract_content,
+)
 from content_core.common.state import ExtractionOutput, FileSupport
+from content_core.processors.document import docling as docling_module
 
 
 def _make_output(**kwargs) -> ExtractionOutput:
@@ -18,14 +30,34 @@ def _make_output(**kwargs) -> ExtractionOutput:
     return ExtractionOutput(**defaults)
 
 
+@pytest.fixture(scope="module")
+def simple_config():
+    """A config pinned to the simple document engine; tests only read it."""
+    return ContentCoreConfig(document_engine="simple")
+
+
+@pytest.fixture
+def detected_type(monkeypatch):
+    """Make file identification report a MIME type (or raise the given exception)."""
+
+    def _set(result):
+        if isinstance(result, Exception):
+            mock = AsyncMock(side_effect=result)
+        else:
+            mock = AsyncMock(return_value=result)
+        monkeypatch.setattr(identification, "get_file_type", mock)
+        return mock
+
+    return _set
+
+
 # ---------------------------------------------------------------------------
 # 1. Text input -> process_text
 # ---------------------------------------------------------------------------
-@pytest.mark.asyncio
 async def test_text_input_calls_process_text():
     expected = _make_output(source_type="text")
-    with patch(
-        "content_core.extraction.process_text", new_callable=AsyncMock, return_value=expected
+    with patch.object(
+        extraction, "process_text", new_callable=AsyncMock, return_value=expected
     ) as mock:
         result = await extract_content(content="hello")
         mock.assert_awaited_once()
@@ -35,36 +67,32 @@ async def test_text_input_calls_process_text():
 # ---------------------------------------------------------------------------
 # 2. YouTube URL -> extract_youtube
 # ---------------------------------------------------------------------------
-@pytest.mark.asyncio
-async def test_youtube_url_calls_extract_youtube():
+@pytest.mark.parametrize(
+    "url",
+    [
+        "https://www.youtube.com/watch?v=abc",
+        "https://youtu.be/abc",
+        "https://www.youtube.com/shorts/abc",
+    ],
+)
+async def test_youtube_url_calls_extract_youtube(url):
     expected = _make_output(source_type="url", identified_type="youtube")
-    with patch(
-        "content_core.extraction.extract_youtube", new_callable=AsyncMock, return_value=expected
-    ) as mock:
-        result = await extract_content(url="https://www.youtube.com/watch?v=abc")
-        mock.assert_awaited_once()
-        assert result is expected
-
-
-@pytest.mark.asyncio
-async def test_youtu_be_url_calls_extract_youtube():
-    expected = _make_output(source_type="url", identified_type="youtube")
-    with patch(
-        "content_core.extraction.extract_youtube", new_callable=AsyncMock, return_value=expected
-    ) as mock:
-        result = await extract_content(url="https://youtu.be/abc")
+    with patch.object(
+        extraction, "extract_youtube", new_callable=AsyncMock, return_value=expected
+    ) as mock, patch.object(extraction, "detect_remote_mime", new_callable=AsyncMock) as mock_mime:
+        result = await extract_content(url=url)
         mock.assert_awaited_once()
+        mock_mime.assert_not_awaited()
         assert result is expected
 
 
 # ---------------------------------------------------------------------------
 # 2b. Reddit URL -> extract_reddit
 # ---------------------------------------------------------------------------
-@pytest.mark.asyncio
 async def test_reddit_url_calls_extract_reddit():
     expected = _make_output(source_type="url", identified_type="reddit")
-    with patch(
-        "content_core.extraction.extract_reddit", new_callable=AsyncMock, return_value=expected
+    with patch.object(
+        extraction, "extract_reddit", new_callable=AsyncMock, return_value=expected
     ) as mock:
         result = await extract_content(
             url="https://www.reddit.com/r/python/comments/abc123/some_post/"
@@ -73,20 +101,19 @@ async def test_reddit_url_calls_extract_reddit():
         assert result is expected
 
 
-@pytest.mark.asyncio
 async def test_reddit_fallback_on_failure():
     """When Reddit JSON extraction fails, falls back to normal URL extraction."""
     fallback = _make_output(source_type="url", identified_type="article")
-    with patch(
-        "content_core.extraction.extract_reddit",
+    with patch.object(
+        extraction, "extract_reddit",
         new_callable=AsyncMock,
         return_value=None,
-    ), patch(
-        "content_core.extraction.detect_remote_mime",
+    ), patch.object(
+        extraction, "detect_remote_mime",
         new_callable=AsyncMock,
         return_value="article",
-    ), patch(
-        "content_core.extraction.extract_from_url",
+    ), patch.object(
+        extraction, "extract_from_url",
         new_callable=AsyncMock,
         return_value=fallback,
     ) as mock_url:
@@ -100,15 +127,14 @@ async def test_reddit_fallback_on_failure():
 # ---------------------------------------------------------------------------
 # 3. Regular URL with article MIME -> extract_from_url
 # ---------------------------------------------------------------------------
-@pytest.mark.asyncio
 async def test_url_article_calls_extract_from_url():
     expected = _make_output(source_type="url", identified_type="article")
-    with patch(
-        "content_core.extraction.detect_remote_mime",
+    with patch.object(
+        extraction, "detect_remote_mime",
         new_callable=AsyncMock,
         return_value="article",
-    ), patch(
-        "content_core.extraction.extract_from_url",
+    ), patch.object(
+        extraction, "extract_from_url",
         new_callable=AsyncMock,
         return_value=expected,
     ) as mock_extract:
@@ -120,19 +146,18 @@ async def test_url_article_calls_extract_from_url():
 # ---------------------------------------------------------------------------
 # 4. URL with PDF MIME -> download + extract_pdf_file
 # ---------------------------------------------------------------------------
-@pytest.mark.asyncio
 async def test_url_pdf_downloads_and_calls_extract_pdf():
     expected = _make_output(source_type="file", identified_type="application/pdf")
-    with patch(
-        "content_core.extraction.detect_remote_mime",
+    with patch.object(
+        extraction, "detect_remote_mime",
         new_callable=AsyncMock,
         return_value="application/pdf",
-    ), patch(
-        "content_core.extraction._download_remote_file",
+    ), patch.object(
+        extraction, "_download_remote_file",
         new_callable=AsyncMock,
         return_value="/tmp/fake.pdf",
-    ) as mock_download, patch(
-        "content_core.extraction._extract_file",
+    ) as mock_download, patch.object(
+        extraction, "_extract_file",
         new_callable=AsyncMock,
         return_value=expected,
     ) as mock_extract_file:
@@ -144,124 +169,35 @@ async def test_url_pdf_downloads_and_calls_extract_pdf():
 
 
 # ---------------------------------------------------------------------------
-# 5. File with PDF MIME -> extract_pdf_file
+# 5-9. File MIME type -> matching processor
 # ---------------------------------------------------------------------------
-@pytest.mark.asyncio
-async def test_file_pdf_calls_extract_pdf_file():
-    expected = _make_output(identified_type="application/pdf")
-    cfg = ContentCoreConfig(document_engine="simple")
-    with patch(
-        "content_core.content.identification.get_file_type",
-        new_callable=AsyncMock,
-        return_value="application/pdf",
-    ), patch(
-        "content_core.extraction.extract_pdf_file",
-        new_callable=AsyncMock,
-        return_value=expected,
-    ) as mock:
-        result = await extract_content(file_path="/tmp/test.pdf", config=cfg)
-        mock.assert_awaited_once()
-        assert result is expected
+# detected MIME type, processor it routes to, document engine (None = default)
+FILE_ROUTE_CASES = [
+    pytest.param("application/pdf", "extract_pdf_file", "simple", id="pdf"),
+    pytest.param("application/epub+zip", "extract_epub_file", None, id="epub"),
+    pytest.param(
+        "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+        "extract_office",
+        "simple",
+        id="docx",
+    ),
+    pytest.param("video/mp4", "extract_video", None, id="video"),
+    pytest.param("audio/mp3", "transcribe_audio", None, id="audio"),
+    pytest.param("text/plain", "extract_text_file", None, id="text"),
+]
 
 
-# ---------------------------------------------------------------------------
-# 5b. File with EPUB MIME -> extract_epub_file
-# ---------------------------------------------------------------------------
-@pytest.mark.asyncio
-async def test_file_epub_calls_extract_epub_file():
-    expected = _make_output(identified_type="application/epub+zip")
-    with patch(
-        "content_core.content.identification.get_file_type",
-        new_callable=AsyncMock,
-        return_value="application/epub+zip",
-    ), patch(
-        "content_core.extraction.extract_epub_file",
-        new_callable=AsyncMock,
-        return_value=expected,
-    ) as mock:
-        result = await extract_content(file_path="/tmp/test.epub")
-        mock.assert_awaited_once()
-        assert result is expected
-
-
-# ---------------------------------------------------------------------------
-# 6. File with DOCX MIME -> extract_office
-# ---------------------------------------------------------------------------
-@pytest.mark.asyncio
-async def test_file_docx_calls_extract_office():
-    mime = "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
+@pytest.mark.parametrize("mime, processor, engine", FILE_ROUTE_CASES)
+async def test_file_routes_to_processor(mime, processor, engine, detected_type):
     expected = _make_output(identified_type=mime)
-    cfg = ContentCoreConfig(document_engine="simple")
-    with patch(
-        "content_core.content.identification.get_file_type",
-        new_callable=AsyncMock,
-        return_value=mime,
-    ), patch(
-        "content_core.extraction.extract_office",
-        new_callable=AsyncMock,
-        return_value=expected,
-    ) as mock:
-        result = await extract_content(file_path="/tmp/test.docx", config=cfg)
-        mock.assert_awaited_once()
-        assert result is expected
-
-
-# ---------------------------------------------------------------------------
-# 7. File with video/* MIME -> extract_video
-# ---------------------------------------------------------------------------
-@pytest.mark.asyncio
-async def test_file_video_calls_extract_video():
-    expected = _make_output(identified_type="video/mp4")
-    with patch(
-        "content_core.content.identification.get_file_type",
-        new_callable=AsyncMock,
-        return_value="video/mp4",
-    ), patch(
-        "content_core.extraction.extract_video",
-        new_callable=AsyncMock,
-        return_value=expected,
-    ) as mock:
-        result = await extract_content(file_path="/tmp/test.mp4")
-        mock.assert_awaited_once()
-        assert result is expected
-
-
-# ---------------------------------------------------------------------------
-# 8. File with audio/* MIME -> transcribe_audio
-# ---------------------------------------------------------------------------
-@pytest.mark.asyncio
-async def test_file_audio_calls_transcribe_audio():
-    expected = _make_output(identified_type="audio/mp3")
-    with patch(
-        "content_core.content.identification.get_file_type",
-        new_callable=AsyncMock,
-        return_value="audio/mp3",
-    ), patch(
-        "content_core.extraction.transcribe_audio",
-        new_callable=AsyncMock,
-        return_value=expected,
-    ) as mock:
-        result = await extract_content(file_path="/tmp/test.mp3")
-        mock.assert_awaited_once()
-        assert result is expected
-
-
-# ---------------------------------------------------------------------------
-# 9. File with text/plain MIME -> extract_text_file
-# ---------------------------------------------------------------------------
-@pytest.mark.asyncio
-async def test_file_text_calls_extract_text_file():
-    expected = _make_output(identified_type="text/plain")
-    with patch(
-        "content_core.content.identification.get_file_type",
-        new_callable=AsyncMock,
-        return_value="text/plain",
-    ), patch(
-        "content_core.extraction.extract_text_file",
+    cfg = ContentCoreConfig(document_engine=engine) if engine else None
+    detected_type(mime)
+    with patch.object(
+        extraction, processor,
         new_callable=AsyncMock,
         return_value=expected,
     ) as mock:
-        result = await extract_content(file_path="/tmp/test.txt")
+        result = await extract_content(file_path="/tmp/test.file", config=cfg)
         mock.assert_awaited_once()
         assert result is expected
 
@@ -269,7 +205,6 @@ async def test_file_text_calls_extract_text_file():
 # ---------------------------------------------------------------------------
 # 10. No source -> InvalidInputError
 # ---------------------------------------------------------------------------
-@pytest.mark.asyncio
 async def test_no_source_raises_invalid_input():
     with pytest.raises(InvalidInputError):
         await extract_content()
@@ -278,26 +213,20 @@ async def test_no_source_raises_invalid_input():
 # ---------------------------------------------------------------------------
 # 11. Unknown file MIME -> UnsupportedTypeException
 # ---------------------------------------------------------------------------
-@pytest.mark.asyncio
-async def test_unknown_mime_raises_unsupported():
-    with patch(
-        "content_core.content.identification.get_file_type",
-        new_callable=AsyncMock,
-        return_value="application/x-unknown-binary",
-    ):
-        with pytest.raises(UnsupportedTypeException):
-            await extract_content(file_path="/tmp/test.bin")
+async def test_unknown_mime_raises_unsupported(detected_type):
+    detected_type("application/x-unknown-binary")
+    with pytest.raises(UnsupportedTypeException):
+        await extract_content(file_path="/tmp/test.bin")
 
 
 # ---------------------------------------------------------------------------
 # 12. Config is passed through to processors
 # ---------------------------------------------------------------------------
-@pytest.mark.asyncio
 async def test_config_passed_to_processor():
     custom_cfg = ContentCoreConfig(url_engine="firecrawl")
     expected = _make_output(source_type="text")
-    with patch(
-        "content_core.extraction.process_text", new_callable=AsyncMock, return_value=expected
+    with patch.object(
+        extraction, "process_text", new_callable=AsyncMock, return_value=expected
     ) as mock:
         await extract_content(content="hello", config=custom_cfg)
         # Verify the custom config was passed
@@ -309,15 +238,13 @@ async def test_config_passed_to_processor():
 # ---------------------------------------------------------------------------
 # 13. Docling flags warning without docling engine
 # ---------------------------------------------------------------------------
-@pytest.mark.asyncio
-async def test_docling_flags_warning_without_engine():
+async def test_docling_flags_warning_without_engine(detected_type):
     """Warning should be logged when docling flags set but engine is not docling."""
     cfg = ContentCoreConfig(docling_formulas=True, document_engine="simple")
 
-    with patch("content_core.extraction.extract_pdf_file", new_callable=AsyncMock) as mock_pdf, \
-         patch("content_core.content.identification.get_file_type", new_callable=AsyncMock) as mock_type, \
-         patch("content_core.extraction.logger") as mock_logger:
-        mock_type.return_value = "application/pdf"
+    detected_type("application/pdf")
+    with patch.object(extraction, "extract_pdf_file", new_callable=AsyncMock) as mock_pdf, \
+         patch.object(extraction, "logger") as mock_logger:
         mock_pdf.return_value = ExtractionOutput(content="text")
 
         await extract_content(file_path="/tmp/test.pdf", config=cfg)
@@ -329,15 +256,9 @@ async def test_docling_flags_warning_without_engine():
 # ---------------------------------------------------------------------------
 # 14. check_file_support pre-flight verdict
 # ---------------------------------------------------------------------------
-@pytest.mark.asyncio
-async def test_check_file_support_supported():
-    cfg = ContentCoreConfig(document_engine="simple")
-    with patch(
-        "content_core.content.identification.get_file_type",
-        new_callable=AsyncMock,
-        return_value="application/pdf",
-    ):
-        result = await check_file_support("/tmp/test.pdf", config=cfg)
+async def test_check_file_support_supported(simple_config, detected_type):
+    detected_type("application/pdf")
+    result = await check_file_support("/tmp/test.pdf", config=simple_config)
     assert isinstance(result, FileSupport)
     assert result.supported is True
     assert result.identified_type == "application/pdf"
@@ -347,63 +268,231 @@ async def test_check_file_support_supported():
     assert result.file_path == "/tmp/test.pdf"
 
 
-@pytest.mark.asyncio
-async def test_check_file_support_unsupported():
-    cfg = ContentCoreConfig(document_engine="simple")
-    with patch(
-        "content_core.content.identification.get_file_type",
-        new_callable=AsyncMock,
-        return_value="application/x-unknown-binary",
-    ):
-        result = await check_file_support("/tmp/test.bin", config=cfg)
+async def test_check_file_support_unsupported(simple_config, detected_type):
+    detected_type("application/x-unknown-binary")
+    result = await check_file_support("/tmp/test.bin", config=simple_config)
     assert result.supported is False
     assert result.processor is None
     assert result.reason is not None
     assert "application/x-unknown-binary" in result.reason
 
 
-@pytest.mark.asyncio
-async def test_check_file_support_unidentifiable_returns_verdict():
+async def test_check_file_support_unidentifiable_returns_verdict(simple_config, detected_type):
     """A file whose type can't be determined is a verdict, not a raised error."""
-    cfg = ContentCoreConfig(document_engine="simple")
-    with patch(
-        "content_core.content.identification.get_file_type",
-        new_callable=AsyncMock,
-        side_effect=UnsupportedTypeException("Unable to determine file type for: x"),
-    ):
-        result = await check_file_support("/tmp/mystery.xyz", config=cfg)
+    detected_type(UnsupportedTypeException("Unable to determine file type for: x"))
+    result = await check_file_support("/tmp/mystery.xyz", config=simple_config)
     assert result.supported is False
     assert result.processor is None
     assert result.identified_type == ""
     assert "determine file type" in result.reason
 
 
-@pytest.mark.asyncio
-async def test_check_file_support_does_not_extract():
+async def test_check_file_support_does_not_extract(simple_config, detected_type):
     """The pre-flight check must never invoke a real extractor."""
-    cfg = ContentCoreConfig(document_engine="simple")
-    with patch(
-        "content_core.content.identification.get_file_type",
-        new_callable=AsyncMock,
-        return_value="application/pdf",
-    ), patch(
-        "content_core.extraction.extract_pdf_file", new_callable=AsyncMock
+    detected_type("application/pdf")
+    with patch.object(
+        extraction, "extract_pdf_file", new_callable=AsyncMock
     ) as mock_pdf:
-        await check_file_support("/tmp/test.pdf", config=cfg)
+        await check_file_support("/tmp/test.pdf", config=simple_config)
         mock_pdf.assert_not_awaited()
 
 
-@pytest.mark.asyncio
-async def test_check_file_support_agrees_with_extraction():
+async def test_check_file_support_agrees_with_extraction(simple_config, detected_type):
     """The verdict must never disagree with what extract_content actually does."""
+    detected_type("application/x-unknown-binary")
+    verdict = await check_file_support("/tmp/test.bin", config=simple_config)
+    assert verdict.supported is False
+    # extraction of the same type raises, confirming the verdict
+    with pytest.raises(UnsupportedTypeException):
+        await extract_content(file_path="/tmp/test.bin", config=simple_config)
+
+
+# ---------------------------------------------------------------------------
+# 15. Remote downloads are streamed to the temp file
+# ---------------------------------------------------------------------------
+def _mock_download_session(chunks):
+    async def iter_chunked(size):
+        for chunk in chunks:
+            yield chunk
+
+    resp = MagicMock()
+    resp.raise_for_status = MagicMock()
+    resp.content.iter_chunked = iter_chunked
+    resp.__aenter__ = AsyncMock(return_value=resp)
+    resp.__aexit__ = AsyncMock(return_value=False)
+
+    session = MagicMock()
+    session.get = MagicMock(return_value=resp)
+    session.__aenter__ = AsyncMock(return_value=session)
+    session.__aexit__ = AsyncMock(return_value=False)
+    return patch.object(extraction.aiohttp, "ClientSession", return_value=session)
+
+
+async def test_download_streams_chunks_to_temp_file():
+    with _mock_download_session([b"%PDF-", b"1.7 ", b"body"]):
+        path = await _download_remote_file("https://example.com/files/doc.pdf")
+    try:
+        assert path.endswith(".pdf")
+        assert Path(path).read_bytes() == b"%PDF-1.7 body"
+    finally:
+        os.remove(path)
+
+
+async def test_download_failure_removes_temp_file():
+    created = []
+    real_mkstemp = tempfile.mkstemp
+
+    def tracking_mkstemp(*args, **kwargs):
+        fd, path = real_mkstemp(*args, **kwargs)
+        created.append(path)
+        return fd, path
+
+    with patch.object(
+        extraction, "_fetch_remote_file",
+        new_callable=AsyncMock,
+        side_effect=ValueError("bad response"),
+    ), patch.object(
+        extraction.tempfile, "mkstemp", side_effect=tracking_mkstemp
+    ), pytest.raises(ValueError):
+        await _download_remote_file("https://example.com/doc.pdf")
+    assert created and not os.path.exists(created[0])
+
+
+# ---------------------------------------------------------------------------
+# 16. Downloadable MIME types are resolved once at import
+# ---------------------------------------------------------------------------
+def test_downloadable_mime_types():
+    downloadable = extraction.DOWNLOADABLE_MIME_TYPES
+    assert isinstance(downloadable, frozenset)
+    assert "application/pdf" in downloadable
+    assert "application/epub+zip" in downloadable
+    assert "text/html" not in downloadable
+
+
+# ---------------------------------------------------------------------------
+# 17. MIME routing table lookups
+# ---------------------------------------------------------------------------
+@pytest.mark.parametrize(
+    "mime, route",
+    [
+        ("application/pdf", "pdf"),
+        ("video/x-matroska", "video"),
+        ("audio/x-wav", "audio"),
+        ("text/plain", "text"),
+        ("text/html", None),
+        ("image/png", None),
+        ("video", None),
+        ("", None),
+    ],
+)
+def test_route_for_mime_simple_engine(mime, route):
     cfg = ContentCoreConfig(document_engine="simple")
-    with patch(
-        "content_core.content.identification.get_file_type",
+    assert extraction._route_for_mime(mime, cfg) == route
+
+
+# ---------------------------------------------------------------------------
+# 18. Extraction cache for identical files
+# ---------------------------------------------------------------------------
+@pytest.fixture
+def text_files(tmp_path, monkeypatch, detected_type):
+    """Two text files with the same contents and one with different contents."""
+    monkeypatch.setattr(extraction, "_extraction_cache", extraction.OrderedDict())
+    detected_type("text/plain")
+    paths = []
+    for name, body in [("a.txt", "same"), ("b.txt", "same"), ("c.txt", "other")]:
+        path = tmp_path / name
+        path.write_text(body)
+        paths.append(str(path))
+    return paths
+
+
+async def test_extraction_cache_skips_processor_for_identical_files(text_files):
+    cfg = ContentCoreConfig(extraction_cache=True)
+    with patch.object(
+        extraction, "extract_text_file",
+        new_callable=AsyncMock,
+        side_effect=lambda path, cfg: _make_output(content="text"),
+    ) as mock:
+        first = await extract_content(file_path=text_files[0], config=cfg)
+        second = await extract_content(file_path=text_files[1], config=cfg)
+        await extract_content(file_path=text_files[2], config=cfg)
+    assert mock.await_count == 2
+    assert second.content == first.content
+    assert second is not first
+    # the title still comes from the file actually extracted
+    assert second.title == "b.txt"
+
+
+async def test_extraction_cache_disabled_by_default(text_files):
+    with patch.object(
+        extraction, "extract_text_file",
         new_callable=AsyncMock,
-        return_value="application/x-unknown-binary",
-    ):
-        verdict = await check_file_support("/tmp/test.bin", config=cfg)
-        assert verdict.supported is False
-        # extraction of the same type raises, confirming the verdict
-        with pytest.raises(UnsupportedTypeException):
-            await extract_content(file_path="/tmp/test.bin", config=cfg)
+        side_effect=lambda path, cfg: _make_output(content="text"),
+    ) as mock:
+        await extract_content(file_path=text_files[0])
+        await extract_content(file_path=text_files[1])
+    assert mock.await_count == 2
+    assert not extraction._extraction_cache
+
+
+# ---------------------------------------------------------------------------
+# 19. Auto engine skips docling for files over docling_max_file_mb
+# ---------------------------------------------------------------------------
+MB = 1024 * 1024
+
+
+@pytest.fixture
+def docling_installed(monkeypatch):
+    monkeypatch.setattr(extraction, "DOCLING_AVAILABLE", True)
+    monkeypatch.setattr(extraction, "extract_docling", AsyncMock())
+    monkeypatch.setattr(extraction, "load_docling", lambda: True)
+
+
+@pytest.mark.parametrize(
+    "engine, size, route",
+    [
+        ("auto", 5 * MB, "docling"),
+        ("auto", 20 * MB, "pdf"),
+        ("auto", None, "docling"),
+        ("docling", 20 * MB, "docling"),
+    ],
+)
+def test_docling_size_limit(docling_installed, engine, size, route):
+    cfg = ContentCoreConfig(document_engine=engine, docling_max_file_mb=10)
+    assert extraction._route_for_mime("application/pdf", cfg, size) == route
+
+
+async def test_auto_engine_falls_back_when_docling_fails_to_import(
+    docling_installed, detected_type, monkeypatch, tmp_path
+):
+    class BrokenTorch(ModuleType):
+        def __getattr__(self, name):
+            raise OSError("libtorch_cpu.so: cannot open shared object file")
+
+    monkeypatch.setitem(sys.modules, "docling.datamodel.base_models", BrokenTorch("docling"))
+    monkeypatch.setattr(docling_module, "DOCLING_AVAILABLE", True)
+    monkeypatch.setattr(docling_module, "DocumentConverter", None)
+    monkeypatch.setattr(extraction, "load_docling", docling_module.load_docling)
+    path = tmp_path / "doc.pdf"
+    path.write_bytes(b"%PDF-1.4")
+    detected_type("application/pdf")
+
+    verdict = await check_file_support(str(path))
+    assert verdict.processor == "pdf"
+    assert not extraction.DOCLING_AVAILABLE
+
+
+def test_docling_size_limit_keeps_docling_only_types(docling_installed):
+    cfg = ContentCoreConfig(document_engine="auto", docling_max_file_mb=10)
+    assert extraction._route_for_mime("image/png", cfg, 20 * MB) == "docling"
+
+
+async def test_check_file_support_applies_docling_size_limit(
+    docling_installed, detected_type, tmp_path
+):
+    path = tmp_path / "big.pdf"
+    path.write_bytes(b"x" * (MB + 1))
+    detected_type("application/pdf")
+    cfg = ContentCoreConfig(document_engine="auto", docling_max_file_mb=1)
+    verdict = await check_file_support(str(path), config=cfg)
+    assert verdict.processor == "pdf"
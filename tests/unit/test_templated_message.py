@@ -0,0 +1,44 @@
+"""Unit tests for content_core.templated_message."""
+
+from unittest.mock import AsyncMock, patch
+
+from content_core.templated_message import (
+    TemplatedMessageInput,
+    _get_prompter,
+    templated_message,
+)
+
+
+class TestGetPrompter:
+    def test_text_template_compiled_once(self):
+        text = "Summarize: {{ content }}"
+        assert _get_prompter(None, text) is _get_prompter(None, text)
+
+    def test_cached_prompter_renders_each_call_data(self):
+        prompter = _get_prompter(None, "Hello {{ name }}")
+        assert prompter.render(data={"name": "a"}) == "Hello a"
+        assert _get_prompter(None, "Hello {{ name }}").render(data={"name": "b"}) == "Hello b"
+
+
+class TestTemplatedMessage:
+    async def test_renders_system_and_user_prompts(self):
+        with patch(
+            "content_core.templated_message._execute_llm_call",
+            new_callable=AsyncMock,
+            return_value="done",
+        ) as mock_call:
+            result = await templated_message(
+                TemplatedMessageInput(
+                    system_prompt_text="System {{ topic }}",
+                    user_prompt_text="User {{ topic }}",
+                    data={"topic": "x"},
+                ),
+                model=object(),
+            )
+
+        assert result == "done"
+        msgs = mock_call.call_args.args[1]
+        assert msgs == [
+            {"role": "system", "content": "System x"},
+            {"role": "user", "content": "User x"},
+        ]
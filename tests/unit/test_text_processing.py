@@ -5,7 +5,13 @@ from unittest.mock import AsyncMock, patch
 import pytest
 
 from content_core.config import ContentCoreConfig
-from content_core.processors.text import detect_html, extract_text_file, process_text
+from content_core.processors import text as text_module
+from content_core.processors.text import (
+    detect_html,
+    extract_text_file,
+    html_to_markdown,
+    process_text,
+)
 
 
 @pytest.fixture
@@ -52,11 +58,82 @@ class TestDetectHtml:
     def test_single_tag_below_threshold(self):
         assert detect_html("Hello <br> world") is False
 
+    def test_uppercase_and_mixed_case_tags_detected(self):
+        assert detect_html("<H1>Title</H1><P>Body</P>") is True
+        assert detect_html("<Div>Section</Div><Br>") is True
+
+    def test_text_without_enough_angle_brackets_skips_regex(self):
+        with patch.object(text_module, "HTML_STRUCTURAL_TAGS") as mock_pattern:
+            assert detect_html("a < b, but no markup here") is False
+            mock_pattern.findall.assert_not_called()
+
     def test_multiple_structural_tags_detected(self):
         html = "<div>Section</div><p>Text</p><ul><li>Item</li></ul>"
         assert detect_html(html) is True
 
 
+class TestHtmlToMarkdown:
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        text_module._conversion_cache.clear()
+        yield
+        text_module._conversion_cache.clear()
+
+    @pytest.mark.parametrize(
+        "html,expected,forbidden",
+        [
+            pytest.param(
+                "<h1>Title</h1><ul><li>Item</li></ul>",
+                ["# Title", "- Item"],
+                [],
+                id="heading-and-list",
+            ),
+            pytest.param(
+                "<h1>Title</h1><p>This is <strong>bold</strong> text.</p>",
+                ["# Title", "**bold**"],
+                ["<h1>", "<p>", "<strong>"],
+                id="headings-and-emphasis",
+            ),
+            pytest.param(
+                "<ul><li>Item 1</li><li>Item 2</li><li>Item 3</li></ul>",
+                ["- Item 1", "- Item 2", "- Item 3"],
+                ["<ul>", "<li>"],
+                id="lists",
+            ),
+            pytest.param(
+                '<p>Visit <a href="https://example.com">our site</a> for more.</p>',
+                ["[our site](https://example.com)"],
+                ["<a "],
+                id="links",
+            ),
+        ],
+    )
+    def test_converts_html(self, html, expected, forbidden):
+        result = html_to_markdown(html)
+        for fragment in expected:
+            assert fragment in result
+        for fragment in forbidden:
+            assert fragment not in result
+
+    def test_repeated_content_is_converted_once(self):
+        html = "<h1>Title</h1><p>Body</p>"
+        with patch.object(
+            text_module.MARKDOWN_CONVERTER,
+            "convert",
+            wraps=text_module.MARKDOWN_CONVERTER.convert,
+        ) as mock_convert:
+            first = html_to_markdown(html)
+            second = html_to_markdown(html)
+        assert first == second
+        mock_convert.assert_called_once_with(html)
+
+    def test_cache_is_bounded(self, monkeypatch):
+        monkeypatch.setattr(text_module, "HTML_CONVERSION_CACHE_SIZE", 2)
+        for i in range(5):
+            html_to_markdown(f"<p>Paragraph {i}</p><p>More</p>")
+        assert len(text_module._conversion_cache) == 2
+
+
 class TestExtractTextFile:
     async def test_reads_file_content(self, config):
         file_content = "This is the file content."
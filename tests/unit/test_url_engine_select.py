@@ -1,25 +1,33 @@
 """Tests for URL engine selection logic in extract_from_url."""
 from __future__ import annotations
 
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from content_core.common import circuit_breaker
+from content_core.common.circuit_breaker import (
+    CIRCUIT_FAILURE_THRESHOLD,
+    CircuitBreaker,
+    engine_breaker,
+)
 from content_core.config import ContentCoreConfig
 from content_core.common.state import ExtractionOutput
-from content_core.processors.url import extract_from_url
+from content_core.processors.url import (
+    MIME_PROBE_RANGE,
+    _fetch_url_mime_type,
+    extract_from_url,
+)
 
 
 # ---------------------------------------------------------------------------
 # 1. auto with FIRECRAWL_API_KEY -> firecrawl
 # ---------------------------------------------------------------------------
-@pytest.mark.asyncio
-async def test_auto_with_firecrawl_key_uses_firecrawl():
+async def test_auto_with_firecrawl_key_uses_firecrawl(monkeypatch):
+    monkeypatch.setenv("FIRECRAWL_API_KEY", "test-key")
     cfg = ContentCoreConfig(url_engine="auto")
-    with patch.dict(
-        "os.environ", {"FIRECRAWL_API_KEY": "test-key"}, clear=False
-    ), patch(
-        "content_core.processors.url.extract_url_firecrawl",
+    with patch(
+        "content_core.processors.url._fetch_url_firecrawl",
         new_callable=AsyncMock,
         return_value={"title": "T", "content": "C"},
     ) as mock_fc:
@@ -33,12 +41,10 @@ async def test_auto_with_firecrawl_key_uses_firecrawl():
 # ---------------------------------------------------------------------------
 # 2. auto without FIRECRAWL_API_KEY -> tries jina (success)
 # ---------------------------------------------------------------------------
-@pytest.mark.asyncio
-async def test_auto_without_key_uses_jina():
+async def test_auto_without_key_uses_jina(monkeypatch):
+    monkeypatch.delenv("FIRECRAWL_API_KEY", raising=False)
     cfg = ContentCoreConfig(url_engine="auto")
-    with patch.dict(
-        "os.environ", {}, clear=False
-    ), patch(
+    with patch(
         "content_core.processors.url.extract_url_firecrawl",
         new_callable=AsyncMock,
     ) as mock_fc, patch(
@@ -46,74 +52,40 @@ async def test_auto_without_key_uses_jina():
         new_callable=AsyncMock,
         return_value={"title": "Jina Title", "content": "Jina Content"},
     ) as mock_jina:
-        # Remove FIRECRAWL_API_KEY if it exists
-        env_patch = {}
-        import os
-
-        if "FIRECRAWL_API_KEY" in os.environ:
-            env_patch["FIRECRAWL_API_KEY"] = ""
-        with patch.dict("os.environ", env_patch, clear=False):
-            # Ensure no FIRECRAWL_API_KEY
-            with patch.dict("os.environ", {}, clear=False):
-                os.environ.pop("FIRECRAWL_API_KEY", None)
-                result = await extract_from_url("https://example.com", cfg)
-                mock_jina.assert_awaited_once_with("https://example.com")
-                mock_fc.assert_not_awaited()
-                assert result.content == "Jina Content"
-
-
-# ---------------------------------------------------------------------------
-# 3. firecrawl engine -> uses firecrawl directly
-# ---------------------------------------------------------------------------
-@pytest.mark.asyncio
-async def test_firecrawl_engine():
-    cfg = ContentCoreConfig(url_engine="firecrawl")
-    with patch(
-        "content_core.processors.url.extract_url_firecrawl",
-        new_callable=AsyncMock,
-        return_value={"title": "FC", "content": "FC Content"},
-    ) as mock_fc:
         result = await extract_from_url("https://example.com", cfg)
-        mock_fc.assert_awaited_once_with("https://example.com", cfg)
-        assert result.content == "FC Content"
+        mock_jina.assert_awaited_once_with("https://example.com")
+        mock_fc.assert_not_awaited()
+        assert result.content == "Jina Content"
 
 
 # ---------------------------------------------------------------------------
-# 4. simple engine -> uses bs4 directly
+# 3-5. explicit engines -> use that engine directly
 # ---------------------------------------------------------------------------
-@pytest.mark.asyncio
-async def test_simple_engine():
-    cfg = ContentCoreConfig(url_engine="simple")
-    with patch(
-        "content_core.processors.url.extract_url_bs4",
-        new_callable=AsyncMock,
-        return_value={"title": "BS4", "content": "BS4 Content"},
-    ) as mock_bs4:
-        result = await extract_from_url("https://example.com", cfg)
-        mock_bs4.assert_awaited_once_with("https://example.com")
-        assert result.content == "BS4 Content"
+# engine, function it dispatches to, whether the config is passed along
+DIRECT_ENGINE_CASES = [
+    ("firecrawl", "extract_url_firecrawl", True),
+    ("simple", "extract_url_bs4", False),
+    ("jina", "extract_url_jina", False),
+]
 
 
-# ---------------------------------------------------------------------------
-# 5. jina engine -> uses jina directly
-# ---------------------------------------------------------------------------
-@pytest.mark.asyncio
-async def test_jina_engine():
-    cfg = ContentCoreConfig(url_engine="jina")
+@pytest.mark.parametrize("engine, target, passes_config", DIRECT_ENGINE_CASES)
+async def test_explicit_engine(engine, target, passes_config):
+    cfg = ContentCoreConfig(url_engine=engine)
     with patch(
-        "content_core.processors.url.extract_url_jina",
+        f"content_core.processors.url.{target}",
         new_callable=AsyncMock,
-        return_value={"title": "Jina", "content": "Jina Content"},
-    ) as mock_jina:
+        return_value={"title": engine, "content": f"{engine} content"},
+    ) as mock_engine:
         result = await extract_from_url("https://example.com", cfg)
-        mock_jina.assert_awaited_once_with("https://example.com")
-        assert result.content == "Jina Content"
+        expected_args = ("https://example.com", cfg) if passes_config else ("https://example.com",)
+        mock_engine.assert_awaited_once_with(*expected_args)
+        assert result.content == f"{engine} content"
 
 
 # ---------------------------------------------------------------------------
 # 6. firecrawl passes config (proxy + wait_for) through
 # ---------------------------------------------------------------------------
-@pytest.mark.asyncio
 async def test_firecrawl_receives_config_with_proxy_and_wait():
     cfg = ContentCoreConfig(
         url_engine="firecrawl",
@@ -135,8 +107,135 @@ async def test_firecrawl_receives_config_with_proxy_and_wait():
 # ---------------------------------------------------------------------------
 # 7. firecrawl default config has proxy=auto and wait_for=3000
 # ---------------------------------------------------------------------------
-@pytest.mark.asyncio
 async def test_firecrawl_default_proxy_and_wait():
     cfg = ContentCoreConfig(url_engine="firecrawl")
     assert cfg.firecrawl_proxy == "auto"
     assert cfg.firecrawl_wait_for == 3000
+
+
+# ---------------------------------------------------------------------------
+# 8. MIME detection uses a ranged GET and never reads the body
+# ---------------------------------------------------------------------------
+async def test_mime_probe_uses_ranged_get_without_reading_body():
+    response = MagicMock()
+    response.headers = {"content-type": "application/pdf; charset=binary"}
+    response.read = AsyncMock()
+
+    session = MagicMock()
+    session.get.return_value.__aenter__ = AsyncMock(return_value=response)
+    session.get.return_value.__aexit__ = AsyncMock(return_value=False)
+    session.head = MagicMock(side_effect=AssertionError("HEAD should not be used"))
+
+    client = MagicMock()
+    client.return_value.__aenter__ = AsyncMock(return_value=session)
+    client.return_value.__aexit__ = AsyncMock(return_value=False)
+
+    with patch("content_core.processors.url.aiohttp.ClientSession", client):
+        mime = await _fetch_url_mime_type("https://example.com/paper")
+
+    assert mime == "application/pdf"
+    assert session.get.call_args.kwargs["headers"] == {"Range": MIME_PROBE_RANGE}
+    response.read.assert_not_awaited()
+
+
+# ---------------------------------------------------------------------------
+# 9. auto skips an engine while its circuit breaker is open
+# ---------------------------------------------------------------------------
+async def test_auto_skips_jina_after_repeated_failures(monkeypatch):
+    monkeypatch.delenv("FIRECRAWL_API_KEY", raising=False)
+    cfg = ContentCoreConfig(url_engine="auto")
+    with patch(
+        "content_core.processors.url.extract_url_jina",
+        new_callable=AsyncMock,
+        side_effect=ConnectionError("jina down"),
+    ) as mock_jina, patch(
+        "content_core.processors.url.extract_url_crawl4ai",
+        new_callable=AsyncMock,
+        return_value={"title": "T", "content": "fallback"},
+    ):
+        for _ in range(CIRCUIT_FAILURE_THRESHOLD + 3):
+            result = await extract_from_url("https://example.com", cfg)
+            assert result.content == "fallback"
+    assert mock_jina.await_count == CIRCUIT_FAILURE_THRESHOLD
+
+
+@pytest.mark.parametrize(
+    "error",
+    [ValueError("unparseable page"), RuntimeError("403 Forbidden")],
+)
+async def test_url_specific_errors_leave_breakers_closed(monkeypatch, error):
+    monkeypatch.setenv("FIRECRAWL_API_KEY", "test-key")
+    cfg = ContentCoreConfig(url_engine="auto")
+    with patch(
+        "content_core.processors.url._fetch_url_firecrawl",
+        new_callable=AsyncMock,
+        side_effect=error,
+    ) as mock_fc, patch(
+        "content_core.processors.url.extract_url_jina",
+        new_callable=AsyncMock,
+        side_effect=error,
+    ) as mock_jina, patch(
+        "content_core.processors.url.extract_url_crawl4ai",
+        new_callable=AsyncMock,
+        return_value={"title": "T", "content": "fallback"},
+    ):
+        for _ in range(CIRCUIT_FAILURE_THRESHOLD + 3):
+            await extract_from_url("https://example.com", cfg)
+    assert mock_fc.await_count == mock_jina.await_count == CIRCUIT_FAILURE_THRESHOLD + 3
+    assert not engine_breaker("firecrawl").is_open
+    assert not engine_breaker("jina").is_open
+
+
+async def test_explicit_engine_ignores_open_breaker():
+    breaker = engine_breaker("jina")
+    for _ in range(CIRCUIT_FAILURE_THRESHOLD):
+        breaker.record_failure()
+    assert breaker.is_open
+    cfg = ContentCoreConfig(url_engine="jina")
+    with patch(
+        "content_core.processors.url.extract_url_jina",
+        new_callable=AsyncMock,
+        return_value={"title": "T", "content": "C"},
+    ) as mock_jina:
+        await extract_from_url("https://example.com", cfg)
+    mock_jina.assert_awaited_once()
+
+
+class TestCircuitBreaker:
+    def test_opens_after_threshold(self):
+        breaker = CircuitBreaker(failure_threshold=2, reset_seconds=60)
+        breaker.record_failure()
+        assert breaker.allow()
+        breaker.record_failure()
+        assert not breaker.allow()
+
+    def test_success_resets_failure_count(self):
+        breaker = CircuitBreaker(failure_threshold=2, reset_seconds=60)
+        breaker.record_failure()
+        breaker.record_success()
+        breaker.record_failure()
+        assert breaker.allow()
+
+    def test_half_open_allows_one_probe(self, monkeypatch):
+        now = [100.0]
+        monkeypatch.setattr(circuit_breaker.time, "monotonic", lambda: now[0])
+        breaker = CircuitBreaker(failure_threshold=1, reset_seconds=10)
+        breaker.record_failure()
+        assert not breaker.allow()
+        now[0] += 10
+        assert breaker.allow()  # the probe
+        assert not breaker.allow()  # others keep skipping meanwhile
+        breaker.record_success()
+        assert not breaker.is_open
+        assert breaker.allow()
+
+    def test_failed_probe_reopens(self, monkeypatch):
+        now = [100.0]
+        monkeypatch.setattr(circuit_breaker.time, "monotonic", lambda: now[0])
+        breaker = CircuitBreaker(failure_threshold=1, reset_seconds=10)
+        breaker.record_failure()
+        now[0] += 10
+        assert breaker.allow()
+        breaker.record_failure()
+        now[0] += 5
+        assert not breaker.allow()
@@ -1,54 +1,209 @@
 """Unit tests for content_core.processors.url.youtube."""
 
+import asyncio
+import ssl
+import threading
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import httpx
 import pytest
 
 from content_core.config import ContentCoreConfig
-from content_core.processors.url.youtube import _extract_youtube_id, extract_youtube
+from content_core.processors.url import youtube as youtube_module
+from content_core.processors.url.youtube import (
+    _extract_youtube_id,
+    _fetch_video_title,
+    _get_client,
+    _select_caption,
+    close_client,
+    extract_youtube,
+    is_youtube_url,
+)
+
+
+class TestIsYoutubeUrl:
+    @pytest.mark.parametrize(
+        "url",
+        [
+            "https://www.youtube.com/watch?v=dQw4w9WgXcQ",
+            "https://youtube.com/shorts/dQw4w9WgXcQ",
+            "https://m.youtube.com/watch?v=dQw4w9WgXcQ",
+            "https://music.youtube.com/watch?v=dQw4w9WgXcQ",
+            "https://youtu.be/dQw4w9WgXcQ",
+            "https://WWW.YouTube.com/watch?v=dQw4w9WgXcQ",
+        ],
+    )
+    def test_youtube_hosts(self, url):
+        assert is_youtube_url(url) is True
+
+    @pytest.mark.parametrize(
+        "url",
+        [
+            "https://example.com/watch?v=dQw4w9WgXcQ",
+            "https://notyoutube.com/watch?v=dQw4w9WgXcQ",
+            "https://youtube.com.evil.com/watch?v=dQw4w9WgXcQ",
+            "https://example.com/?ref=youtube.com",
+        ],
+    )
+    def test_non_youtube_hosts(self, url):
+        assert is_youtube_url(url) is False
+
+
+class TestSharedClient:
+    async def test_client_reused_within_loop(self):
+        try:
+            assert _get_client() is _get_client()
+        finally:
+            await close_client()
+
+    async def test_close_client_allows_new_client(self):
+        first = _get_client()
+        await close_client()
+        assert first.is_closed
+        second = _get_client()
+        try:
+            assert second is not first
+        finally:
+            await close_client()
+
+    def test_tls_verification_left_enabled(self):
+        assert ssl._create_default_https_context is ssl.create_default_context
+        assert youtube_module._ssl_context().verify_mode == ssl.CERT_REQUIRED
+        assert youtube_module._ssl_context() is youtube_module._ssl_context()
+
+    def test_each_event_loop_gets_its_own_client(self):
+        async def get():
+            client = _get_client()
+            await close_client()
+            return client
+
+        assert asyncio.run(get()) is not asyncio.run(get())
+
+    def test_clients_of_closed_loops_are_closed(self):
+        async def get():
+            return _get_client()
+
+        # a library caller that never calls close_client(); holding the loop
+        # stands in for the pooled connections that would keep it alive
+        loop = asyncio.new_event_loop()
+        client = loop.run_until_complete(get())
+        loop.close()
+        assert youtube_module._clients.get(loop) is client
+
+        asyncio.run(youtube_module._close_stale_clients())
+        assert client.is_closed
+        assert loop not in youtube_module._clients
+
+
+class TestFetchVideoTitle:
+    def _mock_page(self, *chunks, served=None):
+        async def body():
+            for chunk in chunks:
+                if served is not None:
+                    served.append(chunk)
+                yield chunk
+
+        client = httpx.AsyncClient(
+            transport=httpx.MockTransport(lambda request: httpx.Response(200, content=body()))
+        )
+        return patch(
+            "content_core.processors.url.youtube._get_client", return_value=client
+        )
+
+    async def test_reads_og_title(self):
+        page = (
+            b'<html><head><meta property="og:title" '
+            b'content="Tom &amp; Jerry \xe2\x80\x94 Episode 1"></head></html>'
+        )
+        with self._mock_page(page):
+            assert await _fetch_video_title("dQw4w9WgXcQ") == "Tom & Jerry \u2014 Episode 1"
+
+    async def test_tag_split_across_chunks(self):
+        with self._mock_page(b'<html><head><meta property="og:ti', b'tle" content="Split">'):
+            assert await _fetch_video_title("dQw4w9WgXcQ") == "Split"
+
+    async def test_stops_reading_after_title(self):
+        served = []
+        with self._mock_page(
+            b'<head><meta property="og:title" content="Early"></head>',
+            b"<body>" + b"x" * 100_000 + b"</body>",
+            served=served,
+        ):
+            assert await _fetch_video_title("dQw4w9WgXcQ") == "Early"
+        assert len(served) == 1
+
+    async def test_falls_back_to_parser_for_other_attribute_order(self):
+        page = b'<html><head><meta content="Reordered" property="og:title"></head></html>'
+        with self._mock_page(page, b"<body>never read</body>"):
+            assert await _fetch_video_title("dQw4w9WgXcQ") == "Reordered"
+
+
+class TestSelectCaption:
+    def test_manual_track_preferred_over_generated(self):
+        captions = {"a.en": "auto-en", "en": "manual-en"}
+        assert _select_caption(captions, ["en"]) == "manual-en"
+
+    def test_language_order_wins_over_track_kind(self):
+        captions = {"es": "manual-es", "a.en": "auto-en"}
+        assert _select_caption(captions, ["en", "es"]) == "auto-en"
+
+    def test_falls_back_to_first_track(self):
+        captions = {"fr": "manual-fr", "de": "manual-de"}
+        assert _select_caption(captions, ["en"]) == "manual-fr"
+
+    def test_no_tracks(self):
+        assert _select_caption({}, ["en"]) is None
 
 
 class TestExtractYoutubeId:
-    async def test_standard_watch_url(self):
-        result = await _extract_youtube_id(
+    def test_standard_watch_url(self):
+        result = _extract_youtube_id(
             "https://www.youtube.com/watch?v=dQw4w9WgXcQ"
         )
         assert result == "dQw4w9WgXcQ"
 
-    async def test_short_url(self):
-        result = await _extract_youtube_id("https://youtu.be/dQw4w9WgXcQ")
+    def test_short_url(self):
+        result = _extract_youtube_id("https://youtu.be/dQw4w9WgXcQ")
         assert result == "dQw4w9WgXcQ"
 
-    async def test_embed_url(self):
-        result = await _extract_youtube_id(
+    def test_embed_url(self):
+        result = _extract_youtube_id(
             "https://www.youtube.com/embed/dQw4w9WgXcQ"
         )
         assert result == "dQw4w9WgXcQ"
 
-    async def test_live_url(self):
-        result = await _extract_youtube_id(
+    def test_live_url(self):
+        result = _extract_youtube_id(
             "https://www.youtube.com/live/dQw4w9WgXcQ"
         )
         assert result == "dQw4w9WgXcQ"
 
-    async def test_shorts_url(self):
-        result = await _extract_youtube_id(
+    def test_shorts_url(self):
+        result = _extract_youtube_id(
             "https://www.youtube.com/shorts/dQw4w9WgXcQ"
         )
         assert result == "dQw4w9WgXcQ"
 
-    async def test_url_with_extra_params(self):
-        result = await _extract_youtube_id(
+    def test_url_with_extra_params(self):
+        result = _extract_youtube_id(
             "https://www.youtube.com/watch?v=dQw4w9WgXcQ&t=120"
         )
         assert result == "dQw4w9WgXcQ"
 
-    async def test_non_youtube_url_returns_none(self):
-        result = await _extract_youtube_id("https://example.com")
+    def test_non_youtube_url_returns_none(self):
+        result = _extract_youtube_id("https://example.com")
         assert result is None
 
 
 class TestExtractYoutube:
+    @pytest.fixture(autouse=True)
+    def clear_caches(self):
+        youtube_module._title_cache.clear()
+        youtube_module._transcript_cache.clear()
+        yield
+        youtube_module._title_cache.clear()
+        youtube_module._transcript_cache.clear()
+
     @pytest.fixture
     def config(self):
         return ContentCoreConfig(youtube_languages=["en", "es", "pt"])
@@ -73,14 +228,7 @@ class TestExtractYoutube:
                 new_callable=AsyncMock,
                 return_value="Test Video Title",
             ),
-            patch(
-                "content_core.processors.url.youtube.TextFormatter"
-            ) as mock_formatter_cls,
         ):
-            mock_formatter_cls.return_value.format_transcript.return_value = (
-                "Hello world"
-            )
-
             result = await extract_youtube(
                 "https://www.youtube.com/watch?v=dQw4w9WgXcQ", config
             )
@@ -90,6 +238,43 @@ class TestExtractYoutube:
             assert result.identified_type == "youtube"
             assert result.metadata["video_id"] == "dQw4w9WgXcQ"
 
+    async def test_transcript_lines_joined_like_text_formatter(self, config):
+        from youtube_transcript_api import FetchedTranscript, FetchedTranscriptSnippet
+        from youtube_transcript_api.formatters import TextFormatter
+
+        transcript = FetchedTranscript(
+            snippets=[
+                FetchedTranscriptSnippet(text="First line", start=0.0, duration=1.5),
+                FetchedTranscriptSnippet(text="Second line", start=1.5, duration=2.0),
+            ],
+            video_id="dQw4w9WgXcQ",
+            language="English",
+            language_code="en",
+            is_generated=False,
+        )
+
+        with (
+            patch(
+                "content_core.processors.url.youtube.get_best_transcript",
+                new_callable=AsyncMock,
+                return_value=transcript,
+            ),
+            patch(
+                "content_core.processors.url.youtube.get_video_title",
+                new_callable=AsyncMock,
+                return_value="",
+            ),
+        ):
+            result = await extract_youtube(
+                "https://www.youtube.com/watch?v=dQw4w9WgXcQ", config
+            )
+        assert result.content == TextFormatter().format_transcript(transcript)
+        assert result.metadata["transcript"][1] == {
+            "text": "Second line",
+            "start": 1.5,
+            "duration": 2.0,
+        }
+
     async def test_transcript_failure_with_pytubefix_fallback(self, config):
         with (
             patch(
@@ -161,3 +346,182 @@ class TestExtractYoutube:
             mock_pytubefix.assert_called_once_with(
                 "https://www.youtube.com/watch?v=dQw4w9WgXcQ", ["fr", "de"]
             )
+
+    async def test_title_and_transcript_fetched_concurrently(self, config):
+        started = []
+        both_started = asyncio.Event()
+
+        async def fetch(name, value):
+            started.append(name)
+            if len(started) == 2:
+                both_started.set()
+            await asyncio.wait_for(both_started.wait(), timeout=1)
+            return value
+
+        async def get_title(video_id):
+            return await fetch("title", "Concurrent")
+
+        async def get_transcript(video_id, langs):
+            return await fetch("transcript", None)
+
+        with (
+            patch("content_core.processors.url.youtube.get_video_title", new=get_title),
+            patch(
+                "content_core.processors.url.youtube.get_best_transcript",
+                new=get_transcript,
+            ),
+            patch(
+                "content_core.processors.url.youtube.extract_transcript_pytubefix",
+                return_value=(None, None),
+            ),
+        ):
+            result = await extract_youtube(
+                "https://www.youtube.com/watch?v=dQw4w9WgXcQ", config
+            )
+        assert result.title == "Concurrent"
+        assert sorted(started) == ["title", "transcript"]
+
+    async def test_pytubefix_fallback_runs_off_the_event_loop(self, config):
+        threads = []
+
+        def fake_pytubefix(url, languages):
+            threads.append(threading.current_thread())
+            return "Threaded transcript", "raw srt"
+
+        with (
+            patch(
+                "content_core.processors.url.youtube.get_video_title",
+                new_callable=AsyncMock,
+                return_value="",
+            ),
+            patch(
+                "content_core.processors.url.youtube.get_best_transcript",
+                new_callable=AsyncMock,
+                return_value=None,
+            ),
+            patch(
+                "content_core.processors.url.youtube.extract_transcript_pytubefix",
+                side_effect=fake_pytubefix,
+            ),
+        ):
+            result = await extract_youtube(
+                "https://www.youtube.com/watch?v=dQw4w9WgXcQ", config
+            )
+        assert result.content == "Threaded transcript"
+        assert threads and threads[0] is not threading.main_thread()
+
+    async def test_title_exception_does_not_abort_extraction(self, config):
+        with (
+            patch(
+                "content_core.processors.url.youtube.get_video_title",
+                new_callable=AsyncMock,
+                side_effect=RuntimeError("boom"),
+            ),
+            patch(
+                "content_core.processors.url.youtube.get_best_transcript",
+                new_callable=AsyncMock,
+                return_value=None,
+            ),
+            patch(
+                "content_core.processors.url.youtube.extract_transcript_pytubefix",
+                return_value=("Transcript", "raw srt"),
+            ),
+        ):
+            result = await extract_youtube(
+                "https://www.youtube.com/watch?v=dQw4w9WgXcQ", config
+            )
+        assert result.title == ""
+        assert result.content == "Transcript"
+
+
+class TestYoutubeCache:
+    URL = "https://www.youtube.com/watch?v=dQw4w9WgXcQ"
+
+    @pytest.fixture(autouse=True)
+    def clear_caches(self):
+        youtube_module._title_cache.clear()
+        youtube_module._transcript_cache.clear()
+        yield
+        youtube_module._title_cache.clear()
+        youtube_module._transcript_cache.clear()
+
+    def _mock_fetches(self):
+        return (
+            patch(
+                "content_core.processors.url.youtube.get_video_title",
+                new_callable=AsyncMock,
+                return_value="Cached Title",
+            ),
+            patch(
+                "content_core.processors.url.youtube.get_best_transcript",
+                new_callable=AsyncMock,
+                return_value=None,
+            ),
+            patch(
+                "content_core.processors.url.youtube.extract_transcript_pytubefix",
+                return_value=("Cached transcript", "raw srt"),
+            ),
+        )
+
+    async def test_repeat_extraction_uses_cache(self):
+        config = ContentCoreConfig(youtube_languages=["en"])
+        title_patch, transcript_patch, pytubefix_patch = self._mock_fetches()
+        with title_patch as mock_title, transcript_patch, pytubefix_patch as mock_pytubefix:
+            first = await extract_youtube(self.URL, config)
+            second = await extract_youtube(self.URL, config)
+
+        assert mock_title.call_count == 1
+        assert mock_pytubefix.call_count == 1
+        assert second.title == first.title == "Cached Title"
+        assert second.content == first.content == "Cached transcript"
+
+    async def test_languages_are_part_of_transcript_key(self):
+        title_patch, transcript_patch, pytubefix_patch = self._mock_fetches()
+        with title_patch as mock_title, transcript_patch, pytubefix_patch as mock_pytubefix:
+            await extract_youtube(self.URL, ContentCoreConfig(youtube_languages=["en"]))
+            await extract_youtube(self.URL, ContentCoreConfig(youtube_languages=["pt"]))
+
+        assert mock_title.call_count == 1
+        assert mock_pytubefix.call_count == 2
+
+    async def test_cache_disabled(self):
+        config = ContentCoreConfig(youtube_languages=["en"], youtube_cache=False)
+        title_patch, transcript_patch, pytubefix_patch = self._mock_fetches()
+        with title_patch as mock_title, transcript_patch, pytubefix_patch as mock_pytubefix:
+            await extract_youtube(self.URL, config)
+            await extract_youtube(self.URL, config)
+
+        assert mock_title.call_count == 2
+        assert mock_pytubefix.call_count == 2
+        assert not youtube_module._title_cache
+        assert not youtube_module._transcript_cache
+
+    async def test_failures_are_not_cached(self):
+        config = ContentCoreConfig(youtube_languages=["en"])
+        title_patch, transcript_patch, _ = self._mock_fetches()
+        with title_patch, transcript_patch, patch(
+            "content_core.processors.url.youtube.extract_transcript_pytubefix",
+            return_value=(None, None),
+        ) as mock_pytubefix:
+            await extract_youtube(self.URL, config)
+            await extract_youtube(self.URL, config)
+
+        assert mock_pytubefix.call_count == 2
+
+    async def test_cached_transcript_is_not_shared(self):
+        config = ContentCoreConfig(youtube_languages=["en"])
+        title_patch, transcript_patch, pytubefix_patch = self._mock_fetches()
+        with title_patch, transcript_patch, pytubefix_patch as mock_pytubefix:
+            mock_pytubefix.return_value = (
+                "Cached transcript",
+                [{"text": "hi", "start": 0.0, "duration": 1.0}],
+            )
+            first = await extract_youtube(self.URL, config)
+            first.metadata["transcript"][0]["text"] = "changed"
+            first.metadata["transcript"].clear()
+            second = await extract_youtube(self.URL, config)
+
+        assert mock_pytubefix.call_count == 1
+        assert second.metadata["transcript"] == [
+            {"text": "hi", "start": 0.0, "duration": 1.0}
+        ]